@@ -31,6 +31,7 @@ Classes:
 
 
 import re
+import sys
 from decimal import Decimal, DecimalException, InvalidOperation
 from typing import Optional, List, Tuple, Any
 
@@ -39,8 +40,9 @@ from lark import Tree
 from lark.visitors import Interpreter, visit_children_decor
 
 from .evaluator import Evaluator
+from .function_handler import FunctionHandler, parse_formula
 from .cell_error import CellError, CellErrorType, CELL_ERRORS
-from .utils import get_loc_from_coords, get_coords_from_loc
+from .utils import get_loc_from_coords, get_coords_from_loc, get_source_cells
 
 
 RESTRICTED_VALUES = [
@@ -93,7 +95,27 @@ class _CellTreeInterpreter(Interpreter):
         else:
             cell_sheet = self.sheet
             cell = str(tree_split[-1]).replace('$','')
-        self.children.add((cell_sheet, cell.upper()))
+        # interned so every (sheet, location) graph key for a cell shares
+        # one string and dict probes compare by identity
+        self.children.add((cell_sheet, sys.intern(cell.upper())))
+
+    def cell_range_expr(self, tree: Tree) -> None:
+        '''
+        Get every cell of a cell range from a Tree object
+
+        Arguments:
+        - tree: Tree - tree containing the corners of the range
+
+        '''
+
+        start_loc, end_loc = [str(loc).replace('$', '') for loc in tree.children]
+        try:
+            cells = get_source_cells(start_loc, end_loc)
+        except ValueError:
+            # the evaluator reports the invalid range when it is evaluated
+            return
+        for cell in cells:
+            self.children.add((self.sheet, sys.intern(cell)))
 
     def func_expr(self, tree: Tree) -> None:
         '''
@@ -127,6 +149,8 @@ class _CellTreeInterpreter(Interpreter):
 
         if_statement = tree.children[-1].children[0]
         if_branches = tree.children[-1].children[-1]
+        # the condition is always evaluated, so its cells are always children
+        self.visit(if_statement)
         if self.evaluator.transform(if_statement).children[0]:
             if if_branches.data == "args_expr":
                 if_branches = if_branches.children[0]
@@ -156,6 +180,8 @@ class _CellTreeInterpreter(Interpreter):
         '''
 
         curr = tree.children[-1]
+        # the index is always evaluated, so its cells are always children
+        self.visit(curr.children[0] if curr.data == "args_expr" else curr)
         idx = self.evaluator.transform(curr.children[0]).children[0]
         if isinstance(idx, CellError):
             return
@@ -181,7 +207,7 @@ class _CellTreeInterpreter(Interpreter):
         ref = tree.children[-1]
         if ref.data == "string":
             try:
-                ref = Cell.PARSER.parse(f'={ref.children[-1][1:-1]}')
+                ref = parse_formula(f'={ref.children[-1][1:-1]}')
                 if ref.data != 'cell':
                     return
             except lark.exceptions.LarkError:
@@ -199,8 +225,12 @@ class Cell:
 
     '''
 
-    PARSER = lark.Lark.open('formulas.lark', start='formula',
-                rel_to=__file__, parser='lalr')
+    # one Cell exists per non-empty location, so drop the per-instance dict
+    __slots__ = ('_loc', '_contents', '_value', '_children', '_evaluator')
+
+    # share the parser the function handler already built, rather than
+    # loading the grammar and building the LALR tables a second time
+    PARSER = FunctionHandler.PARSER
 
     def __init__(self, loc: str, evaluator: Evaluator):
         '''
@@ -212,7 +242,7 @@ class Cell:
 
         '''
 
-        self._loc = loc
+        self._loc = sys.intern(loc.upper())
 
         # new Cell is treated as an empty cell, contents and values are None
         self._contents = None
@@ -225,7 +255,7 @@ class Cell:
         Get the location of the cell
 
         Returns:
-        - string location of the cell
+        - uppercase string location of the cell
 
         '''
 
@@ -300,12 +330,15 @@ class Cell:
             # Check if there is a leading equal sign, set to FORMULA type
             # and evaluate
             elif inp[0] == "=":
-                parser, evaluator = self.get_parser_and_evaluator()
-                tree = parser.parse(inp)
+                evaluator = self._evaluator
+                # parse_formula caches trees, so recalculating an unchanged
+                # formula does not parse it again
+                tree = parse_formula(inp)
                 visitor = _CellTreeInterpreter(str(evaluator.get_working_sheet()), evaluator)
-                visitor.visit(tree)
-                self._children = list(visitor.children)
-                evaluator = evaluator.transform(tree).children[0]
+                with evaluator.memoize():
+                    visitor.visit(tree)
+                    self._children = list(visitor.children)
+                    evaluator = evaluator.transform(tree).children[0]
                 # Handle when referencing an empty cell only
                 evaluator = Decimal('0') if evaluator is None else evaluator
                 if isinstance(evaluator, CellError) and \
@@ -16,6 +16,7 @@ Classes:
     Methods:
     - get_working_sheet(object) -> str
     - set_working_sheet(object, str) -> None
+    - memoize(object) -> Iterator[None]
     - NUMBER(object, Token) -> Decimal
     - STRING(object, Token) -> str
     - BOOL(object, Token) -> bool
@@ -33,16 +34,18 @@ Classes:
 '''
 
 
-import re
+from contextlib import contextmanager
+from functools import lru_cache
 from decimal import Decimal, DecimalException, InvalidOperation
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from lark import Tree, Transformer, Token, exceptions
+from lark.exceptions import GrammarError, VisitError
 
 from .cell_error import CellError, CellErrorType, CELL_ERRORS
 from .function_handler import FunctionHandler
 from .utils import convert_to_bool, compare_values, get_tl_br_corners,\
-    get_source_cells
+    get_source_cells, get_loc_from_coords, CELL_LOCATION
 
 
 class Evaluator(Transformer):
@@ -65,6 +68,8 @@ class Evaluator(Transformer):
         self.workbook = workbook
         self.function_handler = FunctionHandler()
         self._working_sheet = sheet_name
+        self._memo: Optional[Dict[int, Tuple[Tree, Tree]]] = None
+        self._handlers: Dict[str, Optional[Callable]] = {}
 
     ########################################################################
     # Getters and Setters
@@ -92,6 +97,126 @@ class Evaluator(Transformer):
 
         self._working_sheet = sheet_name
 
+    @contextmanager
+    def memoize(self) -> Iterator[None]:
+        '''
+        Reuse the result of every subtree transformed inside this block
+
+        A cell evaluates the condition of IF, IFERROR and CHOOSE once to find
+        its children and then again as part of the whole formula.  Cell values
+        cannot change while a single cell is evaluated, so within this block
+        each parsed subtree is only transformed once.
+
+        '''
+
+        self._memo = {}
+        try:
+            yield
+        finally:
+            self._memo = None
+
+    def _transform_tree(self, tree: Tree) -> Tree:
+        '''
+        Transform a subtree, reusing its result while memoizing
+
+        Arguments:
+        - tree: Tree - parsed subtree to be transformed
+
+        Returns:
+        - Tree containing result value
+
+        '''
+
+        if self._memo is None:
+            return Transformer._transform_tree(self, tree)
+        # keep the source tree alive next to the result so its id cannot be
+        # reused by another tree (e.g. one parsed by INDIRECT) in this block
+        seen = self._memo.get(id(tree))
+        if seen is not None and seen[0] is tree:
+            return seen[1]
+        result = Transformer._transform_tree(self, tree)
+        self._memo[id(tree)] = (tree, result)
+        return result
+
+    def __get_handler(self, name: str) -> Optional[Callable]:
+        '''
+        Get the method handling a rule or token name, looked up only once
+
+        Lark looks the handler up with getattr on every node, and for names
+        without a handler (number, string, CELLREF, ...) that lookup raises
+        and catches an AttributeError each time.
+
+        Arguments:
+        - name: str - rule or token name
+
+        Returns:
+        - bound handler method, or None if the default handling applies
+
+        '''
+
+        try:
+            return self._handlers[name]
+        except KeyError:
+            handler = self._handlers[name] = getattr(self, name, None)
+            return handler
+
+    # pylint: disable=broad-exception-caught
+
+    # These mirror Lark's own dispatch, which wraps any exception raised by a
+    # handler in a VisitError, so every exception type has to be caught
+
+    def _call_userfunc(self, tree: Tree, new_children: Optional[List] = None) -> Tree:
+        '''
+        Call the handler for a rule with its transformed children
+
+        Arguments:
+        - tree: Tree - rule being transformed
+        - new_children: Optional[List] - already transformed children
+
+        Returns:
+        - result of the handler, or a copy of the Tree if there is none
+
+        '''
+
+        children = new_children if new_children is not None else tree.children
+        handler = self.__get_handler(tree.data)
+        if handler is None:
+            return self.__default__(tree.data, children, tree.meta)
+        try:
+            # handlers decorated with lark's v_args take the whole node
+            wrapper = getattr(handler, 'visit_wrapper', None)
+            if wrapper is not None:
+                return wrapper(handler, tree.data, children, tree.meta)
+            return handler(children)
+        except GrammarError:
+            raise
+        except Exception as e:
+            raise VisitError(tree.data, tree, e) from e
+
+    def _call_userfunc_token(self, token: Token) -> Token:
+        '''
+        Call the handler for a token
+
+        Arguments:
+        - token: Token - token being transformed
+
+        Returns:
+        - result of the handler, or the token itself if there is none
+
+        '''
+
+        handler = self.__get_handler(token.type)
+        if handler is None:
+            return self.__default_token__(token)
+        try:
+            return handler(token)
+        except GrammarError:
+            raise
+        except Exception as e:
+            raise VisitError(token.type, token, e) from e
+
+    # pylint: enable=broad-exception-caught
+
     ########################################################################
     # Bases
     ########################################################################
@@ -115,7 +240,7 @@ class Evaluator(Transformer):
 
         '''
 
-        return self.__normalize_number(Decimal(token))
+        return self.__parse_number(str(token))
 
     def STRING(self, token: Token) -> str:
         '''
@@ -371,10 +496,11 @@ class Evaluator(Transformer):
                 cell_name = args_split[-1].replace('$', '')
 
             # Check that cell location is within bounds
-            if not re.match(r"^[A-Z]{1,4}[1-9][0-9]{0,3}$", cell_name.upper()):
+            cell_name = cell_name.upper()
+            if not CELL_LOCATION.match(cell_name):
                 raise KeyError('Cell location out of bounds')
 
-            result = self.workbook.get_cell_value(working_sheet, cell_name.upper())
+            result = self.workbook.get_cell_value(working_sheet, cell_name)
 
             # Check for propogating errors
             if isinstance(result, CellError):
@@ -405,7 +531,7 @@ class Evaluator(Transformer):
         '''
 
         try:
-            func_name = args[0][:-1].replace(' ', '').lower()
+            func_name = self.__parse_func_name(str(args[0]))
             args_list = args[-1].children
             if len(args_list) == 1:
                 args_list = [args[-1]]
@@ -451,11 +577,20 @@ class Evaluator(Transformer):
         start_loc = args[0]
         end_loc = args[-1]
         tl_br = get_tl_br_corners(start_loc, end_loc)
-        res = {}
-        source_cells = get_source_cells(start_loc, end_loc)
-        for cell in source_cells:
-            res[cell] = self.workbook.get_cell_value(
-                self.get_working_sheet(), cell)
+        (top_left_col, top_left_row), (bottom_right_col, bottom_right_row) = tl_br
+        sheet_name = self.get_working_sheet()
+
+        # every cell in the range gets an entry, but only the part inside the
+        # sheet's used extent can hold a value, so only that part is read
+        res = dict.fromkeys(get_source_cells(start_loc, end_loc))
+        ext_col, ext_row = self.workbook.get_sheet_extent(sheet_name)
+        if top_left_col <= ext_col and top_left_row <= ext_row:
+            used_cells = get_source_cells(
+                get_loc_from_coords((top_left_col, top_left_row)),
+                get_loc_from_coords((min(bottom_right_col, ext_col),
+                                     min(bottom_right_row, ext_row))))
+            for cell in used_cells:
+                res[cell] = self.workbook.get_cell_value(sheet_name, cell)
 
         return Tree('cell_range', [{'tl_br_corners': tl_br, 'cells': res}])
 
@@ -556,7 +691,47 @@ class Evaluator(Transformer):
     # Helper Functions
     ########################################################################
 
-    def __normalize_number(self, num: Decimal) -> Decimal:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __parse_number(literal: str) -> Decimal:
+        '''
+        Convert a number literal into a normalized Decimal
+
+        The same literals (0, 1, ...) recur across formulas and every
+        recalculation evaluates them again, so the result for each literal is
+        cached.  Decimals are immutable, so sharing them is safe.
+
+        Arguments:
+        - literal: str - the number as written in the formula
+
+        Returns:
+        - normalized Decimal
+
+        '''
+
+        return Evaluator.__normalize_number(Decimal(literal))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def __parse_func_name(func_token: str) -> str:
+        '''
+        Convert a FUNC_NAME token such as 'And (' into a function name
+
+        Only a handful of distinct spellings appear across formulas, so the
+        names are cached rather than sliced and lowercased on every call.
+
+        Arguments:
+        - func_token: str - function name token, including its open bracket
+
+        Returns:
+        - lowercase function name without spaces or the open bracket
+
+        '''
+
+        return func_token[:-1].replace(' ', '').lower()
+
+    @staticmethod
+    def __normalize_number(num: Decimal) -> Decimal:
         '''
         Normalize a Decimal object such that we remove all leading and 
         trailing zeros, while not simplifying using exponent notation
@@ -11,8 +11,12 @@ Classes:
     Methods:
     - map_func(object, str) -> Callable
 
+Methods:
+- parse_formula(str) -> Tree
+
 '''
 
+from functools import lru_cache
 from typing import Callable, List, Tuple, Optional
 from decimal import Decimal, InvalidOperation
 
@@ -34,8 +38,18 @@ class FunctionHandler:
 
     '''
 
+    # cache=True stores the LALR tables in the temp directory, keyed on the
+    # grammar and options, so later imports load them instead of rebuilding.
+    # Trees carry no source positions and the grammar has no [optional]
+    # items, so position tracking and placeholders are explicitly left off.
+    #
+    # This is the only parser in the package (Cell and the tests share it).
+    # lark_cython's plugins are deliberately not used: its tokens are not str
+    # objects, while the Evaluator and FunctionHandler compare and slice
+    # tokens as strings
     PARSER = Lark.open('formulas.lark', start='formula',
-                rel_to=__file__, parser='lalr')
+                rel_to=__file__, parser='lalr', cache=True,
+                propagate_positions=False, maybe_placeholders=False)
 
     def __init__(self):
         '''
@@ -90,18 +104,11 @@ class FunctionHandler:
 
         '''
 
-        if len(args) < 1:
-            raise TypeError('Invalid number of arguments')
-
-        bool_result = True
-        for expression in args:
-            arg = expression.children[0]
-            if isinstance(arg, CellError):
-                return Tree('cell_error', [arg])
-            res = convert_to_bool(arg, type(arg)) if arg is not None else False
-            bool_result = bool_result and res
+        error, values = self.__populate_bool_values(args, empty_as_false=True)
+        if error is not None:
+            return Tree('cell_error', [error])
 
-        return Tree('bool', [bool_result])
+        return Tree('bool', [all(values)])
 
     def __or(self, args: List) -> Tree:
         '''
@@ -115,18 +122,11 @@ class FunctionHandler:
 
         '''
 
-        if len(args) < 1:
-            raise TypeError('Invalid number of arguments')
-
-        bool_result = False
-        for expression in args:
-            arg = expression.children[0]
-            if isinstance(arg, CellError):
-                return Tree('cell_error', [arg])
-            res = convert_to_bool(arg, type(arg))
-            bool_result = bool_result or res
+        error, values = self.__populate_bool_values(args)
+        if error is not None:
+            return Tree('cell_error', [error])
 
-        return Tree('bool', [bool_result])
+        return Tree('bool', [any(values)])
 
     def __not(self, args: List) -> Tree:
         '''
@@ -163,19 +163,12 @@ class FunctionHandler:
 
         '''
 
-        if len(args) < 1:
-            raise TypeError('Invalid number of arguments')
-
-        bool_result = False
-        for expression in args:
-            arg = expression.children[0]
-            if isinstance(arg, CellError):
-                return Tree('cell_error', [arg])
-            res = convert_to_bool(arg, type(arg))
-            # only flips when res true, will be true on odd number of true args
-            bool_result = bool_result != res
+        error, values = self.__populate_bool_values(args)
+        if error is not None:
+            return Tree('cell_error', [error])
 
-        return Tree('bool', [bool_result])
+        # true on an odd number of true arguments
+        return Tree('bool', [sum(values) % 2 == 1])
 
     def __exact(self, args: List) -> Tree:
         '''
@@ -386,7 +379,7 @@ class FunctionHandler:
             return args[0]
 
         try:
-            tree = self.PARSER.parse(f'={str(args[0].children[-1])}')
+            tree = parse_formula(f'={str(args[0].children[-1])}')
             if tree.data != 'cell':
                 raise lark.exceptions.LarkError
             return tree, 'Y'
@@ -483,8 +476,11 @@ class FunctionHandler:
         ran = args[1].children[-1]['cells']
         index = args[-1].children[-1]
 
-        if index < 1:
+        # cell coordinates are ints, and get_col_name cannot name a Decimal
+        # column, so only whole indexes are accepted and they are converted
+        if index < 1 or index % 1 != 0:
             raise TypeError(f'invalid index given: {index}')
+        index = int(index)
         curr_col, curr_row = tl_br_corners[0]
         max_col, max_row = tl_br_corners[-1]
 
@@ -516,8 +512,11 @@ class FunctionHandler:
         ran = args[1].children[-1]['cells']
         index = args[-1].children[-1]
 
-        if index < 1:
+        # cell coordinates are ints, and get_col_name cannot name a Decimal
+        # column, so only whole indexes are accepted and they are converted
+        if index < 1 or index % 1 != 0:
             raise TypeError(f'invalid index given: {index}')
+        index = int(index)
         curr_col, curr_row = tl_br_corners[0]
         max_col, max_row = tl_br_corners[-1]
 
@@ -537,6 +536,44 @@ class FunctionHandler:
     # Helper Functions
     ########################################################################
 
+    def __populate_bool_values(self, args: List, empty_as_false: bool = False
+            ) -> Tuple[Optional[CellError], List[bool]]:
+        '''
+        Convert the arguments of a boolean function to booleans, in order
+
+        Throw a TypeError if there are no arguments or an argument cannot be
+        converted.  Arguments arrive already evaluated, and a later error or
+        unconvertible argument must still win over an earlier deciding value,
+        e.g. AND(FALSE, #REF!) is #REF!, so every argument is checked rather
+        than stopping early.  The caller then reduces the values with a
+        builtin (all, any, sum).
+
+        Arguments:
+        - args: List - list of arguments for a given boolean function
+        - empty_as_false: bool (default False) - whether an empty cell counts
+            as FALSE rather than being a type error
+
+        Returns:
+        - Tuple of the first CellError argument (or None) and the converted
+            values of the arguments before it
+
+        '''
+
+        if len(args) < 1:
+            raise TypeError('Invalid number of arguments')
+
+        values = []
+        for expression in args:
+            arg = expression.children[0]
+            if isinstance(arg, CellError):
+                return arg, values
+            if arg is None and empty_as_false:
+                values.append(False)
+            else:
+                values.append(convert_to_bool(arg, type(arg)))
+
+        return None, values
+
     def __populate_all_range_values(self, args: List) -> List:
         '''
         Populate a list of all values in a range of cells
@@ -567,3 +604,22 @@ class FunctionHandler:
                 raise TypeError(f'Cannot convert argument {arg} to Decimal') \
                     from e
         return all_values
+
+
+# the same formula text is set again on every recalculation and is often
+# shared between cells (e.g. '=A1'), and the evaluator never modifies the
+# trees it is given, so one tree per formula is shared
+@lru_cache(maxsize=4096)
+def parse_formula(formula: str) -> Tree:
+    '''
+    Parse a formula, reusing the tree from an earlier parse of the same text
+
+    Arguments:
+    - formula: str - formula text, including the leading '='
+
+    Returns:
+    - parse Tree of the formula
+
+    '''
+
+    return FunctionHandler.PARSER.parse(formula)
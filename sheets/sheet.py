@@ -19,15 +19,21 @@ Classes:
     - get_cell_contents(object, str) -> Optional[str]
     - set_cell_contents(object, str, Optional[str]) -> None
     - get_cell_value(object, str) -> Any
+    - get_cell_contents_and_value(object, str) -> Tuple[Optional[str], Any]
     - get_cell_adjacency_list(object) -> Dict[Tuple[str, str],
         List[Tuple[str, str]]]
     - save_sheet(object) -> Dict[str, str]
     - get_target_cells(object, str, str, str, List[str]) -> Dict[str, str]
+    - iter_target_cells(object, str, str, str, List[str]) ->
+        Iterator[Tuple[str, Optional[str]]]
+    - get_cell_coords_in_area(object, Tuple[int, int], Tuple[int, int]) ->
+        List[Tuple[int, int]]
 
 '''
 
 
-from typing import Dict, List, Tuple, Optional, Any
+from itertools import product
+from typing import Dict, List, Tuple, Optional, Any, Iterator
 
 from .cell import Cell
 from .evaluator import Evaluator
@@ -40,6 +46,8 @@ class Sheet:
 
     '''
 
+    __slots__ = ('_name', '_cells', '_evaluator', '_extent', '_extent_dirty')
+
     def __init__(self, sheet_name, evaluator):
         '''
         Initialize a new spreadsheet
@@ -54,6 +62,11 @@ class Sheet:
         self._cells: Dict[Tuple[int, int], Cell] = {}
         self._evaluator = evaluator
 
+        # (max col, max row) of the cells, grown as cells are set and only
+        # rescanned after a cell on the boundary is emptied
+        self._extent = (0, 0)
+        self._extent_dirty = False
+
     ########################################################################
     # Getters and Setters
     ########################################################################
@@ -116,14 +129,16 @@ class Sheet:
 
         '''
 
-        cells = self.get_all_cells()
-        if len(cells.keys()) == 0:
-            return (0, 0) # empty sheet
+        if self._extent_dirty:
+            cells = self.get_all_cells()
+            if len(cells) == 0:
+                self._extent = (0, 0) # empty sheet
+            else:
+                self._extent = (max(col for col, _ in cells),
+                                max(row for _, row in cells))
+            self._extent_dirty = False
 
-        coords = list(cells.keys())
-        cols = [coord[0] for coord in coords]
-        rows = [coord[1] for coord in coords]
-        return max(cols), max(rows)
+        return self._extent
 
     def get_cell(self, location: str) -> Optional[Cell]:
         '''
@@ -175,15 +190,24 @@ class Sheet:
 
         cells = self.get_all_cells()
         coords = get_coords_from_loc(location)
-        if coords not in cells:
-            cell = Cell(location, self.get_evaluator())
-            cells[coords] = cell
 
-        if contents is None or contents.strip() == "":
-            cells[coords].empty()
-            del cells[coords]
+        # cells are stored sparsely, so emptying a cell drops its entry and
+        # emptying a location that was never set touches nothing; isspace()
+        # checks for whitespace-only contents without stripping a copy
+        if not contents or contents.isspace():
+            cell = cells.pop(coords, None)
+            if cell is not None:
+                cell.empty()
+                if coords[0] == self._extent[0] or coords[1] == self._extent[1]:
+                    self._extent_dirty = True
             return
 
+        if coords not in cells:
+            cells[coords] = Cell(location, self.get_evaluator())
+
+        if not self._extent_dirty:
+            self._extent = (max(self._extent[0], coords[0]),
+                            max(self._extent[1], coords[1]))
         cells[coords].set_contents(contents)
 
     def get_cell_value(self, location: str) -> Any:
@@ -205,6 +229,24 @@ class Sheet:
             return None
         return cells[coords].get_value()
 
+    def get_cell_contents_and_value(self, location: str
+                                    ) -> Tuple[Optional[str], Any]:
+        '''
+        Get both the contents and the value of a cell with a single lookup
+
+        Arguments:
+        - location: str - cell's location
+
+        Returns:
+        - Tuple of the string contents or None, and the value of the cell
+
+        '''
+
+        cell = self.get_all_cells().get(get_coords_from_loc(location))
+        if cell is None:
+            return None, None
+        return cell.get_contents(), cell.get_value()
+
     def get_cell_adjacency_list(self) -> Dict[Tuple[str, str],
                                               List[Tuple[str, str]]]:
         '''
@@ -220,7 +262,7 @@ class Sheet:
         cells = self.get_all_cells()
         for cell in cells.values():
             name = self.get_name()
-            adj_list[(name, cell.get_loc().upper())] = cell.get_children()
+            adj_list[(name, cell.get_loc())] = cell.get_children()
         return adj_list
 
     def save_sheet(self) -> Dict[str, str]:
@@ -258,6 +300,29 @@ class Sheet:
 
         '''
 
+        return dict(self.iter_target_cells(start_location, end_location,
+                                           to_location, source_cells))
+
+    def iter_target_cells(self, start_location: str, end_location: str,
+            to_location: str, source_cells: List[str]
+            ) -> Iterator[Tuple[str, Optional[str]]]:
+        '''
+        Generate target cell locations and contents (considering shift)
+        without building a dict of them
+
+        Target contents are read from the source cells as they are generated,
+        so the source cells must not be changed until generation is done
+
+        Arguments:
+        - start_location: str - corner cell location of source area
+        - end_location: str - corner cell location of source area
+        - source_cells: List[str] - maps source cell locs to contents
+
+        Returns:
+        - Iterator of str cell location and str shifted contents pairs
+
+        '''
+
         target_top_left = get_coords_from_loc(to_location)
 
         src_top_left = get_tl_br_corners(start_location, end_location)[0]
@@ -267,7 +332,7 @@ class Sheet:
             target_top_left[1] - src_top_left[1]
         )
 
-        target_cells: Dict[str, str] = {}
+        cells = self.get_all_cells()
         for source_loc in source_cells:
             source_coords = get_coords_from_loc(source_loc)
             target_coords = (
@@ -275,10 +340,37 @@ class Sheet:
                 source_coords[1] + diff_coords[1]
             )
             try:
-                target_contents = self.get_all_cells()[source_coords]\
+                target_contents = cells[source_coords]\
                     .get_shifted_contents(diff_coords)
             except KeyError:
                 target_contents = None
-            target_cells[get_loc_from_coords(target_coords)] = target_contents
+            yield get_loc_from_coords(target_coords), target_contents
+
+    def get_cell_coords_in_area(self, top_left: Tuple[int, int],
+            bottom_right: Tuple[int, int]) -> List[Tuple[int, int]]:
+        '''
+        Get the coordinates of the cells set within an area, column by column
+
+        Only the smaller of the area and the set cells is scanned, so a large,
+        mostly empty area costs as much as the cells in the sheet
+
+        Arguments:
+        - top_left: Tuple[int, int] - col, row coordinates of top left corner
+        - bottom_right: Tuple[int, int] - col, row coordinates of bottom right
+            corner
+
+        Returns:
+        - List of col, row coordinates of set cells in the area
+
+        '''
+
+        (left, top), (right, bottom) = top_left, bottom_right
+        cells = self.get_all_cells()
 
-        return target_cells
+        if len(cells) < (right - left + 1) * (bottom - top + 1):
+            return sorted(coords for coords in cells
+                          if left <= coords[0] <= right
+                          and top <= coords[1] <= bottom)
+        return [coords for coords in product(range(left, right + 1),
+                                             range(top, bottom + 1))
+                if coords in cells]
@@ -10,9 +10,15 @@ Global Variables:
     to the operator function
 - EMPTY_SUBS (Dict[type, Any]) - converts type of not None expression to the
     correct empty value
+- TYPE_RANKS (Dict[type, int]) - orders values of different types for
+    comparison
+- STRING_BOOLS (Dict[str, bool]) - converts a lowercase boolean string to
+    its boolean value
+- CELL_LOCATION (Pattern) - matches an uppercase in-bounds cell location
 
 Methods:
 - get_loc_from_coords(Tuple[int, int]) -> str
+- get_col_name(int) -> str
 - get_coords_from_loc(str) -> Tuple[int, int]
 - convert_to_bool(Any, type) -> bool
 - get_tl_br_corners()
@@ -23,6 +29,8 @@ Methods:
 
 import re
 import operator
+from functools import lru_cache
+from itertools import product
 from typing import Tuple, Any, List
 from decimal import Decimal
 
@@ -46,6 +54,27 @@ EMPTY_SUBS = {
     bool: False
 }
 
+# order between values of different types, lowest first; an empty value
+# only ranks against an error, otherwise it takes its empty substitute
+TYPE_RANKS = {
+    type(None): -1,
+    CellError: 0,
+    Decimal: 1,
+    str: 2,
+    bool: 3
+}
+
+STRING_BOOLS = {
+    'true': True,
+    'false': False
+}
+
+# A-Z (max 4) then 1-9999, compiled once for every location check
+CELL_LOCATION = re.compile(r"^[A-Z]{1,4}[1-9][0-9]{0,3}$")
+
+# locations and coordinates come from a small, heavily reused set, and both
+# conversions are pure, so their results are memoized
+@lru_cache(maxsize=8192)
 def get_loc_from_coords(coords: Tuple[int, int]) -> str:
     '''
     Get a cell location from its coordinates
@@ -64,13 +93,32 @@ def get_loc_from_coords(coords: Tuple[int, int]) -> str:
     if col < 1 or row < 1 or col > 475254 or row > 9999:
         raise ValueError("Invalid coordinates")
 
+    return f"{get_col_name(col)}{row}"
+
+@lru_cache(maxsize=None)
+def get_col_name(col: int) -> str:
+    '''
+    Get the uppercase letters naming an in-bounds column number
+
+    Names are built once per column on first use, rather than as a table
+    of every column up to ZZZZ at import
+
+    Arguments:
+    - col: int - column number, 1 for column A
+
+    Returns:
+    - str of column letters, e.g. "AAC" for 705
+
+    '''
+
     col_name = ""
     while col > 0:
-        col_name = chr((col - 1) % 26 + ord('A')) + col_name
-        col = (col - 1) // 26
+        col, rem = divmod(col - 1, 26)
+        col_name = chr(rem + 65) + col_name
 
-    return col_name.upper() + str(row)
+    return col_name
 
+@lru_cache(maxsize=8192)
 def get_coords_from_loc(location: str) -> Tuple[int, int]:
     '''
     Get the coordinate tuple from a location
@@ -85,17 +133,22 @@ def get_coords_from_loc(location: str) -> Tuple[int, int]:
     - tuple containing the coordinates (col, row)
 
     '''
-    if not re.match(r"^[A-Z]{1,4}[1-9][0-9]{0,3}$", location.upper()):
-        raise ValueError("Cell location is invalid")
+    # single pass over the characters: letters first, then digits with no
+    # leading zero, e.g. "D14" -> (4, 14)
+    col_num = row_num = letters = digits = 0
+    for char in location:
+        code = ord(char)
+        if not digits and (65 <= code <= 90 or 97 <= code <= 122):
+            letters += 1
+            col_num = col_num * 26 + (code & 0x1F)
+        elif 48 <= code <= 57 and (digits or (letters and code != 48)):
+            digits += 1
+            row_num = row_num * 10 + code - 48
+        else:
+            raise ValueError("Cell location is invalid")
 
-    # example: "D14" -> (4, 14)
-    # splits into [characters, numbers, ""]
-    split_loc = re.split(r'(\d+)', location.upper())
-    (col, row) = split_loc[0], split_loc[1]
-    row_num = int(row)
-    col_num = 0
-    for letter in col:
-        col_num = col_num * 26 + ord(letter) - ord('A') + 1
+    if not digits or letters > 4 or digits > 4:
+        raise ValueError("Cell location is invalid")
 
     return (col_num, row_num)
 
@@ -114,20 +167,18 @@ def convert_to_bool(inp: Any, inp_type: type) -> bool:
 
     '''
 
-    result = None
-    if inp_type == bool:
-        result = inp
-    elif inp_type == str:
-        if inp.lower() == 'true':
-            result = True
-        elif inp.lower() == 'false':
-            result = False
-        else:
+    # called once per argument of every boolean function, so check the exact
+    # type by identity and lowercase a string only once
+    if inp_type is bool:
+        return inp
+    if inp_type is Decimal:
+        return bool(inp)
+    if inp_type is str:
+        result = STRING_BOOLS.get(inp.lower())
+        if result is None:
             raise TypeError('Cannot convert given string to boolean')
-    elif inp_type == Decimal:
-        result = bool(inp)
-    else: raise TypeError('Cannot convert given type to boolean')
-    return result
+        return result
+    raise TypeError('Cannot convert given type to boolean')
 
 def get_tl_br_corners(start_location: str, end_location: str
                           ) -> List[Tuple[int, int]]:
@@ -177,13 +228,13 @@ def get_source_cells(start_location: str,
     top_left_col, top_left_row = corners[0]
     bottom_right_col, bottom_right_row = corners[-1]
 
+    # both corners passed get_coords_from_loc, so every cell in between is in
+    # bounds; pair each column name with each row string, column by column
+    col_names = [get_col_name(col) for col in range(top_left_col, bottom_right_col + 1)]
+    row_names = [str(row) for row in range(top_left_row, bottom_right_row + 1)]
+
     # List[str] = List[cell location]
-    # get_loc_from_coords raises ValueError for invalid coords
-    source_cells: List[str] = []
-    for col in range(top_left_col, bottom_right_col + 1):
-        for row in range(top_left_row, bottom_right_row + 1):
-            loc = get_loc_from_coords((col, row))
-            source_cells.append(loc)
+    source_cells: List[str] = [col + row for col, row in product(col_names, row_names)]
 
     return source_cells
 
@@ -193,6 +244,10 @@ def compare_values(left: Any, right: Any, types: Tuple[type, type],
     Get the boolean value for a comparison between types of bool, str,
     and/or Decimal
 
+    Numbers are only compared with numbers or the empty value, and always
+    as Decimal, so the comparison is exact; converting to float would be
+    both lossy and slower than the C Decimal comparison
+
     Arguments:
     - left: Any - left side of comparison
     - right: Any - right side of comparison
@@ -205,35 +260,23 @@ def compare_values(left: Any, right: Any, types: Tuple[type, type],
 
     '''
 
-    result = False
-    if (left, right) == (None, None):
-        result = COMP_OPERATORS[oper]('', '')
-
-    elif types[0] == types[-1]:
-        if types == (str, str):
-            left = left.lower()
-            right = right.lower()
-        elif types == (CellError, CellError):
-            left = left.get_type().value
-            right = right.get_type().value
-        result = COMP_OPERATORS[oper](left, right)
-
-    elif (types in [(bool, str), (str, Decimal), (bool, Decimal)]) or \
-        (types[0] == CellError and right is None) or \
-            (types[-1] == CellError and left is not None):
-        if oper in ['>', '>=', '!=', '<>']:
-            result = True
-
-    elif (types in [(str, bool), (Decimal, str), (Decimal, bool)]) or \
-        (types[0] == CellError and right is not None) or \
-            (types[-1] == CellError and left is None):
-        if oper in ['<', '<=', '!=', '<>']:
-            result = True
-
-    else:
-        if left is not None:
-            result = COMP_OPERATORS[oper](left, EMPTY_SUBS[types[0]])
-        else:
-            result = COMP_OPERATORS[oper](EMPTY_SUBS[types[-1]], right)
-
-    return result
+    left_type, right_type = types
+    if left_type is right_type:
+        if left_type is str:
+            return COMP_OPERATORS[oper](left.lower(), right.lower())
+        if left_type is CellError:
+            return COMP_OPERATORS[oper](left.get_type().value,
+                                        right.get_type().value)
+        if left is None:
+            return COMP_OPERATORS[oper]('', '')
+        return COMP_OPERATORS[oper](left, right)
+
+    # an empty side takes the empty value of the other side's type, unless
+    # the other side is an error
+    if left is None and right_type is not CellError:
+        return COMP_OPERATORS[oper](EMPTY_SUBS[right_type], right)
+    if right is None and left_type is not CellError:
+        return COMP_OPERATORS[oper](left, EMPTY_SUBS[left_type])
+
+    # values of different types are ordered by their type alone
+    return COMP_OPERATORS[oper](TYPE_RANKS[left_type], TYPE_RANKS[right_type])
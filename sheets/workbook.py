@@ -15,19 +15,25 @@ Classes:
 
     Methods:
     - list_sheets(object) -> List[str]
-    - get_sheet_objects(object) -> Dict[str, Sheet]
+    - get_sheet_objects(object) -> Mapping[str, Sheet]
     - num_sheets(object) -> int
     - new_sheet(object, Optional[str]) -> Tuple[int, str]
     - del_sheet(object, str) -> None
     - get_sheet_extent(object, str) -> Tuple[int, int]
     - set_cell_contents(object, str, str, Optional[str]) -> None
+    - set_cell_contents_bulk(object, str, Iterable[Tuple[str, Optional[str]]])
+        -> None
     - get_cell_contents(object, str, str) -> Optional[str]
     - get_cell_value(object, str, str) -> Any
+    - get_cell_contents_and_value(object, str, str) -> Tuple[Optional[str],
+        Any]
     - update_cell_values(object, str, Optional[str], Optional[str],
         Optional[bool]) -> None
+    - to_dict(object) -> Dict[str, List[Dict[str, Any]]]
     - save_workbook(object, TextIO) -> None
     - notify_cells_changed(object, Callable[[Workbook,
         Iterable[Tuple[str, str]]], None]) -> None
+    - defer_recompute(object) -> Iterator[None]
     - rename_sheet(object, str, str) -> None
     - move_sheet(object, str, int) -> None
     - copy_sheet(object, str) -> Tuple[int, str]
@@ -46,13 +52,22 @@ Classes:
 # of 1000, but want to keep this limit across all other files
 
 import re
+import sys
 import json
-from typing import Optional, List, Tuple, Any, Dict, Callable, Iterable, TextIO
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Optional, List, Tuple, Any, Dict, Callable, Iterable, \
+    Iterator, Mapping, TextIO
+
+from lark import Token
+from lark.exceptions import LarkError
 
 from .sheet import Sheet
 from .evaluator import Evaluator
 from .graph import Graph
-from .utils import get_loc_from_coords, get_source_cells, get_tl_br_corners
+from .function_handler import parse_formula
+from .utils import get_loc_from_coords, get_coords_from_loc, get_source_cells, \
+    get_tl_br_corners
 from .sort_handler import Row
 
 
@@ -76,6 +91,8 @@ class Workbook:
         self._notify_cells = set()
         self._notify_functions = []
         self._update_cells = set()
+        self._recheck_cells = set()
+        self._deferred = 0
         self._sheet_names = []
         self._sheet_objects: Dict[str, Sheet] = {}
 
@@ -116,16 +133,19 @@ class Workbook:
 
         self._sheet_names = sheet_names
 
-    def get_sheet_objects(self) -> Dict[str, Sheet]:
+    def get_sheet_objects(self) -> Mapping[str, Sheet]:
         '''
-        Get the current dictionary of sheet objects
+        Get a read-only view of the current dictionary of sheet objects
+
+        The view is not copied, so it reflects later changes to the sheets
+        of the workbook and cannot be used to change them.
 
         Returns:
-        - Dict of sheet names to the corresponding sheet object
+        - Mapping of sheet names to the corresponding sheet object
 
         '''
 
-        return dict(self._sheet_objects)
+        return MappingProxyType(self._sheet_objects)
 
     def __set_sheet_objects(self, sheet_objects: Dict[str, Sheet]) -> None:
         '''
@@ -177,7 +197,7 @@ class Workbook:
         '''
 
         sheet_names = self.list_sheets()
-        sheet_objects = self.get_sheet_objects()
+        sheet_objects = dict(self.get_sheet_objects())
 
         if sheet_name is not None:
 
@@ -224,7 +244,7 @@ class Workbook:
         '''
 
         sheet_names = self.list_sheets()
-        sheet_objects = self.get_sheet_objects()
+        sheet_objects = dict(self.get_sheet_objects())
         self.__validate_sheet_existence(sheet_name)
 
         original_sheet_name = sheet_objects[sheet_name.lower()].get_name()
@@ -285,23 +305,57 @@ class Workbook:
         sheet_name_lower = sheet_name.lower()
         self.__validate_sheet_existence(sheet_name_lower)
 
-        prev_contents = sheet_objects[sheet_name_lower].get_cell_contents(location)
-        prev_value = sheet_objects[sheet_name_lower].get_cell_value(location)
+        prev_contents, prev_value = \
+            sheet_objects[sheet_name_lower].get_cell_contents_and_value(location)
 
         sheet_objects[sheet_name_lower].set_cell_contents(
             location, contents)
-        new_value = sheet_objects[sheet_name_lower].get_cell_value(location)
+        new_contents, new_value = \
+            sheet_objects[sheet_name_lower].get_cell_contents_and_value(location)
 
-        if notify:
+        # same interned string as the cell's own dependency graph keys
+        location = sys.intern(location.upper())
+        if notify and not self._deferred:
             # update other cells
             if new_value == prev_value and prev_contents is not None:
-                self.update_cell_values(sheet_name, [(sheet_name, location.upper())], notify=False)
+                self.update_cell_values(sheet_name, [(sheet_name, location)], notify=False)
             else:
-                self.update_cell_values(sheet_name, [(sheet_name, location.upper())])
+                self.update_cell_values(sheet_name, [(sheet_name, location)])
             self.__notify()
         else:
             if new_value != prev_value:
-                self._update_cells.add((sheet_name, location.upper()))
+                self._update_cells.add((sheet_name, location))
+            elif new_contents != prev_contents:
+                # same value, but new references may still close a cycle
+                self._recheck_cells.add((sheet_name, location))
+
+    def set_cell_contents_bulk(self, sheet_name: str,
+                               items: Iterable[Tuple[str, Optional[str]]]) -> None:
+        '''
+        Set the contents of several cells on the specified sheet
+        (case-insensitive), updating their dependents once at the end.
+
+        The pairs are set in order inside defer_recompute, so each call only
+        updates its own cell.  Cells that depend on any of them are then
+        updated in a single pass and notify functions are called once.  As
+        described in defer_recompute, the values can differ from those of
+        separate set_cell_contents calls when a taken IF, IFERROR or CHOOSE
+        branch enters or leaves a reference cycle.
+
+        If the specified sheet name is not found, a KeyError is raised.
+        If a cell location is invalid, a ValueError is raised.
+
+        Arguments:
+        - sheet_name: str - sheet's name
+        - items: Iterable[Tuple[str, Optional[str]]] - pairs of cell location
+            and contents to set
+
+        '''
+
+        self.__validate_sheet_existence(sheet_name.lower())
+        with self.defer_recompute():
+            for location, contents in items:
+                self.set_cell_contents(sheet_name, location, contents)
 
     def get_cell_contents(self, sheet_name: str, location: str)-> Optional[str]:
         '''
@@ -320,12 +374,11 @@ class Workbook:
 
         '''
 
-        sheet_objects = self.get_sheet_objects()
         self.evaluator.set_working_sheet(sheet_name)
         sheet_name = sheet_name.lower()
         self.__validate_sheet_existence(sheet_name)
 
-        return sheet_objects[sheet_name].get_cell_contents(location)
+        return self._sheet_objects[sheet_name].get_cell_contents(location)
 
     def get_cell_value(self, sheet_name: str, location: str) -> Any:
         '''
@@ -346,11 +399,36 @@ class Workbook:
 
         '''
 
-        sheet_objects = self.get_sheet_objects()
+        # every cell reference in a formula is resolved through here, so read
+        # the sheet directly instead of copying the sheet dict on each lookup
+        sheet_name = sheet_name.lower()
+        self.__validate_sheet_existence(sheet_name)
+
+        return self._sheet_objects[sheet_name].get_cell_value(location)
+
+    def get_cell_contents_and_value(self, sheet_name: str, location: str
+                                    ) -> Tuple[Optional[str], Any]:
+        '''
+        Return both the contents and the evaluated value of the specified cell
+        on the specified sheet (case-insensitive), looking the cell up once.
+
+        If the specified sheet name is not found, a KeyError is raised.
+        If the cell location is invalid, a ValueError is raised.
+
+        Arguments:
+        - sheet_name: str - sheet's name
+        - location: str - cell's location
+
+        Returns:
+        - Tuple of the string contents or None, and the cell value
+
+        '''
+
         sheet_name = sheet_name.lower()
         self.__validate_sheet_existence(sheet_name)
 
-        return sheet_objects[sheet_name].get_cell_value(location)
+        return self._sheet_objects[sheet_name].get_cell_contents_and_value(
+            location)
 
     def update_cell_values(self, updated_sheet: str, updated_cell: Optional[str]
         = None, renamed_sheet: Optional[str] = None, notify: Optional[bool] =
@@ -385,9 +463,6 @@ class Workbook:
             or (renamed_sheet is not None and child_sheet == renamed_sheet)]
             # rename references if we have a renamed sheet
             if renamed_sheet is not None:
-                # fix new sheet name
-                if re.search(R'[ .?!,:;!@#$%^&*\(\)\-]', renamed_sheet):
-                    renamed_sheet = "'"+renamed_sheet+"'"
                 # get the adjacency list of the cell parents graph
                 parent_adj = cell_graph.get_adjacency_list()
                 # get the cells that references to cells on sheet
@@ -401,21 +476,13 @@ class Workbook:
                         ref_cells.add(cell)
                 # go through cells that reference the cells on sheet
                 for (sheet, cell) in ref_cells:
-                    # get cell contents
-                    contents = self.get_cell_contents(sheet, cell)
                     # replace sheet name with new name
-                    contents=re.sub(R"([=\+\-*/& ])"+updated_sheet+"!",
-                                    R"\1"+renamed_sheet+"!",
-                                    contents, flags=re.IGNORECASE)
-                    contents=re.sub("'"+updated_sheet+"'"+"!",
-                    renamed_sheet+"!", contents, flags=re.IGNORECASE)
+                    contents = self.__rename_sheet_refs(
+                        self.get_cell_contents(sheet, cell), updated_sheet,
+                        renamed_sheet)
                     # set the new contents with new sheet name
                     sheet_objects[sheet.lower()].set_cell_contents(
                         cell, contents)
-                    # call helper function to update sheet names in contents
-                    self.__format_sheet_names(sheet, cell,
-                                                adj[(sheet, cell)])
-                self.__set_sheet_objects(sheet_objects)
         else:
             updated_cells = updated_cell
         # call helper to update and notify cells that need updating
@@ -484,18 +551,15 @@ class Workbook:
 
         return new_wb
 
-    def save_workbook(self, fp: TextIO) -> None:
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
         '''
-        Save a workbook to a text file or file-like object in JSON format.
-
-        Let any raised exception propagate through.
+        Get the workbook in the dictionary form that is saved as JSON
 
-        Arguments:
-        - fp: TextIO - write supporting file like object to save to
+        Returns:
+        - Dict with the list of sheets, each with its name and cell contents
 
         '''
 
-        obj = {}
         json_sheets = []
         sheet_names = self.list_sheets()
         sheet_objects = self.get_sheet_objects()
@@ -504,8 +568,29 @@ class Workbook:
             sheet  = sheet_objects[sheet_name.lower()]
             json_sheets.append(sheet.save_sheet())
 
-        obj = {"sheets": json_sheets}
-        json.dump(obj=obj, fp=fp)
+        return {"sheets": json_sheets}
+
+    def save_workbook(self, fp: TextIO) -> None:
+        '''
+        Save a workbook to a text file or file-like object in JSON format.
+
+        Let any raised exception propagate through.
+
+        Arguments:
+        - fp: TextIO - write supporting file like object to save to
+
+        '''
+
+        sheet_objects = self.get_sheet_objects()
+
+        # write one sheet at a time, so only a single sheet's contents are
+        # held as a dictionary while saving
+        fp.write('{"sheets": [')
+        for i, sheet_name in enumerate(self.list_sheets()): # preserves ordering
+            if i:
+                fp.write(', ')
+            fp.write(json.dumps(sheet_objects[sheet_name.lower()].save_sheet()))
+        fp.write(']}')
 
     def notify_cells_changed(self, notify_function:
         Callable[['Workbook', Iterable[Tuple[str, str]]], None]) -> None:
@@ -528,6 +613,34 @@ class Workbook:
 
         self._notify_functions.append(notify_function)
 
+    @contextmanager
+    def defer_recompute(self) -> Iterator[None]:
+        '''
+        Defer updating dependent cells until the end of the block
+
+        Every set_cell_contents call inside the block only updates its own
+        cell.  On leaving the block, the cells that depend on any changed cell
+        are updated together in one topological pass and notify functions
+        are called once with every changed cell, instead of after each call.
+        Blocks may be nested; the update happens when the outermost one ends.
+
+        The values are not always those that the same calls made outside a
+        block would give.  Only the taken branch of IF, IFERROR and CHOOSE,
+        and the first argument of IFERROR only while it is not an error, is a
+        dependency, so a cell whose taken branch enters or leaves a reference
+        cycle can end up with a value that depends on the update order.
+
+        '''
+
+        self._deferred += 1
+        try:
+            yield
+        finally:
+            self._deferred -= 1
+            if not self._deferred:
+                self.__update_queued_cells('')
+                self.__notify()
+
     def rename_sheet(self, sheet_name: str, new_sheet_name: str) -> None:
         '''
         Rename the specified sheet to the new sheet name.  All relevant
@@ -545,7 +658,7 @@ class Workbook:
         '''
 
         sheet_names = self.list_sheets()
-        sheet_objects = self.get_sheet_objects()
+        sheet_objects = dict(self.get_sheet_objects())
         self.__validate_sheet_existence(sheet_name)
 
         # checking empty string
@@ -642,8 +755,7 @@ class Workbook:
             self.set_cell_contents(sheet_copy_name, loc, cell.get_contents(),
                                     notify=False)
 
-        self.update_cell_values(sheet_copy_name, list(self._update_cells))
-        self._update_cells = set()
+        self.__update_queued_cells(sheet_copy_name)
         self.__notify()
         return sheet_copy_idx, sheet_copy_name
 
@@ -679,38 +791,27 @@ class Workbook:
         '''
 
         self.__validate_sheet_existence(sheet_name)
-        sheet_objects = self.get_sheet_objects()
-
-        source_sheet = sheet_objects[sheet_name.lower()]
-        source_cells = get_source_cells(start_location, end_location)
 
         if to_sheet is None:
             to_sheet = sheet_name
         else:
             self.__validate_sheet_existence(to_sheet)
 
-        target_cells = source_sheet.get_target_cells(start_location,
-            end_location, to_location, source_cells) # Dict[locs, contents]
+        source_cells, target_cells = self.__get_shifted_cells(sheet_name,
+            start_location, end_location, to_location, to_sheet)
 
         # Set contents of source cells (not in target area) to None
-        # could set all values in source area to None **
-        if to_sheet is None or to_sheet == sheet_name:
-            to_sheet = sheet_name
-            source_set = set(source_cells)
-            target_set = set(target_cells.keys())
-            source_target_set_diff = source_set.difference(target_set)
-        else:
-            self.__validate_sheet_existence(to_sheet)
-            source_target_set_diff = source_cells
-        for loc in list(source_target_set_diff):
+        if to_sheet.lower() == sheet_name.lower():
+            source_cells = [loc for loc in source_cells
+                            if loc not in target_cells]
+        for loc in source_cells:
             self.set_cell_contents(sheet_name, loc, None, notify=False)
 
         # Set contents of target cells (within same sheet if to_sheet is None)
         for loc, contents in target_cells.items():
             self.set_cell_contents(to_sheet, loc, contents, notify=False)
 
-        self.update_cell_values(to_sheet, list(self._update_cells))
-        self._update_cells = set()
+        self.__update_queued_cells(to_sheet)
         self.__notify()
 
 
@@ -748,25 +849,20 @@ class Workbook:
         '''
 
         self.__validate_sheet_existence(sheet_name)
-        sheet_objects = self.get_sheet_objects()
-
-        source_sheet = sheet_objects[sheet_name.lower()]
-        source_cells = get_source_cells(start_location, end_location)
 
         if to_sheet is None:
             to_sheet = sheet_name
         else:
             self.__validate_sheet_existence(to_sheet)
 
-        target_cells = source_sheet.get_target_cells(start_location,
-            end_location, to_location, source_cells) # Dict[locs, contents]
+        _, target_cells = self.__get_shifted_cells(sheet_name, start_location,
+            end_location, to_location, to_sheet)
 
         # Set contents of target cells (within same sheet if to_sheet is None)
         for loc, contents in target_cells.items():
             self.set_cell_contents(to_sheet, loc, contents, notify=False)
 
-        self.update_cell_values(to_sheet, list(self._update_cells))
-        self._update_cells = set()
+        self.__update_queued_cells(to_sheet)
         self.__notify()
 
     def sort_region(self, sheet_name: str, start_location: str,
@@ -810,14 +906,96 @@ class Workbook:
         for cell in all_target_cells.items():
             self.set_cell_contents(sheet_name, cell[0], cell[-1], notify=False)
 
-        self.update_cell_values(sheet_name, list(self._update_cells))
-        self._update_cells = set()
+        self.__update_queued_cells(sheet_name)
         self.__notify()
 
     ########################################################################
     # Private Helpers
     ########################################################################
 
+    def __update_queued_cells(self, sheet_name: str) -> None:
+        '''
+        Update the cells queued by set_cell_contents calls made without
+        notify, and everything depending on them, in one pass
+
+        Cells whose value changed are notified.  Cells whose contents changed
+        but not their value are only rechecked, as set_cell_contents does
+        without queueing, so a cycle they close is still found.
+
+        Arguments:
+        - sheet_name: str - sheet the queued cells were set on
+
+        '''
+
+        # skip cells on sheets deleted or renamed since they were queued
+        updated_cells = [(sheet, cell) for sheet, cell in self._update_cells
+                         if sheet.lower() in self._sheet_objects]
+        recheck_cells = [(sheet, cell) for sheet, cell in self._recheck_cells
+                         if sheet.lower() in self._sheet_objects
+                         and (sheet, cell) not in self._update_cells]
+        self._update_cells = set()
+        self._recheck_cells = set()
+
+        if recheck_cells:
+            self.update_cell_values(sheet_name, updated_cells + recheck_cells,
+                                    notify=False)
+            self._notify_cells.update(updated_cells)
+        else:
+            self.update_cell_values(sheet_name, updated_cells)
+
+    def __get_shifted_cells(self, sheet_name: str, start_location: str,
+            end_location: str, to_location: str, to_sheet: str
+            ) -> Tuple[List[str], Dict[str, Optional[str]]]:
+        '''
+        Get the set cells of a source area and the contents they leave in the
+        target area when shifted to to_location on to_sheet
+
+        Empty locations in both areas are skipped, since setting an empty
+        cell to None changes nothing, so only set cells are visited however
+        large the areas are.
+
+        Throw a ValueError if the target area extends outside the sheet
+
+        Arguments:
+        - sheet_name: str - name of sheet containing the source area
+        - start_location: str - corner cell location of source area
+        - end_location: str - corner cell location of source area
+        - to_location: str - location of top left corner of target area
+        - to_sheet: str - name of sheet containing the target area
+
+        Returns:
+        - List of locations of the set cells in the source area
+        - Dict mapping target locations to shifted contents, or None for set
+            target cells left empty, column by column
+
+        '''
+
+        source_sheet = self._sheet_objects[sheet_name.lower()]
+        target_sheet = self._sheet_objects[to_sheet.lower()]
+
+        top_left, bottom_right = get_tl_br_corners(start_location, end_location)
+        target_top_left = get_coords_from_loc(to_location)
+        diff_coords = (target_top_left[0] - top_left[0],
+                       target_top_left[1] - top_left[1])
+        target_bottom_right = (bottom_right[0] + diff_coords[0],
+                               bottom_right[1] + diff_coords[1])
+        # raises ValueError before anything is changed
+        get_loc_from_coords(target_bottom_right)
+
+        source_coords = source_sheet.get_cell_coords_in_area(top_left,
+                                                             bottom_right)
+        cells = source_sheet.get_all_cells()
+        shifted = {(col + diff_coords[0], row + diff_coords[1]):
+                   cells[(col, row)].get_shifted_contents(diff_coords)
+                   for col, row in source_coords}
+        for coords in target_sheet.get_cell_coords_in_area(target_top_left,
+                                                           target_bottom_right):
+            shifted.setdefault(coords, None)
+
+        return ([get_loc_from_coords(coords) for coords in source_coords],
+                {get_loc_from_coords(coords): shifted[coords]
+                 for coords in sorted(shifted)})
+
     def __validate_sheet_existence(self, sheet_name: str) -> None:
         '''
         Validate whether the given sheet name already exists within the workbook
@@ -829,9 +1007,7 @@ class Workbook:
 
         '''
 
-        sheet_objects = self.get_sheet_objects()
-
-        if sheet_name.lower() not in sheet_objects:
+        if sheet_name.lower() not in self._sheet_objects:
             raise KeyError(f"Specified sheet name '{sheet_name}' is not found")
 
     def __validate_sheet_uniqueness(self, sheet_name: str) -> None:
@@ -846,34 +1022,57 @@ class Workbook:
 
         '''
 
-        sheet_objects = self.get_sheet_objects()
-
-        if sheet_name.lower() in sheet_objects:
+        if sheet_name.lower() in self._sheet_objects:
             raise ValueError(f"Sheet name '{sheet_name}' already exists")
 
-    def __format_sheet_names(self, sheet_name: str, location: str,
-        sheets_in_contents: List[Tuple]) -> None:
+    @staticmethod
+    def __rename_sheet_refs(contents: str, sheet_name: str,
+                            new_sheet_name: str) -> str:
         '''
-        Set the cell's contents to be properly formatted so that sheet names
-        with quotations that do not need them, will have them removed
+        Rewrite the sheet references in a formula for a renamed sheet
+
+        The sheet references are found as SHEET_CELL tokens in the formula's
+        parse tree, and only those spans of the text are replaced, so string
+        literals, spacing and everything else in the formula are kept as
+        written.  References to the renamed sheet use its new name, and any
+        sheet name is quoted only if it needs quotes.
 
         Arguments:
-        - sheet_name: str - name of the current cell's sheet
-        - location: str - location of the current cell
-        - sheets_in_contents: List[Tuple] - list of the sheets referenced in
-            the current cell's contents
+        - contents: str - formula contents of a cell referencing the sheet
+        - sheet_name: str - old name of the renamed sheet
+        - new_sheet_name: str - new name of the renamed sheet
 
-        '''
+        Returns:
+        - str of the formula with updated sheet references
 
-        sheet_objects = self.get_sheet_objects()
+        '''
 
-        for sheet, _ in sheets_in_contents:
-            if not re.search(R'[ .?!,:;!@#$%^&*\(\)\-]', sheet):
-                curr_contents = self.get_cell_contents(sheet_name, location)
-                contents = re.sub("'"+sheet+"'", sheet, curr_contents)
-                sheet_objects[sheet_name.lower()]\
-                    .set_cell_contents(location, contents)
-        self.__set_sheet_objects(sheet_objects)
+        try:
+            tree = parse_formula(contents)
+        except LarkError:
+            # formulas that do not parse are left as written
+            return contents
+        refs = sorted(tree.scan_values(
+            lambda v: isinstance(v, Token) and v.type == 'SHEET_CELL'),
+            key=lambda token: token.start_pos)
+
+        old_name = sheet_name.lower()
+        new_contents = []
+        last = 0
+        for ref in refs:
+            ref_sheet, _, location = ref.rpartition('!')
+            if ref_sheet[0] == "'":
+                ref_sheet = ref_sheet[1:-1]
+            if ref_sheet.lower() == old_name:
+                ref_sheet = new_sheet_name
+            if re.search(R'[ .?!,:;!@#$%^&*\(\)\-]', ref_sheet):
+                ref_sheet = "'" + ref_sheet + "'"
+            new_contents.append(contents[last:ref.start_pos])
+            new_contents.append(ref_sheet + '!' + location)
+            last = ref.end_pos
+        new_contents.append(contents[last:])
+
+        return ''.join(new_contents)
 
     def __get_topological(self, cell_graph: Graph, updated_cells: List[Tuple],
         adj: Dict[Tuple, List[Tuple]]) -> None:
@@ -904,7 +1103,6 @@ class Workbook:
                 for sheet, cell in component:
                     sheet_objects[
                         sheet.lower()].get_cell(cell).set_circular_error()
-                self.__set_sheet_objects(sheet_objects)
 
         cell_graph.subgraph_from_nodes(dag_nodes)
 
@@ -971,7 +1169,7 @@ class Workbook:
                 to_loc = get_loc_from_coords(
                     (tl_br_corners[0][0], tl_br_corners[0][-1]+i))
                 source_cells = get_source_cells(start_loc, end_loc)
-                all_target_cells.update(sheet.get_target_cells(start_loc,
+                all_target_cells.update(sheet.iter_target_cells(start_loc,
                                                 end_loc, to_loc, source_cells))
 
         return all_target_cells
@@ -1004,13 +1202,12 @@ class Workbook:
         for sheet, cell in cell_topological:
             if len(updated_cells) > 1 or (sheet, cell) not in updated_cells:
                 name = sheet.lower()
-                prev_value = sheet_objects[name].get_cell_value(cell)
-                sheet_objects[name].set_cell_contents(cell,
-                    sheet_objects[name].get_cell_contents(cell))
+                prev_contents, prev_value = \
+                    sheet_objects[name].get_cell_contents_and_value(cell)
+                sheet_objects[name].set_cell_contents(cell, prev_contents)
                 new_value = sheet_objects[name].get_cell_value(cell)
                 if new_value != prev_value:
                     notify_cells.append((sheet, cell))
-        self.__set_sheet_objects(sheet_objects)
         self._notify_cells.update(notify_cells)
 
     def __notify(self):
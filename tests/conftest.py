@@ -0,0 +1,253 @@
+'''
+Conftest
+
+Shared pytest configuration and fixtures for the test suites.
+
+Global Variables:
+- SetupBlock (type) - type of the setup_block fixture
+- SetCells (type) - type of the set_cells fixture
+- Expected (type) - expected result of evaluating a formula
+
+Fixtures:
+- workbook() -> Workbook
+- evaluator(Workbook) -> Evaluator
+- json_data() -> Dict[str, str]
+- setup_block(FixtureRequest) -> SetupBlock
+- set_cells(FixtureRequest) -> SetCells
+
+Methods:
+- pytest_configure(Config) -> None
+- _set_cells_sequentially(Workbook, str, Iterable[Tuple[str, Optional[str]]])
+    -> None
+- _is(Tree, str, Any) -> bool
+- _err(Tree, CellErrorType) -> bool
+- check_formula(Evaluator, str, Expected) -> None
+- check_result(Tree, Expected) -> None
+
+'''
+
+
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterable, Optional, Tuple, Union
+
+import pytest
+from lark import Tree
+
+# pylint: disable=unused-import, import-error
+import context
+from sheets.cell_error import CellError, CellErrorType
+from sheets.evaluator import Evaluator
+from sheets.function_handler import parse_formula
+from sheets.workbook import Workbook
+
+
+# Workbook -> block to set cells in
+SetupBlock = Callable[[Workbook], ContextManager[None]]
+# (Workbook, sheet name, (location, contents) pairs) -> None
+SetCells = Callable[[Workbook, str, Iterable[Tuple[str, Optional[str]]]], None]
+# An expected result is either the (data, value) pair of the result Tree or,
+# for formulas that evaluate to an error, just the CellErrorType of that error
+Expected = Union[Tuple[str, Any], CellErrorType]
+
+def pytest_configure(config) -> None:
+    '''
+    Register the markers used by the test suites
+
+    pytest-xdist registers xdist_group itself; registering it here as well
+    keeps serial runs without xdist installed free of unknown-marker warnings.
+
+    Arguments:
+    - config: Config - the pytest configuration
+
+    '''
+
+    config.addinivalue_line('markers',
+        'xdist_group(name): run every test in the group on the same worker')
+
+
+# pytest injects fixtures by parameter name, so test arguments deliberately
+# shadow the fixture functions below
+# pylint: disable=redefined-outer-name
+
+@pytest.fixture
+def workbook() -> Workbook:
+    '''
+    Create the Workbook used by a test
+
+    Built on first use rather than at import, so collecting or deselecting
+    tests does not construct it.  Every test gets a fresh Workbook, so no test
+    depends on cells, dependencies or sheets left behind by another and the
+    tests can be spread across workers with pytest-xdist.  Building an empty
+    Workbook directly is several times cheaper than deep-copying a prepared
+    template, so no template is kept.
+
+    Returns:
+    - Workbook with a single sheet named 'Test'
+
+    '''
+
+    wb = Workbook()
+    wb.new_sheet('Test')
+    return wb
+
+
+@pytest.fixture
+def evaluator(workbook: Workbook) -> Evaluator:
+    '''
+    Create the Evaluator used by a test
+
+    Arguments:
+    - workbook: Workbook - the Workbook used by the test
+
+    Returns:
+    - Evaluator working on the 'Test' sheet
+
+    '''
+
+    return Evaluator(workbook, 'Test')
+
+
+@pytest.fixture(scope='session')
+def json_data() -> Dict[str, str]:
+    '''
+    Read every saved workbook in json_data once for the whole session
+
+    The files are only ever read, so tests load workbooks from the text
+    through io.StringIO instead of opening the files again.
+
+    Returns:
+    - Dict mapping each json file name to its text
+
+    '''
+
+    data_dir = Path(__file__).parent / 'json_data'
+    return {path.name: path.read_text(encoding='utf8')
+            for path in data_dir.glob('*.json')}
+
+
+@pytest.fixture(params=[False, True], ids=['sequential', 'deferred'])
+def setup_block(request: pytest.FixtureRequest) -> SetupBlock:
+    '''
+    Run a test once with its setup applied cell by cell and once with the
+    setup inside defer_recompute()
+
+    Tests wrap their multi-cell setup in `with setup_block(workbook):`, so
+    both the per-edit update path and the deferred update path are checked
+    against the same expectations.
+
+    Arguments:
+    - request: FixtureRequest - the requesting test context
+
+    Returns:
+    - Callable giving the context manager to set cells of a Workbook in
+
+    '''
+
+    if request.param:
+        return Workbook.defer_recompute
+    return lambda _: nullcontext()
+
+
+def _set_cells_sequentially(workbook: Workbook, sheet_name: str,
+                            items: Iterable[Tuple[str, Optional[str]]]
+                            ) -> None:
+    '''
+    Set several cells of a sheet one set_cell_contents call at a time
+
+    Arguments:
+    - workbook: Workbook - the Workbook to set cells in
+    - sheet_name: str - name of the sheet to set cells on
+    - items: Iterable[Tuple[str, Optional[str]]] - location, contents pairs
+
+    '''
+
+    for location, contents in items:
+        workbook.set_cell_contents(sheet_name, location, contents)
+
+
+@pytest.fixture(params=[False, True], ids=['sequential', 'bulk'])
+def set_cells(request: pytest.FixtureRequest) -> SetCells:
+    '''
+    Run a test once with its setup set cell by cell and once with the setup
+    set through set_cell_contents_bulk
+
+    Arguments:
+    - request: FixtureRequest - the requesting test context
+
+    Returns:
+    - Callable setting several cells of one sheet of a Workbook
+
+    '''
+
+    if request.param:
+        return Workbook.set_cell_contents_bulk
+    return _set_cells_sequentially
+
+
+def _is(result: Tree, data: str, value: Any) -> bool:
+    '''
+    Check an evaluated result Tree without building an expected Tree
+
+    Arguments:
+    - result: Tree - result of evaluating a formula
+    - data: str - expected type tag of the result
+    - value: Any - expected value of the result
+
+    Returns:
+    - whether the result holds exactly the given type tag and value, of the
+      value's type, so an int or float result does not pass for a Decimal
+
+    '''
+
+    return result.data == data and result.children == [value] and \
+        isinstance(result.children[0], type(value))
+
+
+def _err(result: Tree, error_type: CellErrorType) -> bool:
+    '''
+    Check that an evaluated result Tree holds an error of the given type
+
+    Arguments:
+    - result: Tree - result of evaluating a formula
+    - error_type: CellErrorType - expected type of the error
+
+    Returns:
+    - whether the result holds a CellError of the given type
+
+    '''
+
+    error = result.children[-1]
+    return isinstance(error, CellError) and error.get_type() == error_type
+
+
+def check_formula(evaluator: Evaluator, formula: str, expected: Expected) -> None:
+    '''
+    Parse and evaluate a formula against the test sheet and check the result
+
+    Arguments:
+    - evaluator: Evaluator - the Evaluator to evaluate the formula with
+    - formula: str - the formula to evaluate
+    - expected: Expected - the expected (data, value) pair of the result, or
+      the expected CellErrorType if the formula should evaluate to an error
+
+    '''
+
+    check_result(evaluator.transform(parse_formula(formula)), expected)
+
+
+def check_result(result: Tree, expected: Expected) -> None:
+    '''
+    Check an evaluated result Tree
+
+    Arguments:
+    - result: Tree - result of evaluating a formula
+    - expected: Expected - the expected (data, value) pair of the result, or
+      the expected CellErrorType if the result should be an error
+
+    '''
+
+    if isinstance(expected, CellErrorType):
+        assert _err(result, expected)
+    else:
+        assert _is(result, *expected)
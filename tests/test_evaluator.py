@@ -5,43 +5,111 @@ Tests the Evaluator module found at ../sheets/evaluator.py with
 valid inputs.
 
 GLOBAL_VARIABLES:
-- WB (Workbook) - the Workbook used for this test suite
-- EVALUATOR (Evaluator) - the Evaluator used for this test suite
-- PARSER (Any) - the Parser used for this test suite
+- D_NEG399_75, D_NEG116_5, D_NEG65, D_NEG34, D_NEG33, D_NEG25, D_NEG6_5, D_NEG6,
+  D_NEG5_25, D_NEG4, D_NEG2_2, D_NEG2, D_NEG1_625, D_NEG1, D0, D0_2,
+  D0_3333333333333333333333333333, D0_5, D1, D2, D3, D4, D8, D10, D10_002, D12,
+  D12_000000001, D12_3, D35, D92_455, D121, D123, D1000000 (Decimal) - shared
+  Decimal constants for expected numbers
+- NUM_LITERAL_CASES (List[Tuple[str, Tuple[str, Any]]]) - formula/result pairs for
+  numeric literals
+- STRING_LITERAL_CASES (List[Tuple[str, Tuple[str, Any]]]) - formula/result pairs for
+  string literals
+
+The workbook and evaluator fixtures and the check_formula helper are shared
+from conftest.py.
 
 Classes:
 - TestEvaluator
 
     Methods:
-    - test_num_literals(object) -> None
-    - test_string_literals(object) -> None
-    - test_cell_references(object) -> None
-    - test_string_concatenation(object) -> None
-    - test_unary_operations(object) -> None
-    - test_addition_subtraction(object) -> None
-    - test_multiplication_division(object) -> None
-    - test_comparison(object) -> None
-    - test_complex_formula(object) -> None
-    - test_reference_same_sheet(object) -> None
-    - test_reference_other_sheet(object) -> None
+    - test_num_literals(object, Evaluator, str, Tuple[str, Any]) -> None
+    - test_string_literals(object, Evaluator, str, Tuple[str, Any]) -> None
+    - test_cell_references(object, Workbook, Evaluator) -> None
+    - test_string_concatenation(object, Workbook, Evaluator) -> None
+    - test_unary_operations(object, Workbook, Evaluator) -> None
+    - test_addition_subtraction(object, Workbook, Evaluator) -> None
+    - test_multiplication_division(object, Workbook, Evaluator) -> None
+    - test_comparison(object, Workbook, Evaluator) -> None
+    - test_complex_formula(object, Workbook, Evaluator) -> None
+    - test_reference_same_sheet(object, Workbook) -> None
+    - test_reference_other_sheet(object, Workbook) -> None
 
 '''
 
 
 from decimal import Decimal
+from typing import Any, Tuple
 
-from lark import Lark, Tree
+import pytest
 
 # pylint: disable=unused-import, import-error
 import context
+from conftest import check_formula
 from sheets.evaluator import Evaluator
 from sheets.workbook import Workbook
 
 
-WB = Workbook()
-WB.new_sheet('Test')
-EVALUATOR = Evaluator(WB, 'Test')
-PARSER = Lark.open('../sheets/formulas.lark', start='formula', rel_to=__file__, parser='lalr')
+# expected numbers are shared Decimal constants named after their value,
+# with D_NEG for negatives and _ for the decimal point
+D_NEG399_75 = Decimal('-399.75')
+D_NEG116_5 = Decimal('-116.5')
+D_NEG65 = Decimal('-65')
+D_NEG34 = Decimal('-34')
+D_NEG33 = Decimal('-33')
+D_NEG25 = Decimal('-25')
+D_NEG6_5 = Decimal('-6.5')
+D_NEG6 = Decimal('-6')
+D_NEG5_25 = Decimal('-5.25')
+D_NEG4 = Decimal('-4')
+D_NEG2_2 = Decimal('-2.2')
+D_NEG2 = Decimal('-2')
+D_NEG1_625 = Decimal('-1.625')
+D_NEG1 = Decimal('-1')
+D0 = Decimal('0')
+D0_2 = Decimal('0.2')
+D0_3333333333333333333333333333 = Decimal('0.3333333333333333333333333333')
+D0_5 = Decimal('0.5')
+D1 = Decimal('1')
+D2 = Decimal('2')
+D3 = Decimal('3')
+D4 = Decimal('4')
+D8 = Decimal('8')
+D10 = Decimal('10')
+D10_002 = Decimal('10.002')
+D12 = Decimal('12')
+D12_000000001 = Decimal('12.000000001')
+D12_3 = Decimal('12.3')
+D35 = Decimal('35')
+D92_455 = Decimal('92.455')
+D121 = Decimal('121')
+D123 = Decimal('123')
+D1000000 = Decimal('1000000')
+
+NUM_LITERAL_CASES = [
+    ('=123', ('number', D123)),
+    ('=12.3', ('number', D12_3)),
+    ('=.2', ('number', D0_2)),
+    ('=0010.00200', ('number', D10_002)),
+    ('=   0010.', ('number', D10)),
+    ('=0010.      ', ('number', D10)),
+    ('=   0010.    ', ('number', D10)),
+    ('=0.2', ('number', D0_2)),
+    ('=000000000.2', ('number', D0_2)),
+    ('=1000000', ('number', D1000000)),
+    ('=12.00000000', ('number', D12)),
+    ('=12.000000001', ('number', D12_000000001))
+]
+
+STRING_LITERAL_CASES = [
+    ('="\'"', ('string', '\'')),
+    ('=""', ('string', '')),
+    ('="string"', ('string', 'string')),
+    ('="123"', ('string', '123')),
+    ('="this is a string with spaces"', ('string', 'this is a string with spaces')),
+    ('=      "Jar Jar Binks was always supposed to be the real phantom menace"     ',
+     ('string', 'Jar Jar Binks was always supposed to be the real phantom menace'))
+]
+
 
 class TestEvaluator:
     '''
@@ -49,584 +117,359 @@ class TestEvaluator:
 
     '''
 
-    def test_num_literals(self) -> None:
+    @pytest.mark.parametrize('formula, expected', NUM_LITERAL_CASES)
+    def test_num_literals(self, evaluator: Evaluator, formula: str,
+                          expected: Tuple[str, Any]) -> None:
         '''
         Test when given a formula of numeric literals
 
-        '''
-
-        tree = PARSER.parse('=123')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('123')])
-
-        tree = PARSER.parse('=12.3')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('12.3')])
-
-        tree = PARSER.parse('=.2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('.2')])
-
-        tree = PARSER.parse('=0010.00200')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('10.002')])
-
-        tree = PARSER.parse('=   0010.')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('10')])
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test
+        - formula: str - the formula to evaluate
+        - expected: Tuple[str, Any] - the expected (data, value) pair of the
+            result
 
-        tree = PARSER.parse('=0010.      ')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('10')])
-
-        tree = PARSER.parse('=   0010.    ')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('10')])
-
-        tree = PARSER.parse('=0.2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('0.2')])
-
-        tree = PARSER.parse('=000000000.2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('0.2')])
-
-        tree = PARSER.parse('=1000000')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('1000000')])
-
-        tree = PARSER.parse('=12.00000000')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('12')])
+        '''
 
-        tree = PARSER.parse('=12.000000001')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('12.000000001')])
+        check_formula(evaluator, formula, expected)
 
-    def test_string_literals(self) -> None:
+    @pytest.mark.parametrize('formula, expected', STRING_LITERAL_CASES)
+    def test_string_literals(self, evaluator: Evaluator, formula: str,
+                             expected: Tuple[str, Any]) -> None:
         '''
         Test when given a formula of string literals
 
-        '''
-
-        tree = PARSER.parse('="\'"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['\''])
-
-        tree = PARSER.parse('=""')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', [''])
-
-        tree = PARSER.parse('="string"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['string'])
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test
+        - formula: str - the formula to evaluate
+        - expected: Tuple[str, Any] - the expected (data, value) pair of the
+            result
 
-        tree = PARSER.parse('="123"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['123'])
-
-        tree = PARSER.parse('="this is a string with spaces"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['this is a string with spaces'])
+        '''
 
-        tree = PARSER.parse('=      "Jar Jar Binks was always supposed to'\
-                            ' be the real phantom menace"     ')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['Jar Jar Binks was always supposed '\
-                                         'to be the real phantom menace'])
+        check_formula(evaluator, formula, expected)
 
-    def test_cell_references(self) -> None:
+    def test_cell_references(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
         Test when given a formula including cell references
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '1')
-        WB.set_cell_contents('Test', 'A2', '2')
-        WB.set_cell_contents('Test', 'A3', 'string')
-        WB.set_cell_contents('Test', 'A4', '12string')
-        WB.set_cell_contents('Test', 'a5', 'DarthJarJar')
-        WB.set_cell_contents('Test', 'A6', '12.0000000')
-        WB.set_cell_contents('Test', 'A7', '\'    123')
-        WB.set_cell_contents('Test', 'A8', '=A9')
-
-        tree = PARSER.parse('=A1')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal(1)])
-
-        tree = PARSER.parse('=a1')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal(1)])
-
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal(2)])
-
-        tree = PARSER.parse('=A3')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', ["string"])
-
-        tree = PARSER.parse('=A4')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', ["12string"])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+        - evaluator: Evaluator - the Evaluator used for this test
 
-        tree = PARSER.parse('=        A4')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', ["12string"])
-
-        tree = PARSER.parse('=A4   ')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', ["12string"])
-
-        tree = PARSER.parse('=    A4   ')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', ["12string"])
-
-        tree = PARSER.parse('=A5')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', ["DarthJarJar"])
-
-        tree = PARSER.parse('=A6')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal(12)])
-
-        tree = PARSER.parse('=A7')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', ['    123'])
-
-        tree = PARSER.parse('=A8')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal(0)])
-
-    def test_string_concatenation(self) -> None:
         '''
-        Test when given a formula with the string concatenation operator
 
+        workbook.set_cell_contents('Test', 'A1', '1')
+        workbook.set_cell_contents('Test', 'A2', '2')
+        workbook.set_cell_contents('Test', 'A3', 'string')
+        workbook.set_cell_contents('Test', 'A4', '12string')
+        workbook.set_cell_contents('Test', 'a5', 'DarthJarJar')
+        workbook.set_cell_contents('Test', 'A6', '12.0000000')
+        workbook.set_cell_contents('Test', 'A7', '\'    123')
+        workbook.set_cell_contents('Test', 'A8', '=A9')
+
+        check_formula(evaluator, '=A1', ('cell_ref', D1))
+        check_formula(evaluator, '=a1', ('cell_ref', D1))
+        check_formula(evaluator, '=A2', ('cell_ref', D2))
+        check_formula(evaluator, '=A3', ('cell_ref', "string"))
+        check_formula(evaluator, '=A4', ('cell_ref', "12string"))
+        check_formula(evaluator, '=        A4', ('cell_ref', "12string"))
+        check_formula(evaluator, '=A4   ', ('cell_ref', "12string"))
+        check_formula(evaluator, '=    A4   ', ('cell_ref', "12string"))
+        check_formula(evaluator, '=A5', ('cell_ref', "DarthJarJar"))
+        check_formula(evaluator, '=A6', ('cell_ref', D12))
+        check_formula(evaluator, '=A7', ('cell_ref', '    123'))
+        check_formula(evaluator, '=A8', ('cell_ref', D0))
+
+    def test_string_concatenation(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
+        Test when given a formula with the string concatenation operator
 
-        WB.set_cell_contents('Test', 'A1', 'string1')
-        WB.set_cell_contents('Test', 'A2', 'string2')
-        WB.set_cell_contents('Test', 'A3', '="Donnie Pinkston is a goat"')
-        WB.set_cell_contents('Test', 'A4', '"string3"')
-        WB.set_cell_contents('Test', 'A5', "'Anakin")
-        WB.set_cell_contents('Test', 'A6', None)
-
-        tree = PARSER.parse('="this is "&"a string"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ["this is a string"])
-
-        tree = PARSER.parse('="this is "&A1')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ["this is string1"])
-
-        tree = PARSER.parse('=A1&A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ["string1string2"])
-
-        tree = PARSER.parse('=A1&A3')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ["string1Donnie Pinkston is a goat"])
-
-        tree = PARSER.parse('=A1&A4')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['string1"string3"'])
-
-        tree = PARSER.parse('=A1&A5')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['string1Anakin'])
-
-        tree = PARSER.parse('= A1   &  A5    ')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['string1Anakin'])
-
-        tree = PARSER.parse('=7&9')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['79'])
-
-        tree = PARSER.parse('=7&9&"string"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['79string'])
-
-        tree = PARSER.parse('=7.1&9.2&"string"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['7.19.2string'])
-
-        tree = PARSER.parse('=A1&A6')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['string1'])
-
-        tree = PARSER.parse('=Test!A1&"test"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['string1test'])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+        - evaluator: Evaluator - the Evaluator used for this test
 
-    def test_unary_operations(self) -> None:
         '''
-        Test when given a formula with a unary operator (+/-)
 
+        workbook.set_cell_contents('Test', 'A1', 'string1')
+        workbook.set_cell_contents('Test', 'A2', 'string2')
+        workbook.set_cell_contents('Test', 'A3', '="Donnie Pinkston is a goat"')
+        workbook.set_cell_contents('Test', 'A4', '"string3"')
+        workbook.set_cell_contents('Test', 'A5', "'Anakin")
+        workbook.set_cell_contents('Test', 'A6', None)
+
+        check_formula(evaluator, '="this is "&"a string"', ('string', "this is a string"))
+        check_formula(evaluator, '="this is "&A1', ('string', "this is string1"))
+        check_formula(evaluator, '=A1&A2', ('string', "string1string2"))
+        check_formula(evaluator, '=A1&A3', ('string', "string1Donnie Pinkston is a goat"))
+        check_formula(evaluator, '=A1&A4', ('string', 'string1"string3"'))
+        check_formula(evaluator, '=A1&A5', ('string', 'string1Anakin'))
+        check_formula(evaluator, '= A1   &  A5    ', ('string', 'string1Anakin'))
+        check_formula(evaluator, '=7&9', ('string', '79'))
+        check_formula(evaluator, '=7&9&"string"', ('string', '79string'))
+        check_formula(evaluator, '=7.1&9.2&"string"', ('string', '7.19.2string'))
+        check_formula(evaluator, '=A1&A6', ('string', 'string1'))
+        check_formula(evaluator, '=Test!A1&"test"', ('string', 'string1test'))
+
+    def test_unary_operations(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
+        Test when given a formula with a unary operator (+/-)
 
-        WB.set_cell_contents('Test', 'A1', '2')
-        WB.set_cell_contents('Test', 'A2', '2.2')
-        WB.set_cell_contents('Test', 'A3', '-4')
-        WB.set_cell_contents('Test', 'A4', '+25')
-        WB.set_cell_contents('Test', 'A5', None)
-
-        tree = PARSER.parse('=-34')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-34)])
-
-        tree = PARSER.parse('=-A1')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-2)])
-
-        tree = PARSER.parse('=-A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('-2.2')])
-
-        tree = PARSER.parse('=-A3')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(4)])
-
-        tree = PARSER.parse('=+A3')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-4)])
-
-        tree = PARSER.parse('=-A4')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-25)])
-
-        tree = PARSER.parse('= - A4  ')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-25)])
-
-        tree = PARSER.parse('=+A5')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(0)])
-
-        tree = PARSER.parse('=-A5')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(0)])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+        - evaluator: Evaluator - the Evaluator used for this test
 
-    def test_addition_subtraction(self) -> None:
         '''
-        Test when given a formula with an addition operator (+/-)
 
+        workbook.set_cell_contents('Test', 'A1', '2')
+        workbook.set_cell_contents('Test', 'A2', '2.2')
+        workbook.set_cell_contents('Test', 'A3', '-4')
+        workbook.set_cell_contents('Test', 'A4', '+25')
+        workbook.set_cell_contents('Test', 'A5', None)
+
+        check_formula(evaluator, '=-34', ('number', D_NEG34))
+        check_formula(evaluator, '=-A1', ('number', D_NEG2))
+        check_formula(evaluator, '=-A2', ('number', D_NEG2_2))
+        check_formula(evaluator, '=-A3', ('number', D4))
+        check_formula(evaluator, '=+A3', ('number', D_NEG4))
+        check_formula(evaluator, '=-A4', ('number', D_NEG25))
+        check_formula(evaluator, '= - A4  ', ('number', D_NEG25))
+        check_formula(evaluator, '=+A5', ('number', D0))
+        check_formula(evaluator, '=-A5', ('number', D0))
+
+    def test_addition_subtraction(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
+        Test when given a formula with an addition operator (+/-)
 
-        WB.set_cell_contents('Test', 'A1', '1')
-        WB.set_cell_contents('Test', 'A2', '=2')
-        WB.set_cell_contents('Test', 'A3', '-3.25')
-        WB.set_cell_contents('Test', 'A4', "'123")
-        WB.set_cell_contents('Test', 'A5', None)
-        WB.set_cell_contents('Test', 'A6', '=A1+A2')
-        WB.set_cell_contents('Test', 'A7', '=A1+A6')
-
-        tree = PARSER.parse('=1+1')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(2)])
-
-        tree = PARSER.parse('=A1+A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(3)])
-
-        tree = PARSER.parse('=34+A1')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(35)])
-
-        tree = PARSER.parse('=-34+A1')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-33)])
-
-        tree = PARSER.parse('=A1-A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-1)])
-
-        tree = PARSER.parse('=A3-A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-5.25)])
-
-        tree = PARSER.parse('= A3 - A2   ')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-5.25)])
-
-        tree = PARSER.parse('=A4-A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(121)])
-
-        tree = PARSER.parse('=A1+A5')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(1)])
-
-        tree = PARSER.parse('=A1-A5')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(1)])
-
-        tree = PARSER.parse('=A1+A6+A7')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(8)])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+        - evaluator: Evaluator - the Evaluator used for this test
 
-    def test_multiplication_division(self) -> None:
         '''
-        Test when given a formula with a multiplication operator (*//)
 
+        workbook.set_cell_contents('Test', 'A1', '1')
+        workbook.set_cell_contents('Test', 'A2', '=2')
+        workbook.set_cell_contents('Test', 'A3', '-3.25')
+        workbook.set_cell_contents('Test', 'A4', "'123")
+        workbook.set_cell_contents('Test', 'A5', None)
+        workbook.set_cell_contents('Test', 'A6', '=A1+A2')
+        workbook.set_cell_contents('Test', 'A7', '=A1+A6')
+
+        check_formula(evaluator, '=1+1', ('number', D2))
+        check_formula(evaluator, '=A1+A2', ('number', D3))
+        check_formula(evaluator, '=34+A1', ('number', D35))
+        check_formula(evaluator, '=-34+A1', ('number', D_NEG33))
+        check_formula(evaluator, '=A1-A2', ('number', D_NEG1))
+        check_formula(evaluator, '=A3-A2', ('number', D_NEG5_25))
+        check_formula(evaluator, '= A3 - A2   ', ('number', D_NEG5_25))
+        check_formula(evaluator, '=A4-A2', ('number', D121))
+        check_formula(evaluator, '=A1+A5', ('number', D1))
+        check_formula(evaluator, '=A1-A5', ('number', D1))
+        check_formula(evaluator, '=A1+A6+A7', ('number', D8))
+
+    def test_multiplication_division(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
+        Test when given a formula with a multiplication operator (*//)
 
-        WB.set_cell_contents('Test', 'A1', '1')
-        WB.set_cell_contents('Test', 'A2', '2')
-        WB.set_cell_contents('Test', 'A3', '-3.25')
-        WB.set_cell_contents('Test', 'A4', "'123")
-        WB.set_cell_contents('Test', 'A5', '3')
-        WB.set_cell_contents('Test', 'A6', None)
-
-        tree = PARSER.parse('=A1*A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(2)])
-
-        tree = PARSER.parse('=A1/A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(0.5)])
-
-        tree = PARSER.parse('=A2*A3')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-6.5)])
-
-        tree = PARSER.parse('=A3/A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-1.625)])
-
-        tree = PARSER.parse('=A3/A3')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(1)])
-
-        tree = PARSER.parse('=A3*A4')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(-399.75)])
-
-        tree = PARSER.parse('=A1/A5')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number',
-                              [Decimal('0.3333333333333333333333333333')])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+        - evaluator: Evaluator - the Evaluator used for this test
 
-        tree = PARSER.parse('=A1*A6')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal(0)])
+        '''
 
-    def test_comparison(self) -> None:
+        workbook.set_cell_contents('Test', 'A1', '1')
+        workbook.set_cell_contents('Test', 'A2', '2')
+        workbook.set_cell_contents('Test', 'A3', '-3.25')
+        workbook.set_cell_contents('Test', 'A4', "'123")
+        workbook.set_cell_contents('Test', 'A5', '3')
+        workbook.set_cell_contents('Test', 'A6', None)
+
+        check_formula(evaluator, '=A1*A2', ('number', D2))
+        check_formula(evaluator, '=A1/A2', ('number', D0_5))
+        check_formula(evaluator, '=A2*A3', ('number', D_NEG6_5))
+        check_formula(evaluator, '=A3/A2', ('number', D_NEG1_625))
+        check_formula(evaluator, '=A3/A3', ('number', D1))
+        check_formula(evaluator, '=A3*A4', ('number', D_NEG399_75))
+        check_formula(evaluator, '=A1/A5',
+            ('number', D0_3333333333333333333333333333))
+
+        check_formula(evaluator, '=A1*A6', ('number', D0))
+
+    def test_comparison(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
         Test when given a formula with a comparison operator
         (</<=/>/>=/=/==/!=/<>)
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', 'string1')
-        WB.set_cell_contents('Test', 'A2', 'string2')
-        WB.set_cell_contents('Test', 'A3', '=False')
-        WB.set_cell_contents('Test', 'A4', '=True')
-
-        tree = PARSER.parse('=A1<A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
-
-        tree = PARSER.parse('="a"<"["')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+        - evaluator: Evaluator - the Evaluator used for this test
 
-        tree = PARSER.parse('="a"<"["')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
-
-        tree = PARSER.parse('="BLUE"="blue"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
-
-        tree = PARSER.parse('="BLUE"<"blue"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        '''
 
-        tree = PARSER.parse('="BLUE">"blue"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        workbook.set_cell_contents('Test', 'A1', 'string1')
+        workbook.set_cell_contents('Test', 'A2', 'string2')
+        workbook.set_cell_contents('Test', 'A3', '=False')
+        workbook.set_cell_contents('Test', 'A4', '=True')
 
-        tree = PARSER.parse('=A3<A4')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        check_formula(evaluator, '=A1<A2', ('bool', True))
+        check_formula(evaluator, '="a"<"["', ('bool', False))
+        check_formula(evaluator, '="a"<"["', ('bool', False))
+        check_formula(evaluator, '="BLUE"="blue"', ('bool', True))
+        check_formula(evaluator, '="BLUE"<"blue"', ('bool', False))
+        check_formula(evaluator, '="BLUE">"blue"', ('bool', False))
+        check_formula(evaluator, '=A3<A4', ('bool', True))
 
-    def test_complex_formula(self) -> None:
+    def test_complex_formula(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
         Test when given a complex formula with parenthesis, multiple
         operators, etc.
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', 's1')
-        WB.set_cell_contents('Test', 'A2', 's2')
-        WB.set_cell_contents('Test', 'A3', '-3.25')
-        WB.set_cell_contents('Test', 'A4', "'123")
-        WB.set_cell_contents('Test', 'A5', "=A3*2")
-        WB.set_cell_contents('Test', 'A6', '1.7')
-
-        tree = PARSER.parse('=A1&A2&A1&A2&(A1&A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['s1s2s1s2s1s2'])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+        - evaluator: Evaluator - the Evaluator used for this test
 
-        tree = PARSER.parse('=A2&(1+2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['s23'])
-
-        tree = PARSER.parse('=-(2+4)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('-6')])
-
-        tree = PARSER.parse('=A1&A4&(A2&A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['s1123s2-3.25'])
-
-        tree = PARSER.parse('=A1&A2&(A4*A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['s1s2-399.75'])
-
-        tree = PARSER.parse('=Test!A1&A2&(A4*A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['s1s2-399.75'])
-
-        tree = PARSER.parse('=A3*2.00000*10')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('-65')])
-
-        tree = PARSER.parse('=-A3*2+(-A4)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('-116.5')])
-
-        tree = PARSER.parse('=A3+A5*(A6/2)+((82-A3)+7*2.04+A6)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('92.455')])
-
-        tree = PARSER.parse('=AND("True", True, 1) == AND(0, 7<3, "falSE")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
-
-        tree = PARSER.parse('=AND("True", True, OR(7, 0))')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
-
-        tree = PARSER.parse('= FALSE == AND(TRUE, FALSE)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        '''
 
-    def test_reference_same_sheet(self) -> None:
+        workbook.set_cell_contents('Test', 'A1', 's1')
+        workbook.set_cell_contents('Test', 'A2', 's2')
+        workbook.set_cell_contents('Test', 'A3', '-3.25')
+        workbook.set_cell_contents('Test', 'A4', "'123")
+        workbook.set_cell_contents('Test', 'A5', "=A3*2")
+        workbook.set_cell_contents('Test', 'A6', '1.7')
+
+        check_formula(evaluator, '=A1&A2&A1&A2&(A1&A2)', ('string', 's1s2s1s2s1s2'))
+        check_formula(evaluator, '=A2&(1+2)', ('string', 's23'))
+        check_formula(evaluator, '=-(2+4)', ('number', D_NEG6))
+        check_formula(evaluator, '=A1&A4&(A2&A3)', ('string', 's1123s2-3.25'))
+        check_formula(evaluator, '=A1&A2&(A4*A3)', ('string', 's1s2-399.75'))
+        check_formula(evaluator, '=Test!A1&A2&(A4*A3)', ('string', 's1s2-399.75'))
+        check_formula(evaluator, '=A3*2.00000*10', ('number', D_NEG65))
+        check_formula(evaluator, '=-A3*2+(-A4)', ('number', D_NEG116_5))
+        check_formula(evaluator, '=A3+A5*(A6/2)+((82-A3)+7*2.04+A6)', ('number', D92_455))
+        check_formula(evaluator, '=AND("True", True, 1) == AND(0, 7<3, "falSE")', ('bool', False))
+        check_formula(evaluator, '=AND("True", True, OR(7, 0))', ('bool', True))
+        check_formula(evaluator, '= FALSE == AND(TRUE, FALSE)', ('bool', True))
+
+    def test_reference_same_sheet(self, workbook: Workbook) -> None:
         '''
         Test when given a formula that references the same sheet
 
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+
         '''
 
-        _, name = WB.new_sheet("Sheet1")
+        _, name = workbook.new_sheet("Sheet1")
         assert name == "Sheet1"
-        WB.set_cell_contents(name, "A1", "1")
-        WB.set_cell_contents(name, "B2", "=Sheet1!A1")
-        contents = WB.get_cell_contents(name, "A1")
+        workbook.set_cell_contents(name, "A1", "1")
+        workbook.set_cell_contents(name, "B2", "=Sheet1!A1")
+        contents = workbook.get_cell_contents(name, "A1")
         assert contents == "1"
-        contents = WB.get_cell_contents(name, "B2")
+        contents = workbook.get_cell_contents(name, "B2")
         assert contents == "=Sheet1!A1"
-        value = WB.get_cell_value(name, "A1")
-        assert value == Decimal(1)
-        value = WB.get_cell_value(name, "B2")
-        assert value == Decimal(1)
-
-        _, name = WB.new_sheet("Sheet2")
-        WB.set_cell_contents(name, "A1", "1")
-        WB.set_cell_contents(name, "B2", "=shEet2!A1")
-        contents = WB.get_cell_contents(name, "A1")
+        value = workbook.get_cell_value(name, "A1")
+        assert value == D1
+        value = workbook.get_cell_value(name, "B2")
+        assert value == D1
+
+        _, name = workbook.new_sheet("Sheet2")
+        workbook.set_cell_contents(name, "A1", "1")
+        workbook.set_cell_contents(name, "B2", "=shEet2!A1")
+        contents = workbook.get_cell_contents(name, "A1")
         assert contents == "1"
-        contents = WB.get_cell_contents(name, "B2")
+        contents = workbook.get_cell_contents(name, "B2")
         assert contents == "=shEet2!A1"
-        value = WB.get_cell_value(name, "A1")
-        assert value == Decimal(1)
-        value = WB.get_cell_value(name, "B2")
-        assert value == Decimal(1)
+        value = workbook.get_cell_value(name, "A1")
+        assert value == D1
+        value = workbook.get_cell_value(name, "B2")
+        assert value == D1
 
-        _, name = WB.new_sheet("Other Totals")
+        _, name = workbook.new_sheet("Other Totals")
         assert name == "Other Totals"
-        WB.set_cell_contents(name, "A1", "1")
-        WB.set_cell_contents(name, "B2", "='Other Totals'!A1")
-        contents = WB.get_cell_contents(name, "A1")
+        workbook.set_cell_contents(name, "A1", "1")
+        workbook.set_cell_contents(name, "B2", "='Other Totals'!A1")
+        contents = workbook.get_cell_contents(name, "A1")
         assert contents == "1"
-        contents = WB.get_cell_contents(name, "B2")
+        contents = workbook.get_cell_contents(name, "B2")
         assert contents == "='Other Totals'!A1"
-        value = WB.get_cell_value(name, "A1")
-        assert value == Decimal(1)
-        value = WB.get_cell_value(name, "B2")
-        assert value == Decimal(1)
+        value = workbook.get_cell_value(name, "A1")
+        assert value == D1
+        value = workbook.get_cell_value(name, "B2")
+        assert value == D1
 
-        WB.set_cell_contents(name, "C3", "='Other Totals'!A1+'Other Totals'!B2")
-        contents = WB.get_cell_contents(name, "C3")
+        workbook.set_cell_contents(name, "C3", "='Other Totals'!A1+'Other Totals'!B2")
+        contents = workbook.get_cell_contents(name, "C3")
         assert contents == "='Other Totals'!A1+'Other Totals'!B2"
-        value = WB.get_cell_value(name, "C3")
-        assert value == Decimal(2)
-        WB.set_cell_contents(name, "A1", "2")
-        contents = WB.get_cell_contents(name, "A1")
+        value = workbook.get_cell_value(name, "C3")
+        assert value == D2
+        workbook.set_cell_contents(name, "A1", "2")
+        contents = workbook.get_cell_contents(name, "A1")
         assert contents == "2"
-        contents = WB.get_cell_contents(name, "C3")
+        contents = workbook.get_cell_contents(name, "C3")
         assert contents == "='Other Totals'!A1+'Other Totals'!B2"
-        value = WB.get_cell_value(name, "A1")
-        assert value == Decimal(2)
-        value = WB.get_cell_value(name, "C3")
-        assert value == Decimal(4)
+        value = workbook.get_cell_value(name, "A1")
+        assert value == D2
+        value = workbook.get_cell_value(name, "C3")
+        assert value == D4
 
-    def test_reference_other_sheet(self) -> None:
+    def test_reference_other_sheet(self, workbook: Workbook) -> None:
         '''
         Test when given a formula that references another sheet
 
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test
+
         '''
 
-        _, name = WB.new_sheet("June Totals")
+        _, name = workbook.new_sheet("June Totals")
         assert name == "June Totals"
-        _, name = WB.new_sheet("July Totals")
+        _, name = workbook.new_sheet("July Totals")
         assert name == "July Totals"
 
-        WB.set_cell_contents("June Totals", "A1", "1")
-        WB.set_cell_contents("June Totals", "A2", "2")
-        WB.set_cell_contents("July Totals", "B2", "='June Totals'!A1")
-        contents = WB.get_cell_contents("June Totals", "A1")
+        workbook.set_cell_contents("June Totals", "A1", "1")
+        workbook.set_cell_contents("June Totals", "A2", "2")
+        workbook.set_cell_contents("July Totals", "B2", "='June Totals'!A1")
+        contents = workbook.get_cell_contents("June Totals", "A1")
         assert contents == "1"
-        contents = WB.get_cell_contents("June Totals", "A2")
+        contents = workbook.get_cell_contents("June Totals", "A2")
         assert contents == "2"
-        contents = WB.get_cell_contents("July Totals", "B2")
+        contents = workbook.get_cell_contents("July Totals", "B2")
         assert contents == "='June Totals'!A1"
-        value = WB.get_cell_value("June Totals", "A1")
-        assert value == Decimal(1)
-        value = WB.get_cell_value("June Totals", "A2")
-        assert value == Decimal(2)
-        value = WB.get_cell_value("July Totals", "B2")
-        assert value == Decimal(1)
-
-        WB.set_cell_contents("June Totals", "B2", "=A2")
-        contents = WB.get_cell_contents("June Totals", "B2")
+        value = workbook.get_cell_value("June Totals", "A1")
+        assert value == D1
+        value = workbook.get_cell_value("June Totals", "A2")
+        assert value == D2
+        value = workbook.get_cell_value("July Totals", "B2")
+        assert value == D1
+
+        workbook.set_cell_contents("June Totals", "B2", "=A2")
+        contents = workbook.get_cell_contents("June Totals", "B2")
         assert contents == "=A2"
-        value = WB.get_cell_value("June Totals", "B2")
-        assert value == Decimal(2)
+        value = workbook.get_cell_value("June Totals", "B2")
+        assert value == D2
 
-        WB.set_cell_contents("June Totals", "B1", "='August Totals'!A1+3")
-        WB.new_sheet("August Totals")
-        contents = WB.get_cell_contents("June Totals", "B1")
+        workbook.set_cell_contents("June Totals", "B1", "='August Totals'!A1+3")
+        workbook.new_sheet("August Totals")
+        contents = workbook.get_cell_contents("June Totals", "B1")
         assert contents == "='August Totals'!A1+3"
-        value = WB.get_cell_value("June Totals", "B1")
-        assert value == Decimal(3)
-        WB.set_cell_contents("August Totals", "A1", "1")
-        contents = WB.get_cell_contents("June Totals", "B1")
+        value = workbook.get_cell_value("June Totals", "B1")
+        assert value == D3
+        workbook.set_cell_contents("August Totals", "A1", "1")
+        contents = workbook.get_cell_contents("June Totals", "B1")
         assert contents == "='August Totals'!A1+3"
-        value = WB.get_cell_value("June Totals", "B1")
-        assert value == Decimal(4)
-
-        WB.del_sheet("August Totals")
-        WB.set_cell_contents("June Totals", "B3", "='June Totals'!B1+August!A1")
-        WB.new_sheet("August Totals")
-        WB.new_sheet("August")
-        contents = WB.get_cell_contents("June Totals", "B3")
+        value = workbook.get_cell_value("June Totals", "B1")
+        assert value == D4
+
+        workbook.del_sheet("August Totals")
+        workbook.set_cell_contents("June Totals", "B3", "='June Totals'!B1+August!A1")
+        workbook.new_sheet("August Totals")
+        workbook.new_sheet("August")
+        contents = workbook.get_cell_contents("June Totals", "B3")
         assert contents == "='June Totals'!B1+August!A1"
-        value = WB.get_cell_value("June Totals", "B3")
-        assert value == Decimal(3)
-        WB.set_cell_contents("August Totals", "A1", "1")
-        contents = WB.get_cell_contents("June Totals", "B3")
+        value = workbook.get_cell_value("June Totals", "B3")
+        assert value == D3
+        workbook.set_cell_contents("August Totals", "A1", "1")
+        contents = workbook.get_cell_contents("June Totals", "B3")
         assert contents == "='June Totals'!B1+August!A1"
-        value = WB.get_cell_value("June Totals", "B3")
-        assert value == Decimal(4)
+        value = workbook.get_cell_value("June Totals", "B3")
+        assert value == D4
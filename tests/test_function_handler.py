@@ -5,45 +5,244 @@ Tests the Function Handler module found at ../sheets/function_handler.py.
 Focuses on functionality verificiation of the supported function names.
 
 GLOBAL_VARIABLES:
-- WB (Workbook) - the Workbook used for this test suite
-- EVALUATOR (Evaluator) - the Evaluator used for this test suite
+- pytestmark (MarkDecorator) - keeps this suite on one pytest-xdist worker
 - PARSER (Any) - the Parser used for this test suite
+- D_NEG100, D0, D1, D4, D5, D6_8, D12, D34, D130 (Decimal) - shared Decimal
+  constants for expected numbers
+- AND_CASES (List[Tuple[str, Expected]]) - formula/result pairs for AND
+- OR_CASES (List[Tuple[str, Expected]]) - formula/result pairs for OR
+- NOT_CASES (List[Tuple[str, Expected]]) - formula/result pairs for NOT
+- XOR_CASES (List[Tuple[str, Expected]]) - formula/result pairs for XOR
+- EXACT_CASES (List[Tuple[str, Expected]]) - formula/result pairs for EXACT
+- IF_CASES (List[Tuple[str, Expected]]) - formula/result pairs for IF
+- IFERROR_CASES (List[Tuple[str, Expected]]) - formula/result pairs for
+  IFERROR
+- CHOOSE_CASES (List[Tuple[str, Expected]]) - formula/result pairs for CHOOSE
+- ISBLANK_CASES (List[Tuple[str, Expected]]) - formula/result pairs for
+  ISBLANK
+- ISERROR_CASES (List[Tuple[str, Expected]]) - formula/result pairs for
+  ISERROR
+- INDIRECT_CASES (List[Tuple[str, Expected]]) - formula/result pairs for
+  INDIRECT of non-reference values
+- NO_ARGUMENT_FUNCTIONS (List[str]) - functions that are a type error when
+  called without arguments
+- EMPTY_CALLS (Dict[str, Tree]) - prebuilt parse trees of '=NAME()' for each
+  of NO_ARGUMENT_FUNCTIONS and for VERSION
+
+Fixtures:
+- logic_cells(FixtureRequest, Workbook) -> None
+
+The workbook, evaluator and setup_block fixtures and the check_formula and
+check_result helpers are shared from conftest.py.
 
 Classes:
 - TestFunctionHandler
 
     Methods:
-    - test_and(object) -> None
-    - test_or(object) -> None
-    - test_not(object) -> None
-    - test_xor(object) -> None
-    - test_exact(object) -> None
-    - test_if(object) -> None
-    - test_iferror(object) -> None
-    - test_choose(object) -> None
-    - test_isblank(object) -> None
-    - test_iserror(object) -> None
-    - test_version(object) -> None
-    - test_indirect(object) -> None
-    - test_indirect2(object) -> None
-    - test_common_math(object) -> None
+    - test_no_arguments(object, Evaluator, str) -> None
+    - test_empty_call_trees(object, str) -> None
+    - test_and(object, Evaluator, str, Expected) -> None
+    - test_and_concat(object, Workbook, Evaluator) -> None
+    - test_or(object, Evaluator, str, Expected) -> None
+    - test_not(object, Evaluator, str, Expected) -> None
+    - test_xor(object, Evaluator, str, Expected) -> None
+    - test_exact(object, Evaluator, str, Expected) -> None
+    - test_exact_circular(object, Workbook, Evaluator, SetupBlock) -> None
+    - test_if(object, Evaluator, str, Expected) -> None
+    - test_if_circular(object, Workbook, Evaluator, SetupBlock) -> None
+    - test_iferror(object, Evaluator, str, Expected) -> None
+    - test_iferror_circular(object, Workbook, Evaluator, SetupBlock) -> None
+    - test_choose(object, Evaluator, str, Expected) -> None
+    - test_choose_circular(object, Workbook, Evaluator, SetupBlock) -> None
+    - test_isblank(object, Evaluator, str, Expected) -> None
+    - test_isblank_circular(object, Workbook, Evaluator, SetupBlock) -> None
+    - test_iserror(object, Evaluator, str, Expected) -> None
+    - test_iserror_circular(object, Workbook, Evaluator, SetupBlock) -> None
+    - test_version(object, Evaluator) -> None
+    - test_indirect(object, Workbook, Evaluator) -> None
+    - test_indirect2(object, Evaluator, str, Expected) -> None
+    - test_common_math(object, Workbook, Evaluator) -> None
 
 '''
 
 from decimal import Decimal
 
-from lark import Lark, Tree
+import pytest
+from lark import Token, Tree
 
 # pylint: disable=unused-import, import-error
 import context
+from conftest import Expected, SetupBlock, check_formula, check_result
+from sheets.cell import Cell
 from sheets.evaluator import Evaluator
-from sheets import Workbook, CellError, CellErrorType, version
+from sheets import Workbook, CellErrorType, version
+
+
+# the parse cache is per process, so under pytest-xdist (--dist
+# loadgroup) every test in this module runs on the same worker to reuse it
+pytestmark = pytest.mark.xdist_group('function_handler')
+
+# use the package's own formula parser rather than building a second copy of
+# the LALR tables for the tests.  Parsing and evaluation are deliberately kept
+# as two passes (no inline transformer=): parse trees are cached by
+# parse_formula and re-evaluated against each test's own Evaluator, which a
+# parser bound to a single Evaluator instance could not do
+PARSER = Cell.PARSER
+
+# expected numbers are shared Decimal constants named after their value,
+# with D_NEG for negatives and _ for the decimal point
+D_NEG100 = Decimal('-100')
+D0 = Decimal('0')
+D1 = Decimal('1')
+D4 = Decimal('4')
+D5 = Decimal('5')
+D6_8 = Decimal('6.8')
+D12 = Decimal('12')
+D34 = Decimal('34')
+D130 = Decimal('130')
+
+AND_CASES = [
+    ('=AND(0, "string")', CellErrorType.TYPE_ERROR),
+    ('=AND(True, 4)', ('bool', True)),
+    ('=AND("true", 7==7, A1, A3)', ('bool', True)),
+    ('=and("true", 7==7, A2)', ('bool', False)),
+    ('=and("true")', ('bool', True)),
+    ('=and(Test!A4)', ('bool', False)),
+    ('=and("Test!A3")', CellErrorType.TYPE_ERROR),
+    ('=and(False, #REF!)', CellErrorType.BAD_REFERENCE),
+    ('=AND(False, "string")', CellErrorType.TYPE_ERROR),
+    ('=AND(A2, 1/0)', CellErrorType.DIVIDE_BY_ZERO),
+    ('=AND(' + ', '.join(['A1'] * 100) + ')', ('bool', True)),
+    ('=AND(' + ', '.join(['A1'] * 99 + ['A2']) + ')', ('bool', False))
+]
+
+OR_CASES = [
+    ('=OR(1, "string")', CellErrorType.TYPE_ERROR),
+    ('=OR(False, 4)', ('bool', True)),
+    ('=OR("false", 7==8, A2)', ('bool', False)),
+    ('=OR("FaLSe", 7==8, A2, AND(A1, A3))', ('bool', True)),
+    ('=or(True, #REF!)', CellErrorType.BAD_REFERENCE),
+    ('=OR(True, "string")', CellErrorType.TYPE_ERROR),
+    ('=OR(A1, 1/0)', CellErrorType.DIVIDE_BY_ZERO),
+    ('=OR(' + ', '.join(['A2'] * 99 + ['A1']) + ')', ('bool', True))
+]
+
+NOT_CASES = [
+    ('=NOT("string")', CellErrorType.TYPE_ERROR),
+    ('=NOT(False, 4)', CellErrorType.TYPE_ERROR),
+    ('=NOT(False)', ('bool', True)),
+    ('=NOT(7==7)', ('bool', False)),
+    ('=NOT(AND("FaLSe", 7==8, A1, A2, A3))', ('bool', True)),
+    ('=not(#REF!)', CellErrorType.BAD_REFERENCE)
+]
+
+XOR_CASES = [
+    ('=XOR(1, "string")', CellErrorType.TYPE_ERROR),
+    ('=XOR(False, 4)', ('bool', True)),
+    ('=XOR("false", 7==8, A2)', ('bool', False)),
+    ('=XOR("FaLSe", 7==8, A2, AND(A1, A3))', ('bool', True)),
+    ('=XOR("FaLSe", 7==7, A2, AND(A1, A3))', ('bool', False)),
+    ('=XOR("tRUe", 7==7, NOT(A2), XOR(A1, A3))', ('bool', True)),
+    ('=xor(True, #REF!)', CellErrorType.BAD_REFERENCE),
+    ('=XOR(' + ', '.join(['A1'] * 100) + ')', ('bool', False)),
+    ('=XOR(' + ', '.join(['A1'] * 99) + ')', ('bool', True))
+]
+
+EXACT_CASES = [
+    ('=EXACT("string")', CellErrorType.TYPE_ERROR),
+    ('=EXACT(False, 4, 10)', CellErrorType.TYPE_ERROR),
+    ('=EXACT(False, "FALSE")', ('bool', True)),
+    ('=EXACT(A1, "True")', ('bool', False)),
+    ('=EXACT(A2, "")', ('bool', True)),
+    ('=EXACT(A3, "0")', ('bool', True)),
+    ('=EXACT(#REF!, #REF!)', CellErrorType.BAD_REFERENCE)
+]
+
+IF_CASES = [
+    ('=IF("string", A1)', CellErrorType.TYPE_ERROR),
+    ('=IF(False)', CellErrorType.TYPE_ERROR),
+    ('=iF(False, True, "false", 12)', CellErrorType.TYPE_ERROR),
+    ('=IF(False, 12)', ('bool', False)),
+    ('=IF(7==7, 12)', ('number', D12)),
+    ('=IF(EXACT(7==8, A2), "string1", #REF!)', ('string', "string1")),
+    ('=IF(AND("FaLSe", 7==8, A1, A2, A3), "0", A3)', ('cell_ref', D0)),
+    ('=IF(#REF!, A1)', CellErrorType.BAD_REFERENCE),
+    ('=IF(True, Aaa122)', ('cell_ref', D0))
+]
+
+IFERROR_CASES = [
+    ('=IFERROR("string", A1, 0)', CellErrorType.TYPE_ERROR),
+    ('=IFERROR(A1)', ('string', "")),
+    ('=IFERROR(A1, 12)', ('number', D12)),
+    ('=IFERROR("#REF!")', ('string', "#REF!")),
+    ('=IFERROR(A2, #REF!)', ('cell_ref', False)),
+    ('=IFERROR(ZZ201)', ('cell_ref', D0))
+]
+
+CHOOSE_CASES = [
+    ('=CHOOSE(0, A1, 0)', CellErrorType.TYPE_ERROR),
+    ('=CHOOSE(1.5, A1, 0)', CellErrorType.TYPE_ERROR),
+    ('=CHOOSE(3, A1, 0)', CellErrorType.TYPE_ERROR),
+    ('=CHOOSE(A1, 1, 12)', ('number', D12)),
+    ('=CHOOSE(A2, "string1", #REF!)', ('string', "string1")),
+    ('=CHOOSE(A3+1, A2, A1)', ('cell_ref', True))
+]
+
+ISBLANK_CASES = [
+    ('=ISBLANK("string", A1)', CellErrorType.TYPE_ERROR),
+    ('=ISBLANK("")', ('bool', False)),
+    ('=ISBLANK(A1)', ('bool', True)),
+    ('=ISBLANK(A2)', ('bool', False)),
+    ('=ISBLANK(A3)', ('bool', False))
+]
+
+ISERROR_CASES = [
+    ('=ISERROR("string", A1)', CellErrorType.TYPE_ERROR),
+    ('=ISERROR("A1+")', ('bool', False)),
+    ('=ISERROR(A1)', ('bool', False)),
+    ('=ISERROR(A2)', ('bool', True)),
+    ('=ISERROR(A3)', ('bool', True))
+]
+
+INDIRECT_CASES = [
+    ('=INDIRECT(123)', CellErrorType.BAD_REFERENCE),
+    ('=INDIRECT(True)', CellErrorType.BAD_REFERENCE),
+    ('=INDIRECT(AND(1))', CellErrorType.BAD_REFERENCE)
+]
+
+NO_ARGUMENT_FUNCTIONS = [
+    'AND', 'OR', 'NOT', 'XOR', 'EXACT', 'IF', 'IFERROR', 'CHOOSE', 'ISBLANK',
+    'ISERROR', 'INDIRECT'
+]
+
+# '=NAME()' always parses to the same shape, so build those trees directly
+EMPTY_CALLS = {
+    func_name: Tree('func_expr', [Token('FUNC_NAME', f'{func_name}('), Tree('args_expr', [])])
+    for func_name in NO_ARGUMENT_FUNCTIONS + ['VERSION']
+}
+
+
+@pytest.fixture
+def logic_cells(request: pytest.FixtureRequest, workbook: Workbook) -> None:
+    '''
+    Populate A1, A2 and A3 of the test sheet with the values the function
+    tests start from
+
+    By default A1, A2 and A3 hold '=True', '=False' and '=1'.  Any of them can
+    be overridden through indirect parametrization with a dict mapping the
+    location to its contents, so each variant is set once per test rather than
+    repeated at the top of every test body.
 
+    Arguments:
+    - request: FixtureRequest - the requesting test context
+    - workbook: Workbook - the Workbook used for this test suite
+
+    '''
+
+    contents = {'A1': '=True', 'A2': '=False', 'A3': '=1'}
+    contents.update(getattr(request, 'param', {}))
+    workbook.set_cell_contents_bulk('Test', contents.items())
 
-WB = Workbook()
-WB.new_sheet('Test')
-EVALUATOR = Evaluator(WB, 'Test')
-PARSER = Lark.open('../sheets/formulas.lark', start='formula', rel_to=__file__, parser='lalr')
 
 class TestFunctionHandler:
     '''
@@ -51,710 +250,480 @@ class TestFunctionHandler:
 
     '''
 
-    def test_and(self) -> None:
+    @pytest.mark.parametrize('func_name', NO_ARGUMENT_FUNCTIONS)
+    def test_no_arguments(self, evaluator: Evaluator, func_name: str) -> None:
         '''
-        Test AND logic
+        Test that calling a function without arguments is a type error
 
-        '''
+        These calls all take the same argument count check, so they are kept
+        in one table instead of being repeated in every function's test.
 
-        WB.set_cell_contents('Test', 'A1', '=True')
-        WB.set_cell_contents('Test', 'A2', '=False')
-        WB.set_cell_contents('Test', 'A3', '=1')
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - func_name: str - name of the function to call
 
-        tree = PARSER.parse('=AND()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        '''
 
-        tree = PARSER.parse('=AND(0, "string")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        check_result(evaluator.transform(EMPTY_CALLS[func_name]), CellErrorType.TYPE_ERROR)
 
-        tree = PARSER.parse('=AND(True, 4)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+    @pytest.mark.parametrize('func_name', list(EMPTY_CALLS))
+    def test_empty_call_trees(self, func_name: str) -> None:
+        '''
+        Test that the prebuilt '=NAME()' trees match what the parser produces
 
-        tree = PARSER.parse('=AND("true", 7==7, A1, A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        Arguments:
+        - func_name: str - name of the function to call
 
-        tree = PARSER.parse('=and("true", 7==7, A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        '''
 
-        tree = PARSER.parse('=and("true")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        assert PARSER.parse(f'={func_name}()') == EMPTY_CALLS[func_name]
 
-        tree = PARSER.parse('=and(Test!A4)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('formula, expected', AND_CASES)
+    def test_and(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
+        '''
+        Test AND logic
 
-        tree = PARSER.parse('=and("Test!A3")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result
 
-        tree = PARSER.parse('=and(False, #REF!)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        '''
 
-        WB.set_cell_contents('Test', 'A1', '\'tru')
-        tree = PARSER.parse('=A1&"e"')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ['true'])
+        check_formula(evaluator, formula, expected)
 
-        tree = PARSER.parse('=AND(A1&"e")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+    def test_and_concat(self, workbook: Workbook, evaluator: Evaluator) -> None:
+        '''
+        Test AND logic on a concatenated argument
 
-        tree = PARSER.parse('=AND (A1&"e")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
 
-    def test_or(self) -> None:
         '''
-        Test OR logic
 
+        workbook.set_cell_contents('Test', 'A1', '\'tru')
+        for formula, expected in [
+            ('=A1&"e"', ('string', 'true')),
+            ('=AND(A1&"e")', ('bool', True)),
+            ('=AND (A1&"e")', ('bool', True))
+        ]:
+            check_formula(evaluator, formula, expected)
+
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('formula, expected', OR_CASES)
+    def test_or(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
+        Test OR logic
 
-        WB.set_cell_contents('Test', 'A1', '=True')
-        WB.set_cell_contents('Test', 'A2', '=False')
-        WB.set_cell_contents('Test', 'A3', '=1')
-
-        tree = PARSER.parse('=OR()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=OR(1, "string")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=OR(False, 4)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
-
-        tree = PARSER.parse('=OR("false", 7==8, A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result
 
-        tree = PARSER.parse('=OR("FaLSe", 7==8, A2, AND(A1, A3))')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        '''
 
-        tree = PARSER.parse('=or(True, #REF!)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        check_formula(evaluator, formula, expected)
 
-    def test_not(self) -> None:
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A3': '=0'}], indirect=True)
+    @pytest.mark.parametrize('formula, expected', NOT_CASES)
+    def test_not(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
         Test NOT logic
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '=True')
-        WB.set_cell_contents('Test', 'A2', '=False')
-        WB.set_cell_contents('Test', 'A3', '=0')
-
-        tree = PARSER.parse('=NOT()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=NOT("string")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=NOT(False, 4)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=NOT(False)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result
 
-        tree = PARSER.parse('=NOT(7==7)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
-
-        tree = PARSER.parse('=NOT(AND("FaLSe", 7==8, A1, A2, A3))')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        '''
 
-        tree = PARSER.parse('=not(#REF!)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        check_formula(evaluator, formula, expected)
 
-    def test_xor(self) -> None:
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('formula, expected', XOR_CASES)
+    def test_xor(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
         Test XOR logic
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '=True')
-        WB.set_cell_contents('Test', 'A2', '=False')
-        WB.set_cell_contents('Test', 'A3', '=1')
-
-        tree = PARSER.parse('=XOR()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=XOR(1, "string")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=XOR(False, 4)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result
 
-        tree = PARSER.parse('=XOR("false", 7==8, A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
-
-        tree = PARSER.parse('=XOR("FaLSe", 7==8, A2, AND(A1, A3))')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
-
-        tree = PARSER.parse('=XOR("FaLSe", 7==7, A2, AND(A1, A3))')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
-
-        tree = PARSER.parse('=XOR("tRUe", 7==7, NOT(A2), XOR(A1, A3))')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        '''
 
-        tree = PARSER.parse('=xor(True, #REF!)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        check_formula(evaluator, formula, expected)
 
-    def test_exact(self) -> None:
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A2': '', 'A3': '=0'}], indirect=True)
+    @pytest.mark.parametrize('formula, expected', EXACT_CASES)
+    def test_exact(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
         Test EXACT logic
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '=True')
-        WB.set_cell_contents('Test', 'A2', '')
-        WB.set_cell_contents('Test', 'A3', '=0')
-
-        tree = PARSER.parse('=EXACT()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result
 
-        tree = PARSER.parse('=EXACT("string")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=EXACT(False, 4, 10)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=EXACT(False, "FALSE")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        '''
 
-        tree = PARSER.parse('=EXACT(A1, "True")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        check_formula(evaluator, formula, expected)
 
-        tree = PARSER.parse('=EXACT(A2, "")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+    def test_exact_circular(self, workbook: Workbook, evaluator: Evaluator,
+                            setup_block: SetupBlock) -> None:
+        '''
+        Test EXACT logic within a reference cycle
 
-        tree = PARSER.parse('=EXACT(A3, "0")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - setup_block: SetupBlock - gives the block the cells are set in
 
-        tree = PARSER.parse('=EXACT(#REF!, #REF!)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        '''
 
-        WB.set_cell_contents('Test', 'A2', '=A3')
-        WB.set_cell_contents('Test', 'A3', '=EXACT(#REF!, A2)')
-        tree = PARSER.parse('=A3')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.CIRCULAR_REFERENCE
+        with setup_block(workbook):
+            workbook.set_cell_contents('Test', 'A2', '=A3')
+            workbook.set_cell_contents('Test', 'A3', '=EXACT(#REF!, A2)')
+        check_formula(evaluator, '=A3', CellErrorType.CIRCULAR_REFERENCE)
 
-    def test_if(self) -> None:
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A3': '=0'}], indirect=True)
+    @pytest.mark.parametrize('formula, expected', IF_CASES)
+    def test_if(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
         Test IF logic
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '=True')
-        WB.set_cell_contents('Test', 'A2', '=False')
-        WB.set_cell_contents('Test', 'A3', '=0')
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result
 
-        tree = PARSER.parse('=IF("string", A1)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=IF(False)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=iF(False, True, "false", 12)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=IF(False, 12)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
-
-        tree = PARSER.parse('=IF(7==7, 12)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('12')])
+        '''
 
-        tree = PARSER.parse('=IF(EXACT(7==8, A2), "string1", #REF!)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ["string1"])
+        check_formula(evaluator, formula, expected)
 
-        tree = PARSER.parse('=IF(AND("FaLSe", 7==8, A1, A2, A3), "0", A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal('0')])
+    def test_if_circular(self, workbook: Workbook, evaluator: Evaluator,
+                         setup_block: SetupBlock) -> None:
+        '''
+        Test IF logic within and around reference cycles
 
-        WB.set_cell_contents('Test', 'A1', '=A2+1')
-        WB.set_cell_contents('Test', 'A2', '=IF(OR(True, 0), A1+1, A3+1)')
-        WB.set_cell_contents('Test', 'A3', '=1+2')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.CIRCULAR_REFERENCE
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - setup_block: SetupBlock - gives the block the cells are set in
 
-        WB.set_cell_contents('Test', 'A2', '=IF(AND(True, 0), A1+1, A3+1)')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal('4')])
+        '''
 
-        WB.set_cell_contents('Test', 'A2', '=IF(AND(True, 0), A1+1)')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [False])
+        with setup_block(workbook):
+            workbook.set_cell_contents('Test', 'A1', '=A2+1')
+            workbook.set_cell_contents('Test', 'A2', '=IF(OR(True, 0), A1+1, A3+1)')
+            workbook.set_cell_contents('Test', 'A3', '=1+2')
+        check_formula(evaluator, '=A2', CellErrorType.CIRCULAR_REFERENCE)
 
-        tree = PARSER.parse('=IF(#REF!, A1)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        workbook.set_cell_contents('Test', 'A2', '=IF(AND(True, 0), A1+1, A3+1)')
+        check_formula(evaluator, '=A2', ('cell_ref', D4))
 
-        tree = PARSER.parse('=IF(True, Aaa122)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal('0')])
+        workbook.set_cell_contents('Test', 'A2', '=IF(AND(True, 0), A1+1)')
+        check_formula(evaluator, '=A2', ('cell_ref', False))
 
-    def test_iferror(self) -> None:
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A1': '=IFERROR()', 'A3': '=0'}], indirect=True)
+    @pytest.mark.parametrize('formula, expected', IFERROR_CASES)
+    def test_iferror(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
         Test IFERROR logic
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '=IFERROR()')
-        WB.set_cell_contents('Test', 'A2', '=False')
-        WB.set_cell_contents('Test', 'A3', '=0')
-
-        tree = PARSER.parse('=IFERROR()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result
 
-        tree = PARSER.parse('=IFERROR("string", A1, 0)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=IFERROR(A1)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', [""])
+        '''
 
-        tree = PARSER.parse('=IFERROR(A1, 12)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('12')])
+        check_formula(evaluator, formula, expected)
 
-        tree = PARSER.parse('=IFERROR("#REF!")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ["#REF!"])
+    def test_iferror_circular(self, workbook: Workbook, evaluator: Evaluator,
+                              setup_block: SetupBlock) -> None:
+        '''
+        Test IFERROR logic within and around reference cycles
 
-        tree = PARSER.parse('=IFERROR(A2, #REF!)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [False])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - setup_block: SetupBlock - gives the block the cells are set in
 
-        WB.set_cell_contents('Test', 'A1', '=A2+1')
-        WB.set_cell_contents('Test', 'A2', '=IFERROR(A1+1, A3+1)')
-        WB.set_cell_contents('Test', 'A3', '=1+2')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.CIRCULAR_REFERENCE
+        '''
 
-        WB.set_cell_contents('Test', 'A2', '=IFERROR(A1+#REF!, A3+1)')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal('4')])
+        with setup_block(workbook):
+            workbook.set_cell_contents('Test', 'A1', '=A2+1')
+            workbook.set_cell_contents('Test', 'A2', '=IFERROR(A1+1, A3+1)')
+            workbook.set_cell_contents('Test', 'A3', '=1+2')
+        check_formula(evaluator, '=A2', CellErrorType.CIRCULAR_REFERENCE)
 
-        WB.set_cell_contents('Test', 'A2', '=IFERROR(A1+#REF!)')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [""])
+        workbook.set_cell_contents('Test', 'A2', '=IFERROR(A1+#REF!, A3+1)')
+        check_formula(evaluator, '=A2', ('cell_ref', D4))
 
-        tree = PARSER.parse('=IFERROR(ZZ201)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal('0')])
+        workbook.set_cell_contents('Test', 'A2', '=IFERROR(A1+#REF!)')
+        check_formula(evaluator, '=A2', ('cell_ref', ""))
 
-    def test_choose(self) -> None:
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A1': '2', 'A2': '=True', 'A3': '=0'}],
+                             indirect=True)
+    @pytest.mark.parametrize('formula, expected', CHOOSE_CASES)
+    def test_choose(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
         Test CHOOSE logic
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '2')
-        WB.set_cell_contents('Test', 'A2', '=True')
-        WB.set_cell_contents('Test', 'A3', '=0')
-
-        tree = PARSER.parse('=CHOOSE(0, A1, 0)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=CHOOSE(1.5, A1, 0)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=CHOOSE(3, A1, 0)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=CHOOSE(A1, 1, 12)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('number', [Decimal('12')])
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result of the formula
 
-        tree = PARSER.parse('=CHOOSE(A2, "string1", #REF!)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', ["string1"])
-
-        tree = PARSER.parse('=CHOOSE(A3+1, A2, A1)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [True])
-
-        WB.set_cell_contents('Test', 'A1', '=A2+1')
-        WB.set_cell_contents('Test', 'A2', '=CHOOSE("1", A1+1, 2+1, A3+1)')
-        WB.set_cell_contents('Test', 'A3', '=1+2')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.CIRCULAR_REFERENCE
-
-        WB.set_cell_contents('Test', 'A2', '=CHOOSE(2+1, A1+1, 2+1, A3+1)')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal('4')])
+        '''
 
-        WB.set_cell_contents('Test', 'A1', '=A1')
-        WB.set_cell_contents('Test', 'A2', '=CHOOSE(3, 0, A1)')
-        tree = PARSER.parse('=A2')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        check_formula(evaluator, formula, expected)
 
-        tree = PARSER.parse('=CHOOSE(#REF!, A1)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A1': '2', 'A2': '=True', 'A3': '=0'}],
+                             indirect=True)
+    def test_choose_circular(self, workbook: Workbook, evaluator: Evaluator,
+                             setup_block: SetupBlock) -> None:
+        '''
+        Test CHOOSE logic within and around a reference cycle
 
-        tree = PARSER.parse('=CHOOSE(1, Abcd1233)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal('0')])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - setup_block: SetupBlock - gives the block the cells are set in
 
-    def test_isblank(self) -> None:
         '''
-        Test ISBLANK logic
 
+        with setup_block(workbook):
+            workbook.set_cell_contents('Test', 'A1', '=A2+1')
+            workbook.set_cell_contents('Test', 'A2', '=CHOOSE("1", A1+1, 2+1, A3+1)')
+            workbook.set_cell_contents('Test', 'A3', '=1+2')
+        check_formula(evaluator, '=A2', CellErrorType.CIRCULAR_REFERENCE)
+
+        workbook.set_cell_contents('Test', 'A2', '=CHOOSE(2+1, A1+1, 2+1, A3+1)')
+        check_formula(evaluator, '=A2', ('cell_ref', D4))
+
+        with setup_block(workbook):
+            workbook.set_cell_contents('Test', 'A1', '=A1')
+            workbook.set_cell_contents('Test', 'A2', '=CHOOSE(3, 0, A1)')
+        for formula, expected in [
+            ('=A2', CellErrorType.TYPE_ERROR),
+            ('=CHOOSE(#REF!, A1)', CellErrorType.BAD_REFERENCE),
+            ('=CHOOSE(1, Abcd1233)', ('cell_ref', D0))
+        ]:
+            check_formula(evaluator, formula, expected)
+
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A1': '', 'A2': '=False', 'A3': '=0'}],
+                             indirect=True)
+    @pytest.mark.parametrize('formula, expected', ISBLANK_CASES)
+    def test_isblank(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
+        Test ISBLANK logic
 
-        WB.set_cell_contents('Test', 'A1', '')
-        WB.set_cell_contents('Test', 'A2', '=False')
-        WB.set_cell_contents('Test', 'A3', '=0')
-
-        tree = PARSER.parse('=ISBLANK()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result of the formula
 
-        tree = PARSER.parse('=ISBLANK("string", A1)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        '''
 
-        tree = PARSER.parse('=ISBLANK("")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        check_formula(evaluator, formula, expected)
 
-        tree = PARSER.parse('=ISBLANK(A1)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A1': '', 'A2': '=False', 'A3': '=0'}],
+                             indirect=True)
+    def test_isblank_circular(self, workbook: Workbook, evaluator: Evaluator,
+                              setup_block: SetupBlock) -> None:
+        '''
+        Test ISBLANK logic on errors and within a reference cycle
 
-        tree = PARSER.parse('=ISBLANK(A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - setup_block: SetupBlock - gives the block the cells are set in
 
-        tree = PARSER.parse('=ISBLANK(A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        '''
 
-        WB.set_cell_contents('Test', 'A3', '#REF!')
-        tree = PARSER.parse('=ISBLANK(A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        workbook.set_cell_contents('Test', 'A3', '#REF!')
+        check_formula(evaluator, '=ISBLANK(A3)', ('bool', False))
 
-        WB.set_cell_contents('Test', 'A2', '=A3')
-        WB.set_cell_contents('Test', 'A3', '=ISBLANK(A3)')
-        tree = PARSER.parse('=A3')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.CIRCULAR_REFERENCE
+        with setup_block(workbook):
+            workbook.set_cell_contents('Test', 'A2', '=A3')
+            workbook.set_cell_contents('Test', 'A3', '=ISBLANK(A3)')
+        check_formula(evaluator, '=A3', CellErrorType.CIRCULAR_REFERENCE)
 
-    def test_iserror(self) -> None:
+    @pytest.mark.usefixtures('logic_cells')
+    @pytest.mark.parametrize('logic_cells', [{'A1': '', 'A2': '=A1+', 'A3': '=1/0'}],
+                             indirect=True)
+    @pytest.mark.parametrize('formula, expected', ISERROR_CASES)
+    def test_iserror(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
         Test ISERROR logic
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '')
-        WB.set_cell_contents('Test', 'A2', '=A1+')
-        WB.set_cell_contents('Test', 'A3', '=1/0')
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result of the formula
 
-        tree = PARSER.parse('=ISERROR()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        tree = PARSER.parse('=ISERROR("string", A1)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        '''
 
-        tree = PARSER.parse('=ISERROR("A1+")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        check_formula(evaluator, formula, expected)
 
-        tree = PARSER.parse('=ISERROR(A1)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+    def test_iserror_circular(self, workbook: Workbook, evaluator: Evaluator,
+                              setup_block: SetupBlock) -> None:
+        '''
+        Test ISERROR logic within a reference cycle
 
-        tree = PARSER.parse('=ISERROR(A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - setup_block: SetupBlock - gives the block the cells are set in
 
-        tree = PARSER.parse('=ISERROR(A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        '''
 
-        WB.set_cell_contents('Test', 'A1', '=A2')
-        WB.set_cell_contents('Test', 'A2', '=A1')
-        WB.set_cell_contents('Test', 'A3', '=ISERROR(A2)')
-        tree = PARSER.parse('=ISERROR(A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        with setup_block(workbook):
+            workbook.set_cell_contents('Test', 'A1', '=A2')
+            workbook.set_cell_contents('Test', 'A2', '=A1')
+            workbook.set_cell_contents('Test', 'A3', '=ISERROR(A2)')
+        check_formula(evaluator, '=ISERROR(A2)', ('bool', True))
 
-        tree = PARSER.parse('=ISERROR(A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        check_formula(evaluator, '=ISERROR(A3)', ('bool', False))
 
-        WB.set_cell_contents('Test', 'A1', '=ISERROR(A2)')
-        WB.set_cell_contents('Test', 'A2', '=ISERROR(A1)')
-        WB.set_cell_contents('Test', 'A3', '=ISERROR(A2)')
-        tree = PARSER.parse('=ISERROR(A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [True])
+        with setup_block(workbook):
+            workbook.set_cell_contents('Test', 'A1', '=ISERROR(A2)')
+            workbook.set_cell_contents('Test', 'A2', '=ISERROR(A1)')
+            workbook.set_cell_contents('Test', 'A3', '=ISERROR(A2)')
+        check_formula(evaluator, '=ISERROR(A2)', ('bool', True))
 
-        tree = PARSER.parse('=ISERROR(A3)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('bool', [False])
+        check_formula(evaluator, '=ISERROR(A3)', ('bool', False))
 
-    def test_version(self) -> None:
+    def test_version(self, evaluator: Evaluator) -> None:
         '''
         test VERSION functionality
 
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+
         '''
 
-        tree = PARSER.parse('=VERSION()')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('string', [version])
+        result = evaluator.transform(EMPTY_CALLS['VERSION'])
+        check_result(result, ('string', version))
 
-        tree = PARSER.parse('=VERSION(arg1)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        check_formula(evaluator, '=VERSION(arg1)', CellErrorType.TYPE_ERROR)
 
-        tree = PARSER.parse('=VERSION("",arg1)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        check_formula(evaluator, '=VERSION("",arg1)', CellErrorType.TYPE_ERROR)
 
-    def test_indirect(self) -> None:
+    def test_indirect(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
         test INDIRECT functionality
 
-        '''
-
-        tree = PARSER.parse('=INDIRECT()')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
 
-        tree = PARSER.parse('=INDIRECT(A1, A2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        WB.set_cell_contents('Test', 'A1', '=1')
-        tree = PARSER.parse('=INDIRECT(A1)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal(1)])
-
-        tree = PARSER.parse('=INDIRECT("A1")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [Decimal(1)])
-
-        WB.set_cell_contents('Test', 'A2', 'True')
-        tree = PARSER.parse('=INDIRECT("Test!A2")')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [True])
-
-        tree = PARSER.parse('=INDIRECT(Test!A2)')
-        result = EVALUATOR.transform(tree)
-        assert result == Tree('cell_ref', [True])
-
-        tree = PARSER.parse('=INDIRECT(A4)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        '''
 
-        tree = PARSER.parse('=INDIRECT("A5")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        check_formula(evaluator, '=INDIRECT(A1, A2)', CellErrorType.TYPE_ERROR)
 
-        tree = PARSER.parse('=INDIRECT(Sheet2!A1)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        workbook.set_cell_contents('Test', 'A1', '=1')
+        check_formula(evaluator, '=INDIRECT(A1)', ('cell_ref', D1))
 
-        tree = PARSER.parse('=INDIRECT("Sheet2!A1")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        check_formula(evaluator, '=INDIRECT("A1")', ('cell_ref', D1))
 
-        tree = PARSER.parse('=INDIRECT("Sheet2!!A1")')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        workbook.set_cell_contents('Test', 'A2', 'True')
+        for formula, expected in [
+            ('=INDIRECT("Test!A2")', ('cell_ref', True)),
+            ('=INDIRECT(Test!A2)', ('cell_ref', True)),
+            ('=INDIRECT(A4)', CellErrorType.BAD_REFERENCE),
+            ('=INDIRECT("A5")', CellErrorType.BAD_REFERENCE),
+            ('=INDIRECT(Sheet2!A1)', CellErrorType.BAD_REFERENCE),
+            ('=INDIRECT("Sheet2!A1")', CellErrorType.BAD_REFERENCE),
+            ('=INDIRECT("Sheet2!!A1")', CellErrorType.BAD_REFERENCE)
+        ]:
+            check_formula(evaluator, formula, expected)
 
-    def test_indirect2(self) -> None:
+    @pytest.mark.parametrize('formula, expected', INDIRECT_CASES)
+    def test_indirect2(self, evaluator: Evaluator, formula: str, expected: Expected) -> None:
         '''
         test INDIRECT functionality - Part 2
 
-        '''
+        Arguments:
+        - evaluator: Evaluator - the Evaluator used for this test suite
+        - formula: str - the formula to evaluate
+        - expected: Expected - the expected result of the formula
 
-        tree = PARSER.parse('=INDIRECT(123)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
-
-        tree = PARSER.parse('=INDIRECT(True)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        '''
 
-        tree = PARSER.parse('=INDIRECT(AND(1))')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.BAD_REFERENCE
+        check_formula(evaluator, formula, expected)
 
-    def test_common_math(self) -> None:
+    def test_common_math(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
         test MIN, MAX, SUM, AVG functionality
 
-        '''
-
-        WB.set_cell_contents('Test', 'A1', '=0')
-        WB.set_cell_contents('Test', 'A2', '=-100')
-        WB.set_cell_contents('Test', 'B2', '=130')
-        WB.set_cell_contents('Test', 'D1', '=True')
-        WB.set_cell_contents('Test', 'D2', '="string"')
-        tree = PARSER.parse('=MIN(1, 3, A1:B2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert result == Decimal(-100)
-
-        tree = PARSER.parse('=MAX(1, 3, A1:B2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert result == Decimal(130)
-
-        tree = PARSER.parse('=SUM(1, 3, A1:B2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert result == Decimal(34)
-
-        tree = PARSER.parse('=AVERAGE(1, 3, A1:B2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert result == Decimal('6.8')
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
 
-        tree = PARSER.parse('=SUM(C1:C2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert result == Decimal(0)
-
-        tree = PARSER.parse('=MAX(20, D1:D2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert isinstance(result, CellError)
-        assert result.get_type() == CellErrorType.TYPE_ERROR
-
-        WB.set_cell_contents('Test', 'B1', '=True')
-        WB.set_cell_contents('Test', 'C1', '=1')
-        WB.set_cell_contents('Test', 'C2', '=1')
-        WB.set_cell_contents('Test', 'C3', '=1')
-        WB.set_cell_contents('Test', 'C4', '=1')
-        WB.set_cell_contents('Test', 'C5', '=1')
-
-        tree = PARSER.parse('=SUM(IF(B1, C1:C5, D1:D10))')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert result == Decimal(5)
+        '''
 
-    def test_lookups(self) -> None:
+        with workbook.defer_recompute():
+            workbook.set_cell_contents('Test', 'A1', '=0')
+            workbook.set_cell_contents('Test', 'A2', '=-100')
+            workbook.set_cell_contents('Test', 'B2', '=130')
+            workbook.set_cell_contents('Test', 'D1', '=True')
+            workbook.set_cell_contents('Test', 'D2', '="string"')
+        for formula, expected in [
+            ('=MIN(1, 3, A1:B2)', ('number', D_NEG100)),
+            ('=MAX(1, 3, A1:B2)', ('number', D130)),
+            ('=SUM(1, 3, A1:B2)', ('number', D34)),
+            ('=AVERAGE(1, 3, A1:B2)', ('number', D6_8)),
+            ('=SUM(C1:C2)', ('number', D0)),
+            ('=MAX(20, D1:D2)', CellErrorType.TYPE_ERROR)
+        ]:
+            check_formula(evaluator, formula, expected)
+
+        with workbook.defer_recompute():
+            workbook.set_cell_contents('Test', 'B1', '=True')
+            workbook.set_cell_contents('Test', 'C1', '=1')
+            workbook.set_cell_contents('Test', 'C2', '=1')
+            workbook.set_cell_contents('Test', 'C3', '=1')
+            workbook.set_cell_contents('Test', 'C4', '=1')
+            workbook.set_cell_contents('Test', 'C5', '=1')
+
+        check_formula(evaluator, '=SUM(IF(B1, C1:C5, D1:D10))', ('number', D5))
+
+    def test_lookups(self, workbook: Workbook, evaluator: Evaluator) -> None:
         '''
         test HLOOKUP and VLOOKUP functionality
 
+        Arguments:
+        - workbook: Workbook - the Workbook used for this test suite
+        - evaluator: Evaluator - the Evaluator used for this test suite
+
         '''
 
-        WB.set_cell_contents('Test', 'A1', '=0')
-        WB.set_cell_contents('Test', 'A2', '=-100')
-        WB.set_cell_contents('Test', 'B1', '="sparkles"')
-        WB.set_cell_contents('Test', 'B2', '=130')
-        WB.set_cell_contents('Test', 'C1', '="sparkles"')
-        WB.set_cell_contents('Test', 'C2', '=134')
-        WB.set_cell_contents('Test', 'D1', '=True')
-        WB.set_cell_contents('Test', 'D2', '="string"')
+        workbook.set_cell_contents('Test', 'A1', '=0')
+        workbook.set_cell_contents('Test', 'A2', '=-100')
+        workbook.set_cell_contents('Test', 'B1', '="sparkles"')
+        workbook.set_cell_contents('Test', 'B2', '=130')
+        workbook.set_cell_contents('Test', 'C1', '="sparkles"')
+        workbook.set_cell_contents('Test', 'C2', '=134')
+        workbook.set_cell_contents('Test', 'D1', '=True')
+        workbook.set_cell_contents('Test', 'D2', '="string"')
+
+        check_formula(evaluator, '=HLOOKUP("sparkles", A1:D2, 2)', ('cell_ref', D130))
 
-        tree = PARSER.parse('=HLOOKUP("sparkles", A1:D2, 2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert result == Decimal(130)
+        check_formula(evaluator, '=VLOOKUP(0, D2:A1, 2)', ('cell_ref', 'sparkles'))
 
-        tree = PARSER.parse('=VLOOKUP(0, D2:A1, 2)')
-        result = EVALUATOR.transform(tree).children[-1]
-        assert result == "sparkles"
+        # indexes that are not whole numbers name no row or column
+        check_formula(evaluator, '=HLOOKUP("sparkles", A1:D2, 1.5)', CellErrorType.TYPE_ERROR)
+        check_formula(evaluator, '=VLOOKUP(0, D2:A1, 1.5)', CellErrorType.TYPE_ERROR)
@@ -10,6 +10,7 @@ Classes:
     - test_extent_simple(object) -> None
     - test_extent_complex(object) -> None
     - test_get_target_cells(object) -> None
+    - test_get_cell_coords_in_area(object) -> None
 
 '''
 
@@ -94,6 +95,7 @@ class TestSheet:
         sheet.set_cell_contents('A1', '1')
         sheet.set_cell_contents('A3', '2')
         sheet.set_cell_contents('B3', '3')
+        assert sheet.get_extent() == (2, 3)
         source_cells = get_source_cells('A1', 'B3')
         target_cells = sheet.get_target_cells('A1', 'B3', 'B2', source_cells)
         result_dict = {
@@ -116,3 +118,23 @@ class TestSheet:
 
         with pytest.raises(ValueError):
             sheet.get_target_cells('A1', 'BB12345', 'B2', None)
+
+    def test_get_cell_coords_in_area(self) -> None:
+        '''
+        Test getting the set cells of small and large areas
+
+        '''
+
+        sheet = Sheet('Source', None)
+        sheet.set_cell_contents('A1', '1')
+        sheet.set_cell_contents('A3', '2')
+        sheet.set_cell_contents('B3', '3')
+        sheet.set_cell_contents('ZZ999', '4')
+        # area no larger than the set cells is scanned location by location
+        assert sheet.get_cell_coords_in_area((1, 1), (2, 2)) == [(1, 1)]
+        # larger area is matched against the set cells instead
+        assert sheet.get_cell_coords_in_area((1, 1), (2, 3)) == \
+            [(1, 1), (1, 3), (2, 3)]
+        assert sheet.get_cell_coords_in_area((1, 2), (702, 9999)) == \
+            [(1, 3), (2, 3), (702, 999)]
+        assert not sheet.get_cell_coords_in_area((3, 1), (701, 9999))
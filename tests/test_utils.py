@@ -8,8 +8,10 @@ Classes:
 - TestUtils
 
     Methods:
+    - test_get_coords_from_invalid_loc(object, str) -> None
     - test_get_coords_from_loc(object) -> None
     - test_get_loc_from_coords(object) -> None
+    - test_get_col_name(object) -> None
     - test_convert_to_bool(object) -> None
     - test_compare_values(object) -> None
 
@@ -24,7 +26,7 @@ import pytest
 import context
 from sheets import CellError, CellErrorType
 from sheets.utils import get_loc_from_coords, get_coords_from_loc,\
-    convert_to_bool, compare_values, get_source_cells
+    get_col_name, convert_to_bool, compare_values, get_source_cells
 
 
 class TestUtils:
@@ -33,46 +35,44 @@ class TestUtils:
 
     '''
 
-    def test_get_coords_from_loc(self) -> None:
+    @pytest.mark.parametrize('location', [
+        'A0', 'A-1', 'A 1', ' A1', 'A1 ', 'AAAAA1', 'A11111', 'A0001'
+    ])
+    def test_get_coords_from_invalid_loc(self, location: str) -> None:
         '''
-        Test getting coordinates from location
+        Test getting coordinates from an invalid location
+
+        Arguments:
+        - location: str - the invalid location to convert
 
         '''
 
         with pytest.raises(ValueError):
-            get_coords_from_loc('A0')
-        with pytest.raises(ValueError):
-            get_coords_from_loc('A-1')
-        with pytest.raises(ValueError):
-            get_coords_from_loc('A 1')
-        with pytest.raises(ValueError):
-            get_coords_from_loc(' A1')
-        with pytest.raises(ValueError):
-            get_coords_from_loc('A1 ')
-        with pytest.raises(ValueError):
-            get_coords_from_loc('AAAAA1')
-        with pytest.raises(ValueError):
-            get_coords_from_loc('A11111')
-        with pytest.raises(ValueError):
-            get_coords_from_loc('A0001')
+            get_coords_from_loc(location)
+
+    def test_get_coords_from_loc(self) -> None:
+        '''
+        Test getting coordinates from location
+
+        '''
 
         col, row = get_coords_from_loc('a1')
-        assert col, row == (1, 1)
+        assert (col, row) == (1, 1)
 
         col, row = get_coords_from_loc('a5')
-        assert col, row == (1, 5)
+        assert (col, row) == (1, 5)
 
         col, row = get_coords_from_loc('AA15')
-        assert col, row == (27, 15)
+        assert (col, row) == (27, 15)
 
         col, row = get_coords_from_loc('Aa16')
-        assert col, row == (27, 16)
+        assert (col, row) == (27, 16)
 
         col, row = get_coords_from_loc('AAC750')
-        assert col, row == (705, 750)
+        assert (col, row) == (705, 750)
 
         col, row = get_coords_from_loc('AAc751')
-        assert col, row == (705, 751)
+        assert (col, row) == (705, 751)
 
     def test_get_loc_from_coords(self) -> None:
         '''
@@ -111,6 +111,19 @@ class TestUtils:
         loc = get_loc_from_coords((705, 751))
         assert loc == 'AAC751'
 
+    def test_get_col_name(self) -> None:
+        '''
+        Test getting column letters from a column number
+
+        '''
+
+        assert get_col_name(1) == 'A'
+        assert get_col_name(26) == 'Z'
+        assert get_col_name(27) == 'AA'
+        assert get_col_name(702) == 'ZZ'
+        assert get_col_name(703) == 'AAA'
+        assert get_col_name(475254) == 'ZZZZ'
+
     def test_covert_to_bool(self) -> None:
         '''
         Test converting strings and Decimals to bools
@@ -118,15 +131,15 @@ class TestUtils:
         '''
 
         with pytest.raises(TypeError):
-            convert_to_bool('anystr')
+            convert_to_bool('anystr', str)
         with pytest.raises(TypeError):
-            convert_to_bool('1')
+            convert_to_bool('1', str)
         with pytest.raises(TypeError):
-            convert_to_bool(int(1))
+            convert_to_bool(int(1), int)
         with pytest.raises(TypeError):
-            convert_to_bool(int(1))
+            convert_to_bool(float(1), float)
         with pytest.raises(TypeError):
-            convert_to_bool(['True'])
+            convert_to_bool(['True'], list)
 
         booly = convert_to_bool('true', str)
         assert booly
@@ -4,30 +4,35 @@ Test Workbook
 Tests the Workbook module found at ../sheets/workbook.py with more complex
 operations.  Tests for basic operations can be found at test_workbook.py
 
+Global Variables:
+- D0, D1, D2, D3, D4, D5, D6, D7, D11, D70, D110, D130 (Decimal) - shared
+  Decimal constants for expected numbers
+
 Classes:
 - TestWorkbook
 
     Methods:
-    - test_rename_sheet_update_complex(object) -> None
-    - test_rename_sheet_apply_quotes(object) -> None
+    - test_rename_sheet_update_complex(object, SetCells, SetupBlock) -> None
+    - test_rename_sheet_apply_quotes(object, SetupBlock) -> None
     - test_rename_sheet_remove_quotes(object) -> None
-    - test_rename_sheet_parse_error(object) -> None
+    - test_rename_sheet_parse_error(object, str, str, str, str) -> None
     - test_move_cells_same_sheet(object) -> None
     - test_copy_cells_same_sheet(object) -> None
-    - test_move_cells_overlap_basic(object) -> None
-    - test_copy_cells_overlap_basic(object) -> None
-    - test_move_cells_overlap_complex(object) -> None
-    - test_move_cells_overlap_abs_refs(object) -> None
-    - test_move_cells_overlap_mix_refs(object) -> None
-    - test_copy_cells_overlap_complex(object) -> None
-    - test_copy_cells_overlap_mix_refs(object) -> None
-    - test_move_cells_diff_sheets(object) -> None
+    - test_move_cells_overlap_basic(object, SetCells) -> None
+    - test_copy_cells_overlap_basic(object, SetCells) -> None
+    - test_move_cells_overlap_complex(object, SetCells) -> None
+    - test_move_cells_overlap_abs_refs(object, SetCells) -> None
+    - test_move_cells_overlap_mix_refs(object, SetCells) -> None
+    - test_copy_cells_overlap_complex(object, SetCells) -> None
+    - test_copy_cells_overlap_mix_refs(object, SetCells) -> None
+    - test_move_cells_diff_sheets(object, SetCells) -> None
     - test_copy_cells_diff_sheets(object) -> None
-    - test_move_cells_with_references(object) -> None
-    - test_copy_cells_with_references(object) -> None
-    - test_move_cells_target_oob(object) -> None
-    - test_copy_cells_target_oob(object) -> None
-    - test_move_copy_with_error(object) -> None
+    - test_move_cells_with_references(object, SetCells) -> None
+    - test_copy_cells_with_references(object, SetCells) -> None
+    - test_move_cells_target_oob(object, SetCells) -> None
+    - test_copy_cells_target_oob(object, SetCells) -> None
+    - test_move_copy_with_error(object, SetCells) -> None
+    - test_move_copy_large_area(object, SetCells) -> None
 
 '''
 
@@ -36,61 +41,86 @@ from decimal import Decimal
 
 # pylint: disable=unused-import, import-error
 import context
+from conftest import SetCells, SetupBlock
 import pytest
 from sheets.workbook import Workbook
 from sheets.cell_error import CellError, CellErrorType
 
 
+# expected numbers are shared Decimal constants named after their value,
+# with D_NEG for negatives and _ for the decimal point
+D0 = Decimal('0')
+D1 = Decimal('1')
+D2 = Decimal('2')
+D3 = Decimal('3')
+D4 = Decimal('4')
+D5 = Decimal('5')
+D6 = Decimal('6')
+D7 = Decimal('7')
+D11 = Decimal('11')
+D70 = Decimal('70')
+D110 = Decimal('110')
+D130 = Decimal('130')
+
+
 class TestWorkbook:
     ''' 
     Workbook tests with complex operations
     
     '''
 
-    def test_rename_sheet_update_complex(self) -> None:
+    def test_rename_sheet_update_complex(self,
+                                         set_cells: SetCells,
+                                         setup_block: SetupBlock) -> None:
         '''
         Test updating complex references on sheet rename
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+        - setup_block: SetupBlock - gives the block the cells are set in
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
         wb1.new_sheet('Sheet5')
         wb1.new_sheet('Sheet1Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', '2')
-        wb1.set_cell_contents('Sheet1Sheet1', 'A1', '1.5')
-        wb1.set_cell_contents('Sheet5', 'A1', '=Sheet1Sheet1!A1 * Sheet1!A1')
+        with setup_block(wb1):
+            wb1.set_cell_contents('Sheet1', 'A1', '2')
+            wb1.set_cell_contents('Sheet1Sheet1', 'A1', '1.5')
+            wb1.set_cell_contents('Sheet5', 'A1', '=Sheet1Sheet1!A1 * Sheet1!A1')
         wb1.rename_sheet('Sheet1', 'Sheet99')
-        contents = wb1.get_cell_contents('Sheet5', 'A1')
-        value = wb1.get_cell_value('Sheet5', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet5', 'A1')
         assert contents == '=Sheet1Sheet1!A1 * Sheet99!A1'
-        assert value == Decimal('3')
+        assert value == D3
 
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', 'ayo')
-        wb1.set_cell_contents('Sheet1', 'A2', '=Sheet1!A1 & \"Sheet1\"')
-        wb1.set_cell_contents('Sheet1', 'A3', '=Sheet1!A1 & \"Sheet1!\"')
+        set_cells(wb1, 'Sheet1', {
+            'A1': 'ayo',
+            'A2': '=Sheet1!A1 & \"Sheet1\"',
+            'A3': '=Sheet1!A1 & \"Sheet1!\"'
+        }.items())
         wb1.rename_sheet('Sheet1', 'Sheet98')
-        contents = wb1.get_cell_contents('Sheet98', 'A2')
-        value = wb1.get_cell_value('Sheet98', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet98', 'A2')
         assert contents == '=Sheet98!A1 & \"Sheet1\"'
         assert value == 'ayoSheet1'
-        contents = wb1.get_cell_contents('Sheet98', 'A3')
-        value = wb1.get_cell_value('Sheet98', 'A3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet98', 'A3')
         assert contents == '=Sheet98!A1 & \"Sheet1!\"'
         assert value == 'ayoSheet1!'
 
         wb1.set_cell_contents('Sheet98', 'C1', '=September!A1+3')
         wb1.rename_sheet('Sheet99', 'September')
-        contents = wb1.get_cell_contents('Sheet98', 'C1')
-        value = wb1.get_cell_value('Sheet98', 'C1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet98', 'C1')
         assert contents == '=September!A1+3'
-        assert value == Decimal(5)
+        assert value == D5
 
-    def test_rename_sheet_apply_quotes(self) -> None:
+    def test_rename_sheet_apply_quotes(self, setup_block: SetupBlock) -> None:
         '''
         Test applying quotes to a sheet name on sheet rename
 
+        Arguments:
+        - setup_block: SetupBlock - gives the block the cells are set in
+
         '''
 
         wb1 = Workbook()
@@ -99,37 +129,35 @@ class TestWorkbook:
         wb1.set_cell_contents('Sheet1', 'A1', 'do or do not, there is no try')
         wb1.set_cell_contents('Sheet2', 'A1', '=Sheet1!A1')
         wb1.rename_sheet('Sheet1', 'Sheet 1')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents == '=\'Sheet 1\'!A1'
         assert value == 'do or do not, there is no try'
 
         wb1.new_sheet('Sheet3')
         wb1.rename_sheet('Sheet 1', 'Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A2', '\' roger')
-        wb1.set_cell_contents('Sheet3', 'A1', '- Yoda (master shiesty)')
-        wb1.set_cell_contents('Sheet2', 'A2', '=Sheet1!A1 & Sheet3!A1')
-        wb1.set_cell_contents('Sheet2', 'A3', '=Sheet1!A2 & Sheet1!A2')
+        with setup_block(wb1):
+            wb1.set_cell_contents('Sheet1', 'A2', '\' roger')
+            wb1.set_cell_contents('Sheet3', 'A1', '- Yoda (master shiesty)')
+            wb1.set_cell_contents('Sheet2', 'A2', '=Sheet1!A1 & Sheet3!A1')
+            wb1.set_cell_contents('Sheet2', 'A3', '=Sheet1!A2 & Sheet1!A2')
         wb1.rename_sheet('Sheet1', 'Sheet 1')
         wb1.rename_sheet('Sheet3', 'Sheet 3')
-        contents = wb1.get_cell_contents('Sheet2', 'A2')
-        value = wb1.get_cell_value('Sheet2', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A2')
         assert contents == '=\'Sheet 1\'!A1 & \'Sheet 3\'!A1'
         assert value == 'do or do not, there is no try- Yoda (master shiesty)'
-        contents = wb1.get_cell_contents('Sheet2', 'A3')
-        value = wb1.get_cell_value('Sheet2', 'A3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A3')
         assert contents == '=\'Sheet 1\'!A2 & \'Sheet 1\'!A2'
         assert value == ' roger roger'
 
         wb1.new_sheet('Sheet4')
         wb1.new_sheet('ShEet5')
-        wb1.set_cell_contents('Sheet4', 'A1', 'good relations')
-        wb1.set_cell_contents('Sheet4', 'A2', '\' with the wookies,')
-        wb1.set_cell_contents('Sheet5', 'A1', '\' I have')
-        wb1.set_cell_contents('Sheet2', 'A1', '=Sheet4!A1 & Sheet4!A2 & Sheet5!A1')
+        with setup_block(wb1):
+            wb1.set_cell_contents('Sheet4', 'A1', 'good relations')
+            wb1.set_cell_contents('Sheet4', 'A2', '\' with the wookies,')
+            wb1.set_cell_contents('Sheet5', 'A1', '\' I have')
+            wb1.set_cell_contents('Sheet2', 'A1', '=Sheet4!A1 & Sheet4!A2 & Sheet5!A1')
         wb1.rename_sheet('Sheet4', 'Sheet4?')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents == '=\'Sheet4?\'!A1 & \'Sheet4?\'!A2 & Sheet5!A1'
         assert value == 'good relations with the wookies, I have'
 
@@ -145,8 +173,7 @@ class TestWorkbook:
         wb1.set_cell_contents('Benjamin Juarez', 'A1', 'i heart jar jar binks')
         wb1.set_cell_contents('Sheet1', 'A1', '=\'Benjamin Juarez\'!A1')
         wb1.rename_sheet('Benjamin Juarez', 'BJ')
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents == '=BJ!A1'
         assert value == 'i heart jar jar binks'
 
@@ -155,8 +182,7 @@ class TestWorkbook:
         wb1.set_cell_contents('Sheet1',
                              'A2', '=BJ!A1&\" and "&\'Kyle McGraw\'!A1')
         wb1.rename_sheet('Kyle McGraw', 'KM')
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents == '=BJ!A1&\" and \"&KM!A1'
         # this is not working anymore - assigned to Dallas to figure out
         assert value == 'i heart jar jar binks and anakin skywalker'
@@ -164,46 +190,37 @@ class TestWorkbook:
         wb1.new_sheet('Sheet2')
         wb1.set_cell_contents('Sheet2', 'A1', '=\'KM\'!A1 & KM!A1')
         wb1.rename_sheet('KM', 'DT')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents == '=DT!A1 & DT!A1'
         assert value == 'anakin skywalkeranakin skywalker'
 
-    def test_rename_sheet_parse_error(self) -> None:
+    @pytest.mark.parametrize('sheet_name, formula, new_name, renamed_sheet', [
+        ('Sheet2', '=Sheet1!A1 & Sheet1!!A1', 'Sheet11', 'Sheet2'),
+        ('Sheet2', '=Sheet1!A1 &&', 'Sheet12', 'Sheet2'),
+        ('Sheet1', '=Sheet1!A1 & \'Sheet1\'', 'Sheet13', 'Sheet13')
+    ])
+    def test_rename_sheet_parse_error(self, sheet_name: str, formula: str,
+                                      new_name: str, renamed_sheet: str
+                                      ) -> None:
         '''
         Test parse error on rename sheet
 
+        Arguments:
+        - sheet_name: str - sheet holding the formula that cannot be parsed
+        - formula: str - formula that cannot be parsed
+        - new_name: str - new name of Sheet1
+        - renamed_sheet: str - name of the formula's sheet after the rename
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
         wb1.new_sheet('Sheet2')
         wb1.set_cell_contents('Sheet1', 'A1', 'Dallas Taylor')
-        wb1.set_cell_contents('Sheet2', 'A1', '=Sheet1!A1 & Sheet1!!A1')
-        wb1.rename_sheet('Sheet1', 'Sheet11')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
-        assert contents == '=Sheet1!A1 & Sheet1!!A1'
-        assert isinstance(value, CellError)
-        assert value.get_type() == CellErrorType.PARSE_ERROR
-
-        wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', 'Dallas Taylor')
-        wb1.set_cell_contents('Sheet2', 'A1', '=Sheet1!A1 &&')
-        wb1.rename_sheet('Sheet1', 'Sheet12')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
-        assert contents == '=Sheet1!A1 &&'
-        assert isinstance(value, CellError)
-        assert value.get_type() == CellErrorType.PARSE_ERROR
-
-        wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', 'Dallas Taylor')
-        wb1.set_cell_contents('Sheet1', 'A2', '=Sheet1!A1 & \'Sheet1\'')
-        wb1.rename_sheet('Sheet1', 'Sheet13')
-        contents = wb1.get_cell_contents('Sheet13', 'A2')
-        value = wb1.get_cell_value('Sheet13', 'A2')
-        assert contents == '=Sheet1!A1 & \'Sheet1\''
+        wb1.set_cell_contents(sheet_name, 'A2', formula)
+        wb1.rename_sheet('Sheet1', new_name)
+        contents, value = wb1.get_cell_contents_and_value(renamed_sheet, 'A2')
+        assert contents == formula
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.PARSE_ERROR
 
@@ -217,24 +234,20 @@ class TestWorkbook:
         wb1.new_sheet('Sheet1')
         wb1.set_cell_contents('Sheet1', 'A1', '1')
         wb1.move_cells('Sheet1', 'A1', 'A1', 'A2')
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents is None
         assert value is None
 
         wb1.move_cells('shEEt1', 'A2', 'A2', 'A3')
-        contents = wb1.get_cell_contents('Sheet1', 'A3')
-        value = wb1.get_cell_value('Sheet1', 'A3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A3')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents is None
         assert value is None
 
@@ -248,358 +261,343 @@ class TestWorkbook:
         wb1.new_sheet('Sheet1')
         wb1.set_cell_contents('Sheet1', 'A1', '1')
         wb1.copy_cells('Sheet1', 'A1', 'A1', 'A2')
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
         wb1.copy_cells('shEEt1', 'A2', 'A2', 'A3')
-        contents = wb1.get_cell_contents('Sheet1', 'A3')
-        value = wb1.get_cell_value('Sheet1', 'A3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A3')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-    def test_move_cells_overlap_basic(self) -> None:
+    def test_move_cells_overlap_basic(self, set_cells: SetCells) -> None:
         '''
         Test moving a group of cells in the same sheet where the source area
         and target area are overlapping
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', '1')
-        wb1.set_cell_contents('Sheet1', 'A2', '1')
-        wb1.set_cell_contents('Sheet1', 'A3', '1')
-        wb1.set_cell_contents('Sheet1', 'B1', '2')
-        wb1.set_cell_contents('Sheet1', 'B2', '2')
-        wb1.set_cell_contents('Sheet1', 'B3', '2')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '1',
+            'A2': '1',
+            'A3': '1',
+            'B1': '2',
+            'B2': '2',
+            'B3': '2'
+        }.items())
 
         wb1.move_cells('Sheet1', 'A1', 'A3', 'B3')
 
-        contents = wb1.get_cell_contents('Sheet1', 'B1')
-        value = wb1.get_cell_value('Sheet1', 'B1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B1')
         assert contents == '2'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '2'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet1', 'B3')
-        value = wb1.get_cell_value('Sheet1', 'B3')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B3')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'B4')
-        value = wb1.get_cell_value('Sheet1', 'B4')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B4')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents is None
         assert value is None
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents is None
         assert value is None
-        contents = wb1.get_cell_contents('Sheet1', 'A3')
-        value = wb1.get_cell_value('Sheet1', 'A3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A3')
         assert contents is None
         assert value is None
 
-    def test_copy_cells_overlap_basic(self) -> None:
+    def test_copy_cells_overlap_basic(self, set_cells: SetCells) -> None:
         '''
         Test copying a group of cells in the same sheet where the source area
         and target area are overlapping
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', '1')
-        wb1.set_cell_contents('Sheet1', 'A2', '1')
-        wb1.set_cell_contents('Sheet1', 'A3', '1')
-        wb1.set_cell_contents('Sheet1', 'B1', '2')
-        wb1.set_cell_contents('Sheet1', 'B2', '2')
-        wb1.set_cell_contents('Sheet1', 'B3', '2')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '1',
+            'A2': '1',
+            'A3': '1',
+            'B1': '2',
+            'B2': '2',
+            'B3': '2'
+        }.items())
 
         wb1.copy_cells('Sheet1', 'A1', 'A3', 'B2')
 
-        contents = wb1.get_cell_contents('Sheet1', 'B1')
-        value = wb1.get_cell_value('Sheet1', 'B1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B1')
         assert contents == '2'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'B3')
-        value = wb1.get_cell_value('Sheet1', 'B3')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B3')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'B4')
-        value = wb1.get_cell_value('Sheet1', 'B4')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B4')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'A3')
-        value = wb1.get_cell_value('Sheet1', 'A3')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A3')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-    def test_move_cells_overlap_complex(self) -> None:
+    def test_move_cells_overlap_complex(self, set_cells: SetCells) -> None:
         '''
         Test copying a group of cells in the same sheet where the source area
         and target area are overlapping
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         # Relative references
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', '1')
-        wb1.set_cell_contents('Sheet1', 'B1', '=A1')
-        wb1.set_cell_contents('Sheet1', 'A2', '2')
-        wb1.set_cell_contents('Sheet1', 'B2', '=A2+B1')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '1',
+            'B1': '=A1',
+            'A2': '2',
+            'B2': '=A2+B1'
+        }.items())
 
         wb1.move_cells('Sheet1', 'A1', 'B2', 'B2')
 
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'C2')
-        value = wb1.get_cell_value('Sheet1', 'C2')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'C2')
         assert contents == '=B2'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'B3')
-        value = wb1.get_cell_value('Sheet1', 'B3')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B3')
         assert contents == '2'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet1', 'C3')
-        value = wb1.get_cell_value('Sheet1', 'C3')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'C3')
         assert contents == '=B3 + C2'
-        assert value == Decimal('3')
+        assert value == D3
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents is None
         assert value is None
-        contents = wb1.get_cell_contents('Sheet1', 'B1')
-        value = wb1.get_cell_value('Sheet1', 'B1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B1')
         assert contents is None
         assert value is None
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents is None
         assert value is None
 
-    def test_move_cells_overlap_abs_refs(self) -> None:
+    def test_move_cells_overlap_abs_refs(self, set_cells: SetCells) -> None:
         '''
         Test copying a group of cells in the same sheet where the source area
         and target area are overlapping, now including absolute cell references
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet2')
-        wb1.set_cell_contents('Sheet2', 'A1', '1')
-        wb1.set_cell_contents('Sheet2', 'B1', '=$A$1')
-        wb1.set_cell_contents('Sheet2', 'A2', '2')
-        wb1.set_cell_contents('Sheet2', 'B2', '=A2+B1')
+        set_cells(wb1, 'Sheet2', {
+            'A1': '1',
+            'B1': '=$A$1',
+            'A2': '2',
+            'B2': '=A2+B1'
+        }.items())
 
         wb1.move_cells('Sheet2', 'A1', 'B2', 'B2')
 
-        contents = wb1.get_cell_contents('Sheet2', 'B2')
-        value = wb1.get_cell_value('Sheet2', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B2')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet2', 'C2')
-        value = wb1.get_cell_value('Sheet2', 'C2')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'C2')
         assert contents == '=$A$1'
-        assert value == Decimal('0')
-        contents = wb1.get_cell_contents('Sheet2', 'B3')
-        value = wb1.get_cell_value('Sheet2', 'B3')
+        assert value == D0
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B3')
         assert contents == '2'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet2', 'C3')
-        value = wb1.get_cell_value('Sheet2', 'C3')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'C3')
         assert contents == '=B3 + C2'
-        assert value == Decimal('2')
+        assert value == D2
 
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents is None
         assert value is None
-        contents = wb1.get_cell_contents('Sheet2', 'B1')
-        value = wb1.get_cell_value('Sheet2', 'B1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B1')
         assert contents is None
         assert value is None
-        contents = wb1.get_cell_contents('Sheet2', 'A2')
-        value = wb1.get_cell_value('Sheet2', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A2')
         assert contents is None
         assert value is None
 
-    def test_move_cells_overlap_mix_refs(self) -> None:
+    def test_move_cells_overlap_mix_refs(self, set_cells: SetCells) -> None:
         '''
         Test copying a group of cells in the same sheet where the source area
         and target area are overlapping, now including mixed cell references
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet3')
-        wb1.set_cell_contents('Sheet3', 'A1', '1')
-        wb1.set_cell_contents('Sheet3', 'A2', '=A$1')
-        wb1.set_cell_contents('Sheet3', 'B1', '2')
-        wb1.set_cell_contents('Sheet3', 'B2', '=A2+B1')
+        set_cells(wb1, 'Sheet3', {
+            'A1': '1',
+            'A2': '=A$1',
+            'B1': '2',
+            'B2': '=A2+B1'
+        }.items())
 
         wb1.move_cells('Sheet3', 'A1', 'B2', 'B2')
 
-        contents = wb1.get_cell_contents('Sheet3', 'B2')
-        value = wb1.get_cell_value('Sheet3', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'B2')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet3', 'C2')
-        value = wb1.get_cell_value('Sheet3', 'C2')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'C2')
         assert contents == '2'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet3', 'B3')
-        value = wb1.get_cell_value('Sheet3', 'B3')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'B3')
         assert contents == '=B$1'
-        assert value == Decimal('0')
-        contents = wb1.get_cell_contents('Sheet3', 'C3')
-        value = wb1.get_cell_value('Sheet3', 'C3')
+        assert value == D0
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'C3')
         assert contents == '=B3 + C2'
-        assert value == Decimal('2')
+        assert value == D2
 
-        contents = wb1.get_cell_contents('Sheet3', 'A1')
-        value = wb1.get_cell_value('Sheet3', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'A1')
         assert contents is None
         assert value is None
-        contents = wb1.get_cell_contents('Sheet3', 'B1')
-        value = wb1.get_cell_value('Sheet3', 'B1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'B1')
         assert contents is None
         assert value is None
-        contents = wb1.get_cell_contents('Sheet3', 'A2')
-        value = wb1.get_cell_value('Sheet3', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'A2')
         assert contents is None
         assert value is None
 
-    def test_copy_cells_overlap_complex(self) -> None:
+    def test_copy_cells_overlap_complex(self, set_cells: SetCells) -> None:
         '''
         Test copying a group of cells in the same sheet where the source area
         and target area are overlapping
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', '=A2+B1')
-        wb1.set_cell_contents('Sheet1', 'B1', '=B2')
-        wb1.set_cell_contents('Sheet1', 'A2', '2')
-        wb1.set_cell_contents('Sheet1', 'B2', '1')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '=A2+B1',
+            'B1': '=B2',
+            'A2': '2',
+            'B2': '1'
+        }.items())
 
         wb1.copy_cells('Sheet1', 'A1', 'B2', 'B2')
 
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '=B3 + C2'
-        assert value == Decimal('3')
-        contents = wb1.get_cell_contents('Sheet1', 'C2')
-        value = wb1.get_cell_value('Sheet1', 'C2')
+        assert value == D3
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'C2')
         assert contents == '=C3'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'B3')
-        value = wb1.get_cell_value('Sheet1', 'B3')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B3')
         assert contents == '2'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet1', 'C3')
-        value = wb1.get_cell_value('Sheet1', 'C3')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'C3')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents == "=A2+B1"
-        assert value == Decimal('5')
-        contents = wb1.get_cell_contents('Sheet1', 'B1')
-        value = wb1.get_cell_value('Sheet1', 'B1')
+        assert value == D5
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B1')
         assert contents == "=B2"
-        assert value == Decimal('3')
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        assert value == D3
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents == "2"
-        assert value == Decimal('2')
+        assert value == D2
 
-    def test_copy_cells_overlap_mix_refs(self) -> None:
+    def test_copy_cells_overlap_mix_refs(self, set_cells: SetCells) -> None:
         '''
         Test copying a group of cells in the same sheet where the source area
         and target area are overlapping, now with mixed cell references
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet2')
-        wb1.set_cell_contents('Sheet2', 'A1', '=A2+B1')
-        wb1.set_cell_contents('Sheet2', 'B1', '=$B2')
-        wb1.set_cell_contents('Sheet2', 'A2', '2')
-        wb1.set_cell_contents('Sheet2', 'B2', '1')
+        set_cells(wb1, 'Sheet2', {
+            'A1': '=A2+B1',
+            'B1': '=$B2',
+            'A2': '2',
+            'B2': '1'
+        }.items())
 
         wb1.copy_cells('Sheet2', 'A1', 'B2', 'B2')
 
-        contents = wb1.get_cell_contents('Sheet2', 'B2')
-        value = wb1.get_cell_value('Sheet2', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B2')
         assert contents == '=B3 + C2'
-        assert value == Decimal('4')
-        contents = wb1.get_cell_contents('Sheet2', 'C2')
-        value = wb1.get_cell_value('Sheet2', 'C2')
+        assert value == D4
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'C2')
         assert contents == '=$B3'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet2', 'B3')
-        value = wb1.get_cell_value('Sheet2', 'B3')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B3')
         assert contents == '2'
-        assert value == Decimal('2')
-        contents = wb1.get_cell_contents('Sheet2', 'C3')
-        value = wb1.get_cell_value('Sheet2', 'C3')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'C3')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents == "=A2+B1"
-        assert value == Decimal('6')
-        contents = wb1.get_cell_contents('Sheet2', 'B1')
-        value = wb1.get_cell_value('Sheet2', 'B1')
+        assert value == D6
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B1')
         assert contents == "=$B2"
-        assert value == Decimal('4')
-        contents = wb1.get_cell_contents('Sheet2', 'A2')
-        value = wb1.get_cell_value('Sheet2', 'A2')
+        assert value == D4
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A2')
         assert contents == "2"
-        assert value == Decimal('2')
+        assert value == D2
 
-    def test_move_cells_diff_sheets(self) -> None:
+    def test_move_cells_diff_sheets(self, set_cells: SetCells) -> None:
         '''
         Test moving a group of cells from one sheet to another sheet
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
@@ -607,42 +605,39 @@ class TestWorkbook:
         wb1.new_sheet('Sheet2')
         wb1.set_cell_contents('Sheet1', 'A1', '1')
         wb1.move_cells('Sheet1', 'A1', 'A1', 'A2', "Sheet2")
-        contents = wb1.get_cell_contents('Sheet2', 'A2')
-        value = wb1.get_cell_value('Sheet2', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A2')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents is None
         assert value is None
 
         wb1.new_sheet('Sheet3')
         wb1.move_cells('shEEt2', 'A2', 'A2', 'A3', 'Sheet3')
-        contents = wb1.get_cell_contents('Sheet3', 'A3')
-        value = wb1.get_cell_value('Sheet3', 'A3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'A3')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet2', 'A2')
-        value = wb1.get_cell_value('Sheet2', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A2')
         assert contents is None
         assert value is None
 
         wb1.set_cell_contents('Sheet1', 'A2', '5')
-        wb1.set_cell_contents('Sheet2', 'B2', '4')
-        wb1.set_cell_contents('Sheet2', 'B4', '2')
-        wb1.set_cell_contents('Sheet2', 'B3', '=(Sheet2!$B$2 / Sheet3!B3) + B4')
+        set_cells(wb1, 'Sheet2', {
+            'B2': '4',
+            'B4': '2',
+            'B3': '=(Sheet2!$B$2 / Sheet3!B3) + B4'
+        }.items())
         wb1.set_cell_contents('Sheet3', 'A1', '2')
         wb1.set_cell_contents('Sheet3', 'B3', '1')
         value = wb1.get_cell_value('Sheet2', 'B3')
-        assert value == Decimal('6')
+        assert value == D6
 
         wb1.move_cells('Sheet2', 'B3', 'B3', 'A1', 'Sheet1')
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents == '=(Sheet2!$B$2 / Sheet3!A1) + A2'
-        assert value == Decimal('7')
+        assert value == D7
 
     def test_copy_cells_diff_sheets(self) -> None:
         '''
@@ -655,226 +650,230 @@ class TestWorkbook:
         wb1.new_sheet('Sheet2')
         wb1.set_cell_contents('Sheet1', 'A1', '1')
         wb1.copy_cells('Sheet1', 'A1', 'A1', 'A2', 'Sheet2')
-        contents = wb1.get_cell_contents('Sheet2', 'A2')
-        value = wb1.get_cell_value('Sheet2', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A2')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
         wb1.new_sheet('Sheet3')
         wb1.copy_cells('shEEt2', 'A2', 'A2', 'A3', 'Sheet3')
-        contents = wb1.get_cell_contents('Sheet3', 'A3')
-        value = wb1.get_cell_value('Sheet3', 'A3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'A3')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'A3')
-        value = wb1.get_cell_value('Sheet1', 'A3')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A3')
         assert contents is None
         assert value is None
 
-        contents = wb1.get_cell_contents('Sheet2', 'A2')
-        value = wb1.get_cell_value('Sheet2', 'A2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A2')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-    def test_move_cells_with_references(self) -> None:
+    def test_move_cells_with_references(self, set_cells: SetCells) -> None:
         '''
         Test moving a group of cells where contents involve formulas/refs
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A50', '=50')
-        wb1.set_cell_contents('Sheet1', 'B51', '=60')
-        wb1.set_cell_contents('Sheet1', 'C52', '=70')
-        wb1.set_cell_contents('Sheet1', 'A1', '=A50+B51')
+        set_cells(wb1, 'Sheet1', {
+            'A50': '=50',
+            'B51': '=60',
+            'C52': '=70',
+            'A1': '=A50+B51'
+        }.items())
         wb1.move_cells('Sheet1', 'A1', 'A1', 'B2')
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '=B51 + C52'
-        assert value == Decimal('130')
+        assert value == D130
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents is None
         assert value is None
 
         wb1.move_cells('shEEt1', 'B2', 'B2', 'C3')
-        contents = wb1.get_cell_contents('Sheet1', 'C3')
-        value = wb1.get_cell_value('Sheet1', 'C3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'C3')
         assert contents == '=C52 + D53'
-        assert value == Decimal('70')
+        assert value == D70
 
         wb1.new_sheet('Sheet2')
-        wb1.set_cell_contents('Sheet2', 'A1', 'test')
-        wb1.set_cell_contents('Sheet2', 'B1', 'test2')
-        wb1.set_cell_contents('Sheet2', 'A2', '=\'Sheet1\'!A$1 & "pass!A1"')
+        set_cells(wb1, 'Sheet2', {
+            'A1': 'test',
+            'B1': 'test2',
+            'A2': '=\'Sheet1\'!A$1 & "pass!A1"'
+        }.items())
         wb1.move_cells('Sheet2', 'A1', 'A2', 'B2')
-        contents = wb1.get_cell_contents('Sheet2', 'B3')
-        value = wb1.get_cell_value('Sheet2', 'B3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B3')
         assert contents ==  '=\'Sheet1\'!B$1 & "pass!A1"'
         assert value == 'pass!A1'
 
         # test moving up and to left
         wb1.new_sheet('Sheet3')
-        wb1.set_cell_contents('Sheet3', 'A2', '1')
-        wb1.set_cell_contents('Sheet3', 'A3', '1')
-        wb1.set_cell_contents('Sheet3', 'B2', '2')
-        wb1.set_cell_contents('Sheet3', 'B3', '4')
-        wb1.set_cell_contents('Sheet3', 'C2', '3')
-        wb1.set_cell_contents('Sheet3', 'C3', '=B2+$C2+B3')
-        wb1.set_cell_contents('Sheet3', 'D2', '1')
+        set_cells(wb1, 'Sheet3', {
+            'A2': '1',
+            'A3': '1',
+            'B2': '2',
+            'B3': '4',
+            'C2': '3',
+            'C3': '=B2+$C2+B3',
+            'D2': '1'
+        }.items())
         wb1.move_cells('Sheet3', 'B2', 'D3', 'A1')
 
-        contents = wb1.get_cell_contents('Sheet3', 'A1')
-        value = wb1.get_cell_value('Sheet3', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'A1')
         assert contents == '2'
-        assert value == Decimal('2')
+        assert value == D2
 
-        contents = wb1.get_cell_contents('Sheet3', 'B2')
-        value = wb1.get_cell_value('Sheet3', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'B2')
         assert contents == '=A1 + $C1 + A2'
-        assert value == Decimal('7')
+        assert value == D7
 
-        contents = wb1.get_cell_contents('Sheet3', 'A3')
-        value = wb1.get_cell_value('Sheet3', 'A3')
-        assert value == Decimal('1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'A3')
+        assert value == D1
 
 
-    def test_copy_cells_with_references(self) -> None:
+    def test_copy_cells_with_references(self, set_cells: SetCells) -> None:
         '''
         Test copying a group of cells where contents involve formulas/refs
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A50', '=50')
-        wb1.set_cell_contents('Sheet1', 'B51', '=60')
-        wb1.set_cell_contents('Sheet1', 'C52', '=70')
-        wb1.set_cell_contents('Sheet1', 'A1', '=A50+B51')
+        set_cells(wb1, 'Sheet1', {
+            'A50': '=50',
+            'B51': '=60',
+            'C52': '=70',
+            'A1': '=A50+B51'
+        }.items())
         wb1.copy_cells('Sheet1', 'A1', 'A1', 'B2')
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '=B51 + C52'
-        assert value == Decimal('130')
+        assert value == D130
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents == '=A50+B51'
-        assert value == Decimal('110')
+        assert value == D110
 
         wb1.copy_cells('shEEt1', 'B2', 'B2', 'C3')
-        contents = wb1.get_cell_contents('Sheet1', 'C3')
-        value = wb1.get_cell_value('Sheet1', 'C3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'C3')
         assert contents == '=C52 + D53'
-        assert value == Decimal('70')
+        assert value == D70
 
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '=B51 + C52'
-        assert value == Decimal('130')
+        assert value == D130
 
         wb1.new_sheet('Sheet2')
         wb1.set_cell_contents('Sheet1', 'B1', 'test2')
         wb1.set_cell_contents('Sheet2', 'A2', '=\'Sheet1\'!A$1 & "pass!A1"')
         wb1.copy_cells('Sheet2', 'A1', 'A2', 'B2')
-        contents = wb1.get_cell_contents('Sheet2', 'B3')
-        value = wb1.get_cell_value('Sheet2', 'B3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B3')
         assert contents ==  '=\'Sheet1\'!B$1 & "pass!A1"'
         assert value == 'test2pass!A1'
 
         wb1.new_sheet('Sheet3')
-        wb1.set_cell_contents('Sheet3', 'A2', '1')
-        wb1.set_cell_contents('Sheet3', 'B2', '2')
-        wb1.set_cell_contents('Sheet3', 'B3', '4')
-        wb1.set_cell_contents('Sheet3', 'C3', '=B2+$C2+B3')
-        wb1.set_cell_contents('Sheet3', 'D2', '1')
+        set_cells(wb1, 'Sheet3', {
+            'A2': '1',
+            'B2': '2',
+            'B3': '4',
+            'C3': '=B2+$C2+B3',
+            'D2': '1'
+        }.items())
         wb1.copy_cells('Sheet3', 'B2', 'D3', 'A1')
 
         contents = wb1.get_cell_contents('Sheet3', 'A1')
         assert contents == '2'
 
-        contents = wb1.get_cell_contents('Sheet3', 'B2')
-        value = wb1.get_cell_value('Sheet3', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'B2')
         assert contents == '=A1 + $C1 + A2'
-        assert value == Decimal('7')
+        assert value == D7
 
-        contents = wb1.get_cell_contents('Sheet3', 'C3')
-        value = wb1.get_cell_value('Sheet3', 'C3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet3', 'C3')
         assert contents == '=B2+$C2+B3'
-        assert value == Decimal('11')
+        assert value == D11
 
-    def test_move_cells_target_oob(self) -> None:
+    def test_move_cells_target_oob(self, set_cells: SetCells) -> None:
         '''
         Test moving a group of cells where the target area would extend outside
         the valid area of the spreadsheet (no changes should be made)
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', '1')
-        wb1.set_cell_contents('Sheet1', 'B1', '1')
-        wb1.set_cell_contents('Sheet1', 'A2', '1')
-        wb1.set_cell_contents('Sheet1', 'B2', '1')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '1',
+            'B1': '1',
+            'A2': '1',
+            'B2': '1'
+        }.items())
 
         with pytest.raises(ValueError):
             wb1.move_cells('Sheet1', 'A1', 'B2', 'A9999')
 
-        contents = wb1.get_cell_contents('Sheet1', 'A1')
-        value = wb1.get_cell_value('Sheet1', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A1')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'B1')
-        value = wb1.get_cell_value('Sheet1', 'B1')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B1')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'A2')
-        value = wb1.get_cell_value('Sheet1', 'A2')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A2')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '1'
-        assert value == Decimal('1')
-        contents = wb1.get_cell_contents('Sheet1', 'A9999')
-        value = wb1.get_cell_value('Sheet1', 'A9999')
+        assert value == D1
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A9999')
         assert contents is None
         assert value is None
 
-    def test_copy_cells_target_oob(self) -> None:
+    def test_copy_cells_target_oob(self, set_cells: SetCells) -> None:
         '''
         Test copying a group of cells where the target area would extend outside
         the valid area of the spreadsheet (no changes should be made)
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', '1')
-        wb1.set_cell_contents('Sheet1', 'B1', '1')
-        wb1.set_cell_contents('Sheet1', 'A2', '1')
-        wb1.set_cell_contents('Sheet1', 'B2', '1')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '1',
+            'B1': '1',
+            'A2': '1',
+            'B2': '1'
+        }.items())
 
         with pytest.raises(ValueError):
             wb1.copy_cells('Sheet1', 'A1', 'B2', 'A9999')
 
-        contents = wb1.get_cell_contents('Sheet1', 'A9999')
-        value = wb1.get_cell_value('Sheet1', 'A9999')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'A9999')
         assert contents is None
         assert value is None
 
-    def test_move_copy_with_error(self) -> None:
+    def test_move_copy_with_error(self, set_cells: SetCells) -> None:
         '''
         Test moving/copying a group of cells with a parse error
         or value error
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
@@ -882,44 +881,87 @@ class TestWorkbook:
         wb1.set_cell_contents('Sheet1', 'A1', '1')
         wb1.set_cell_contents('Sheet1', 'B2', '=Sheet1!A1 + SHH!SHH')
         wb1.move_cells('Sheet1', 'A1', 'B2', 'C1')
-        contents = wb1.get_cell_contents('Sheet1', 'C1')
-        value = wb1.get_cell_value('Sheet1', 'C1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'C1')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet1', 'D2')
-        value = wb1.get_cell_value('Sheet1', 'D2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'D2')
         assert contents == '=Sheet1!A1 + SHH!SHH'
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.PARSE_ERROR
 
         wb1.new_sheet('Sheet2')
         wb1.copy_cells('Sheet1', 'C1', 'D2', 'A1', 'Sheet2')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents == '1'
-        assert value == Decimal('1')
+        assert value == D1
 
-        contents = wb1.get_cell_contents('Sheet2', 'B2')
-        value = wb1.get_cell_value('Sheet2', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B2')
         assert contents == '=Sheet1!A1 + SHH!SHH'
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.PARSE_ERROR
 
-        wb1.set_cell_contents('Sheet2', 'A1', '1')
-        wb1.set_cell_contents('Sheet2', 'A2', '2')
-        wb1.set_cell_contents('Sheet2', 'A3', '=A1 + A2')
+        set_cells(wb1, 'Sheet2', {
+            'A1': '1',
+            'A2': '2',
+            'A3': '=A1 + A2'
+        }.items())
         wb1.move_cells('Sheet2', 'A3', 'A3', 'B2')
-        contents = wb1.get_cell_contents('Sheet2', 'B2')
-        value = wb1.get_cell_value('Sheet2', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B2')
         assert contents == '=#REF! + B1'
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.BAD_REFERENCE
 
         wb1.set_cell_contents('Sheet2', 'A1', '=INDIRECT(B1)')
         wb1.move_cells('Sheet2', 'A1', 'A1', 'ZZZZ1')
-        contents = wb1.get_cell_contents('Sheet2', 'ZZZZ1')
-        value = wb1.get_cell_value('Sheet2', 'ZZZZ1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'ZZZZ1')
         assert contents == '=INDIRECT(#REF!)'
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.BAD_REFERENCE
+
+    def test_move_copy_large_area(self, set_cells: SetCells) -> None:
+        '''
+        Test moving and copying a large, mostly empty area of cells
+
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
+        '''
+
+        wb1 = Workbook()
+        wb1.new_sheet('Sheet1')
+        wb1.new_sheet('Sheet2')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '1',
+            'B2': '=A1 + 1',
+            'C3': '=$A$1 + B2'
+        }.items())
+        set_cells(wb1, 'Sheet2', {
+            'B2': 'overwritten',
+            'ZZ5000': 'cleared'
+        }.items())
+
+        wb1.copy_cells('Sheet1', 'A1', 'ZY9998', 'B2', 'Sheet2')
+        assert wb1.get_cell_contents_and_value('Sheet2', 'B2') == \
+            ('1', D1)
+        assert wb1.get_cell_contents_and_value('Sheet2', 'C3') == \
+            ('=B2 + 1', D2)
+        assert wb1.get_cell_contents_and_value('Sheet2', 'D4') == \
+            ('=$A$1 + C3', D2)
+        assert wb1.get_cell_contents_and_value('Sheet2', 'ZZ5000') == \
+            (None, None)
+        assert wb1.get_sheet_extent('Sheet2') == (4, 4)
+
+        wb1.move_cells('Sheet1', 'A1', 'ZZ9999', 'A1')
+        assert wb1.get_cell_contents_and_value('Sheet1', 'C3') == \
+            ('=$A$1 + B2', D3)
+
+        wb1.move_cells('Sheet1', 'ZZ9999', 'A1', 'B1')
+        assert wb1.get_cell_contents_and_value('Sheet1', 'A1') == (None, None)
+        assert wb1.get_cell_contents_and_value('Sheet1', 'B1') == \
+            ('1', D1)
+        assert wb1.get_cell_contents_and_value('Sheet1', 'C2') == \
+            ('=B1 + 1', D2)
+        assert wb1.get_cell_contents_and_value('Sheet1', 'D3') == \
+            ('=$A$1 + C2', D2)
+        assert wb1.get_sheet_extent('Sheet1') == (4, 3)
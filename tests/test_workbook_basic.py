@@ -4,6 +4,15 @@ Test Workbook
 Tests the Workbook module found at ../sheets/workbook.py with more complex
 operations.  Tests for basic operations can be found at test_workbook.py
 
+Global Variables:
+- D_NEG1, D0, D0_1, D1, D2, D3, D4, D5_3, D6, D7, D8, D9, D15, D23, D24, D651_9
+  (Decimal) - shared Decimal constants for expected numbers
+- SAVED_WORKBOOKS (List[Dict[str, Any]]) - expected JSON objects of the
+    workbooks saved in test_save_workbook
+
+Methods:
+- record_changes() -> Tuple[List[List[Tuple[str, str]]], Callable]
+
 Classes:
 - TestWorkbook
 
@@ -14,32 +23,117 @@ Classes:
     - test_del_sheet(object) -> None
     - test_set_and_extent(object) -> None
     - test_get_contents_and_value(object) -> None
-    - test_load_workbook(object) -> None
+    - test_load_workbook(object, Dict[str, str]) -> None
+    - test_load_workbook_errors(object, Dict[str, str], str, Type[Exception])
+        -> None
     - test_save_workbook(object) -> None
     - test_mutate_returned_attributes(object) -> None
     - test_notify_cell(object) -> None
+    - test_notify_move_cells(object, SetCells) -> None
+    - test_notify_del_sheet(object) -> None
+    - test_notify_get_value(object) -> None
+    - test_notify_error(object, SetCells) -> None
+    - test_defer_recompute(object) -> None
+    - test_condition_and_range_updates(object, SetupBlock) -> None
+    - test_set_cell_contents_bulk(object) -> None
+    - test_bulk_condition_and_range_updates(object, SetCells) -> None
     - test_rename_sheet(object) -> None
     - test_move_sheet(object) -> None
     - test_copy_sheet(object) -> None
-    - test_rename_sheet_update(object) -> None
+    - test_rename_sheet_update(object, SetupBlock) -> None
     - test_indirect_with_refs(object) -> None
     - test_indirect_with_refs2(object) -> None
-    - test_conditionals_with_refs(object) -> None
+    - test_conditionals_with_refs(object, SetCells) -> None
+    - test_sort_area(object, SetCells) -> None
+    - test_sort_area2(object, SetCells) -> None
 
 '''
 
 
 from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple, Type
 import io
 import json
 
 # pylint: disable=unused-import, import-error
 import context
+from conftest import SetCells, SetupBlock
 import pytest
 from sheets.workbook import Workbook
 from sheets.cell_error import CellError, CellErrorType
 
 
+# expected numbers are shared Decimal constants named after their value,
+# with D_NEG for negatives and _ for the decimal point
+D_NEG1 = Decimal('-1')
+D0 = Decimal('0')
+D0_1 = Decimal('0.1')
+D1 = Decimal('1')
+D2 = Decimal('2')
+D3 = Decimal('3')
+D4 = Decimal('4')
+D5_3 = Decimal('5.3')
+D6 = Decimal('6')
+D7 = Decimal('7')
+D8 = Decimal('8')
+D9 = Decimal('9')
+D15 = Decimal('15')
+D23 = Decimal('23')
+D24 = Decimal('24')
+D651_9 = Decimal('651.9')
+
+SAVED_WORKBOOKS: List[Dict[str, Any]] = [
+    {
+        'sheets':[
+            {
+                'name':'Sheet1',
+                'cell-contents':{
+                    'A1':'1'
+                }
+            },
+            {
+                'name':'Sheet2',
+                'cell-contents':{
+                    'B2':'2'
+                }
+            }
+        ]
+    },
+    {
+        'sheets':[
+            {
+                'name':'Sheet1',
+                'cell-contents':{
+                    'A1':'1'
+                }
+            },
+            {
+                'name':'Sheet2',
+                'cell-contents':{
+                    'B2':'=Sheet1!A1'
+                }
+            }
+        ]
+    }
+]
+
+
+def record_changes() -> Tuple[List[List[Tuple[str, str]]], Callable]:
+    '''
+    Make a cell notification function that records its own changes
+
+    Returns:
+    - list of the changed cells passed to each notification
+    - notification function to register with a workbook
+
+    '''
+
+    changes = []
+    def on_cells_changed(_, changed_cells):
+        changes.append(changed_cells)
+    return changes, on_cells_changed
+
+
 class TestWorkbook:
     ''' 
     Workbook tests
@@ -203,11 +297,18 @@ class TestWorkbook:
         with pytest.raises(KeyError):
             wb1.get_cell_contents('July Totals', 'A1')
 
+        with pytest.raises(KeyError):
+            wb1.get_cell_contents_and_value('July Totals', 'A1')
+
+        with pytest.raises(ValueError):
+            wb1.get_cell_contents_and_value(name, 'A0')
+
         # empty cells
         contents = wb1.get_cell_contents(name, 'ABC123')
         assert contents is None
         value = wb1.get_cell_value(name, 'ABC123')
         assert value is None
+        assert wb1.get_cell_contents_and_value(name, 'ABC123') == (None, None)
 
         # setting contents to None
         wb1.set_cell_contents(name, 'A1', None)
@@ -221,7 +322,7 @@ class TestWorkbook:
         contents = wb1.get_cell_contents(name, 'A1')
         assert contents == '8'
         value = wb1.get_cell_value(name, 'A1')
-        assert value == Decimal(8)
+        assert value == D8
 
         # string values
         wb1.set_cell_contents(name, 'A1', 'eight')
@@ -243,68 +344,55 @@ class TestWorkbook:
         contents = wb1.get_cell_contents(name, 'A1')
         assert contents == '=1+1'
         value = wb1.get_cell_value(name, 'A1')
-        assert value == Decimal(2)
+        assert value == D2
 
-    def test_load_workbook(self) -> None:
+    def test_load_workbook(self, json_data: Dict[str, str]) -> None:
         '''
         Test loading a workbook
 
+        Arguments:
+        - json_data: Dict[str, str] - the saved workbook text of each json
+            file in json_data
+
+        '''
+
+        wb1 = Workbook.load_workbook(io.StringIO(json_data['wb_data_valid.json']))
+        assert wb1.num_sheets() == 2
+        assert wb1.list_sheets() == ['Sheet1', 'Sheet2']
+        assert wb1.get_cell_contents_and_value('Sheet1', 'A1') == \
+            ('\'123', '123')
+        assert wb1.get_cell_contents_and_value('Sheet1', 'B1') == \
+            ('5.3', D5_3)
+        assert wb1.get_cell_contents_and_value('Sheet1', 'C1') == \
+            ('=A1*B1', D651_9)
+
+    @pytest.mark.parametrize('name, error', [
+        ('wb_data_invalid_dup.json', ValueError),
+        ('wb_data_missing_sheets.json', KeyError),
+        ('wb_data_missing_name.json', KeyError),
+        ('wb_data_missing_contents.json', KeyError),
+        ('wb_data_bad_type_sheets.json', TypeError),
+        ('wb_data_bad_type_sheet.json', TypeError),
+        ('wb_data_bad_type_name.json', TypeError),
+        ('wb_data_bad_type_contents.json', TypeError),
+        ('wb_data_bad_type_cell_contents.json', TypeError),
+        ('wb_data_bad_type_location.json', json.JSONDecodeError)
+    ])
+    def test_load_workbook_errors(self, json_data: Dict[str, str], name: str,
+                                  error: Type[Exception]) -> None:
         '''
+        Test loading an invalid workbook
 
-        with open('tests/json_data/wb_data_valid.json', encoding="utf8") as fp:
-            wb1 = Workbook.load_workbook(fp)
-            assert wb1.num_sheets() == 2
-            assert wb1.list_sheets() == ['Sheet1', 'Sheet2']
-            assert wb1.get_cell_contents('Sheet1', 'A1') == '\'123'
-            assert wb1.get_cell_contents('Sheet1', 'B1') == '5.3'
-            assert wb1.get_cell_contents('Sheet1', 'C1') == '=A1*B1'
-            assert wb1.get_cell_value('Sheet1', 'A1') == '123'
-            assert wb1.get_cell_value('Sheet1', 'B1') == Decimal('5.3')
-            assert wb1.get_cell_value('Sheet1', 'C1') == Decimal('651.9')
-
-        with open('tests/json_data/wb_data_invalid_dup.json',
-            encoding="utf8") as fp:
-            with pytest.raises(ValueError):
-                wb1 = Workbook.load_workbook(fp)
-
-        with open('tests/json_data/wb_data_missing_sheets.json',
-            encoding="utf8") as fp:
-            with pytest.raises(KeyError):
-                wb1 = Workbook.load_workbook(fp)
-        with open('tests/json_data/wb_data_missing_name.json',
-            encoding="utf8") as fp:
-            with pytest.raises(KeyError):
-                wb1 = Workbook.load_workbook(fp)
-        with open('tests/json_data/wb_data_missing_contents.json',
-            encoding="utf8") as fp:
-            with pytest.raises(KeyError):
-                wb1 = Workbook.load_workbook(fp)
-
-        with open('tests/json_data/wb_data_bad_type_sheets.json',
-            encoding="utf8") as fp:
-            with pytest.raises(TypeError):
-                wb1 = Workbook.load_workbook(fp)
-        with open('tests/json_data/wb_data_bad_type_sheet.json',
-            encoding="utf8") as fp:
-            with pytest.raises(TypeError):
-                wb1 = Workbook.load_workbook(fp)
-        with open('tests/json_data/wb_data_bad_type_name.json',
-            encoding="utf8") as fp:
-            with pytest.raises(TypeError):
-                wb1 = Workbook.load_workbook(fp)
-        with open('tests/json_data/wb_data_bad_type_contents.json',
-            encoding="utf8") as fp:
-            with pytest.raises(TypeError):
-                wb1 = Workbook.load_workbook(fp)
-        with open('tests/json_data/wb_data_bad_type_cell_contents.json',
-            encoding="utf8") as fp:
-            with pytest.raises(TypeError):
-                wb1 = Workbook.load_workbook(fp)
-
-        with open('tests/json_data/wb_data_bad_type_location.json',
-            encoding="utf8") as fp:
-            with pytest.raises(json.JSONDecodeError):
-                wb1 = Workbook.load_workbook(fp)
+        Arguments:
+        - json_data: Dict[str, str] - the saved workbook text of each json
+            file in json_data
+        - name: str - name of the invalid json file
+        - error: Type[Exception] - the error loading it should raise
+
+        '''
+
+        with pytest.raises(error):
+            Workbook.load_workbook(io.StringIO(json_data[name]))
 
     def test_save_workbook(self) -> None:
         '''
@@ -319,25 +407,8 @@ class TestWorkbook:
             wb1.set_cell_contents('Sheet1', 'A1', '1')
             wb1.set_cell_contents('Sheet2', 'B2', '2')
             wb1.save_workbook(fp)
-            fp.seek(0)
-            json_act = json.load(fp)
-            json_exp = {
-                'sheets':[
-                    {
-                        'name':'Sheet1',
-                        'cell-contents':{
-                            'A1':'1'
-                        }
-                    },
-                    {
-                        'name':'Sheet2',
-                        'cell-contents':{
-                            'B2':'2'
-                        }
-                    }
-                ]
-            }
-            assert json_act == json_exp
+            json_act = json.loads(fp.getvalue())
+            assert json_act == SAVED_WORKBOOKS[0]
 
         with io.StringIO('') as fp:
             wb1 = Workbook()
@@ -346,25 +417,9 @@ class TestWorkbook:
             wb1.new_sheet('Sheet2')
             wb1.set_cell_contents('Sheet2', 'B2', '=Sheet1!A1')
             wb1.save_workbook(fp)
-            fp.seek(0)
-            json_act = json.load(fp)
-            json_exp = {
-                'sheets':[
-                    {
-                        'name':'Sheet1',
-                        'cell-contents':{
-                            'A1':'1'
-                        }
-                    },
-                    {
-                        'name':'Sheet2',
-                        'cell-contents':{
-                            'B2':'=Sheet1!A1'
-                        }
-                    }
-                ]
-            }
-            assert json_act == json_exp
+            json_act = json.loads(fp.getvalue())
+            assert json_act == SAVED_WORKBOOKS[1]
+            assert wb1.to_dict() == SAVED_WORKBOOKS[1]
 
     def test_mutate_returned_attributes(self) -> None:
         '''
@@ -381,7 +436,8 @@ class TestWorkbook:
         assert sheet_names == ['Sheet1', 'Sheet2']
 
         sheet_objects = wb1.get_sheet_objects()
-        del sheet_objects['sheet1']
+        with pytest.raises(TypeError):
+            del sheet_objects['sheet1']
         new_sheet_objects = wb1.get_sheet_objects()
         assert new_sheet_objects['sheet1'] is not None
 
@@ -390,14 +446,7 @@ class TestWorkbook:
         Test cell notifications
         '''
 
-        test_changed = []
-        def on_cells_changed(_, changed_cells):
-            '''
-            This function gets called when cells change in the workbook that the
-            function was registered on.  The changed_cells argument is an iterable
-            of tuples; each tuple is of the form (sheet_name, cell_location).
-            '''
-            test_changed.append(changed_cells)
+        test_changed, on_cells_changed = record_changes()
         wb1 = Workbook()
         wb1.notify_cells_changed(on_cells_changed)
         wb1.new_sheet('Sheet1')
@@ -415,37 +464,84 @@ class TestWorkbook:
         assert test_changed[-1] == [('Sheet1', 'D2')]
         wb1.set_cell_contents('Sheet1', 'D3', '0')
         assert test_changed[-1] == [('Sheet1', 'D3')]
+
+    def test_notify_move_cells(self, set_cells: SetCells) -> None:
+        '''
+        Test cell notifications when moving and clearing cells
+
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
+        '''
+
+        test_changed, on_cells_changed = record_changes()
+        wb1 = Workbook()
+        wb1.new_sheet('Sheet1')
+        set_cells(wb1, 'Sheet1', {'A1': '\'123', 'B1': '5.3',
+            'C1': '=A1+B1', 'D1': '1', 'D2': '1', 'D3': '0'}.items())
+        wb1.notify_cells_changed(on_cells_changed)
         wb1.move_cells('Sheet1', 'C1', 'D3', 'C2')
         assert set(test_changed[-1]) == set([('Sheet1', 'C1'), ('Sheet1', 'C2'),
                         ('Sheet1', 'D1'), ('Sheet1', 'D3'), ('Sheet1', 'D4')])
         wb1.set_cell_contents('Sheet1', 'C2', None)
         assert test_changed[-1] == [('Sheet1', 'C2')]
+
+    def test_notify_del_sheet(self) -> None:
+        '''
+        Test cell notifications when deleting a sheet
+        '''
+
+        test_changed, on_cells_changed = record_changes()
+        wb1 = Workbook()
+        wb1.new_sheet('Sheet1')
+        wb1.set_cell_contents('Sheet1', 'A1', '1')
+        wb1.notify_cells_changed(on_cells_changed)
         wb1.del_sheet('Sheet1')
         assert test_changed[-1] == []
+
+    def test_notify_get_value(self) -> None:
+        '''
+        Test reading cell values from inside a notification
+        '''
+
+        test_changed, on_cells_changed = record_changes()
+        test_values = []
         def on_cells_changed2(workbook, changed_cells):
             '''
             This function gets called when cells change in the workbook that the
             function was registered on.  The changed_cells argument is an iterable
             of tuples; each tuple is of the form (sheet_name, cell_location).
             '''
-            test_changed.append([workbook.get_cell_value(sheet, cell) for
+            test_values.append([workbook.get_cell_value(sheet, cell) for
                 sheet, cell in changed_cells])
+        wb1 = Workbook()
         wb1.new_sheet('Test')
+        wb1.notify_cells_changed(on_cells_changed)
         wb1.notify_cells_changed(on_cells_changed2)
         wb1.set_cell_contents('Test', 'A1', '1')
-        assert test_changed[-2] == [('Test', 'A1')]
-        assert test_changed[-1] == [Decimal(1)]
+        assert test_changed[-1] == [('Test', 'A1')]
+        assert test_values[-1] == [D1]
         wb1.set_cell_contents('Test', 'B1', '=A1')
-        assert test_changed[-2] == [('Test', 'B1')]
-        assert test_changed[-1] == [Decimal(1)]
+        assert test_changed[-1] == [('Test', 'B1')]
+        assert test_values[-1] == [D1]
         wb1.set_cell_contents('Test', 'C1', '=A1+B1')
-        assert test_changed[-2] == [('Test', 'C1')]
-        assert test_changed[-1] == [Decimal(2)]
+        assert test_changed[-1] == [('Test', 'C1')]
+        assert test_values[-1] == [D2]
         wb1.set_cell_contents('Test', 'A1', '2')
-        assert set(test_changed[-2]) == set([('Test', 'A1'), ('Test', 'B1'),
+        assert set(test_changed[-1]) == set([('Test', 'A1'), ('Test', 'B1'),
                                             ('Test', 'C1')])
-        assert set(test_changed[-1]) == set([Decimal(2), Decimal(2),
-                                            Decimal(4)])
+        assert set(test_values[-1]) == set([D2, D2,
+                                            D4])
+
+    def test_notify_error(self, set_cells: SetCells) -> None:
+        '''
+        Test that a raising notification does not stop the others
+
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
+        '''
+
         def on_cells_changed3(workbook, changed_cells):
             '''
             This function gets called when cells change in the workbook that the
@@ -453,10 +549,151 @@ class TestWorkbook:
             of tuples; each tuple is of the form (sheet_name, cell_location).
             '''
             raise ValueError('Whaaaat were raising a random error')
+        test_changed, on_cells_changed = record_changes()
+        test_changed2, on_cells_changed2 = record_changes()
+        wb1 = Workbook()
+        wb1.new_sheet('Test')
+        set_cells(wb1, 'Test', {'A1': '2', 'B1': '=A1',
+            'C1': '=A1+B1'}.items())
+        wb1.notify_cells_changed(on_cells_changed)
         wb1.notify_cells_changed(on_cells_changed3)
+        wb1.notify_cells_changed(on_cells_changed2)
         wb1.set_cell_contents('Test', 'C1', '4')
-        assert test_changed[-2] == []
         assert test_changed[-1] == []
+        assert test_changed2[-1] == []
+        wb1.set_cell_contents('Test', 'A1', '3')
+        assert set(test_changed[-1]) == set([('Test', 'A1'), ('Test', 'B1')])
+        assert set(test_changed2[-1]) == set([('Test', 'A1'), ('Test', 'B1')])
+
+    def test_defer_recompute(self) -> None:
+        '''
+        Test deferring dependent cell updates to the end of a block
+        '''
+
+        test_changed = []
+        wb1 = Workbook()
+        wb1.new_sheet('Sheet1')
+        wb1.set_cell_contents('Sheet1', 'A1', '1')
+        wb1.set_cell_contents('Sheet1', 'B1', '=A1+1')
+        wb1.notify_cells_changed(lambda _, cells: test_changed.append(cells))
+
+        with wb1.defer_recompute():
+            wb1.set_cell_contents('Sheet1', 'A1', '2')
+            wb1.set_cell_contents('Sheet1', 'C1', '=B1*D1')
+            wb1.set_cell_contents('Sheet1', 'D1', '3')
+            with wb1.defer_recompute():
+                wb1.set_cell_contents('Sheet1', 'E1', '=E2')
+                wb1.set_cell_contents('Sheet1', 'E2', '=E1')
+            assert not test_changed
+            assert wb1.get_cell_value('Sheet1', 'B1') == D2
+
+        assert len(test_changed) == 1
+        assert set(test_changed[-1]) == set([('Sheet1', 'A1'), ('Sheet1', 'B1'),
+            ('Sheet1', 'C1'), ('Sheet1', 'D1'), ('Sheet1', 'E1'), ('Sheet1', 'E2')])
+        assert wb1.get_cell_value('Sheet1', 'B1') == D3
+        assert wb1.get_cell_value('Sheet1', 'C1') == D9
+        assert wb1.get_cell_value('Sheet1', 'E1').get_type() == \
+            CellErrorType.CIRCULAR_REFERENCE
+
+        wb1.set_cell_contents('Sheet1', 'A1', '0')
+        assert len(test_changed) == 2
+        assert wb1.get_cell_value('Sheet1', 'C1') == D3
+
+        # closing a cycle without changing any value is still detected
+        wb1.set_cell_contents('Sheet1', 'F1', '5')
+        wb1.set_cell_contents('Sheet1', 'G1', '=F1')
+        with wb1.defer_recompute():
+            wb1.set_cell_contents('Sheet1', 'F1', '=G1')
+        for loc in ['F1', 'G1']:
+            assert wb1.get_cell_value('Sheet1', loc).get_type() == \
+                CellErrorType.CIRCULAR_REFERENCE
+
+    def test_condition_and_range_updates(self, setup_block: SetupBlock) -> None:
+        '''
+        Test that cells depending on an IF condition, a CHOOSE index or a
+        cell range are updated, whether or not their updates are deferred
+
+        Arguments:
+        - setup_block: SetupBlock - gives the block the cells are set in
+
+        '''
+
+        wb1 = Workbook()
+        wb1.new_sheet('Sheet1')
+        with setup_block(wb1):
+            wb1.set_cell_contents('Sheet1', 'A1', '=IF(B1, 1, 2)')
+            wb1.set_cell_contents('Sheet1', 'A2', '=CHOOSE(B2, 3, 4)')
+            wb1.set_cell_contents('Sheet1', 'A3', '=SUM(B2:C3)')
+            wb1.set_cell_contents('Sheet1', 'B1', 'TRUE')
+            wb1.set_cell_contents('Sheet1', 'B2', '2')
+            wb1.set_cell_contents('Sheet1', 'C3', '5')
+        assert [wb1.get_cell_value('Sheet1', loc) for loc in ['A1', 'A2', 'A3']] == \
+            [D1, D4, D7]
+
+        with setup_block(wb1):
+            wb1.set_cell_contents('Sheet1', 'B1', 'FALSE')
+            wb1.set_cell_contents('Sheet1', 'B2', '1')
+        assert [wb1.get_cell_value('Sheet1', loc) for loc in ['A1', 'A2', 'A3']] == \
+            [D2, D3, D6]
+
+        # a range over the cell itself is a cycle
+        with setup_block(wb1):
+            wb1.set_cell_contents('Sheet1', 'C1', '=SUM(C1:C2)')
+        assert wb1.get_cell_value('Sheet1', 'C1').get_type() == \
+            CellErrorType.CIRCULAR_REFERENCE
+
+    def test_set_cell_contents_bulk(self) -> None:
+        '''
+        Test setting several cells with a single update of their dependents
+        '''
+
+        test_changed = []
+        wb1 = Workbook()
+        wb1.new_sheet('Sheet1')
+        wb1.set_cell_contents('Sheet1', 'C1', '=A1+B1')
+        wb1.notify_cells_changed(lambda _, cells: test_changed.append(cells))
+
+        wb1.set_cell_contents_bulk('Sheet1', [('A1', '1'), ('b1', '=A1*2'),
+                                              ('D1', None)])
+        assert len(test_changed) == 1
+        assert set(test_changed[-1]) == set([('Sheet1', 'A1'), ('Sheet1', 'B1'),
+                                            ('Sheet1', 'C1')])
+        assert wb1.get_cell_contents('Sheet1', 'B1') == '=A1*2'
+        assert wb1.get_cell_value('Sheet1', 'C1') == D3
+
+        with pytest.raises(KeyError):
+            wb1.set_cell_contents_bulk('Sheet2', [('A1', '1')])
+        with pytest.raises(ValueError):
+            wb1.set_cell_contents_bulk('Sheet1', [('A1', '5'), ('A0', '1')])
+        assert wb1.get_cell_value('Sheet1', 'C1') == D15
+
+        # a bulk update that closes a cycle without changing a value
+        wb1.set_cell_contents_bulk('Sheet1', [('E1', '5'), ('F1', '=E1')])
+        wb1.set_cell_contents_bulk('Sheet1', [('E1', '=F1')])
+        for loc in ['E1', 'F1']:
+            assert wb1.get_cell_value('Sheet1', loc).get_type() == \
+                CellErrorType.CIRCULAR_REFERENCE
+
+    def test_bulk_condition_and_range_updates(self, set_cells: SetCells) -> None:
+        '''
+        Test that setting cells in bulk or one at a time gives the same values
+        for cells depending on an IF condition or a cell range
+
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
+        '''
+
+        wb1 = Workbook()
+        wb1.new_sheet('Sheet1')
+        set_cells(wb1, 'Sheet1', [('A1', '=IF(B1, 1, 2)'), ('B1', 'TRUE'),
+                                  ('A2', '=MAX(B2:C3)'), ('C3', '4'), ('B2', '=C3*2')])
+        assert wb1.get_cell_value('Sheet1', 'A1') == D1
+        assert wb1.get_cell_value('Sheet1', 'A2') == D8
+
+        set_cells(wb1, 'Sheet1', [('B1', 'FALSE'), ('C3', '-1')])
+        assert wb1.get_cell_value('Sheet1', 'A1') == D2
+        assert wb1.get_cell_value('Sheet1', 'A2') == D_NEG1
 
     def test_rename_sheet(self) -> None:
         '''
@@ -476,9 +713,9 @@ class TestWorkbook:
         with pytest.raises(KeyError):
             assert not sheet_objects['sheet1']
         value = wb1.get_cell_value('Sheet2', 'A1')
-        assert value == Decimal(2)
+        assert value == D2
         value = wb1.get_cell_value('Sheet2','A2')
-        assert value == Decimal(2)
+        assert value == D2
 
         wb1.new_sheet('Sheet3')
         wb1.rename_sheet('Sheet2', 'Sheet4')
@@ -490,7 +727,7 @@ class TestWorkbook:
         with pytest.raises(KeyError):
             assert not new_sheet_objects['sheet2']
         value = wb1.get_cell_value('Sheet4', 'A1')
-        assert value == Decimal(2)
+        assert value == D2
 
     def test_move_sheet(self) -> None:
         '''
@@ -531,22 +768,22 @@ class TestWorkbook:
         assert wb1.list_sheets() == ['Sheet1', 'Sheet1_1', 'Sheet1_2',
             'Sheet1_2_1']
 
-        assert wb1.get_cell_value('Sheet1', 'A1') == Decimal('1')
-        assert wb1.get_cell_value('Sheet1_1', 'A1') == Decimal('1')
-        assert wb1.get_cell_value('Sheet1_2', 'A1') == Decimal('1')
-        assert wb1.get_cell_value('Sheet1_2_1', 'A1') == Decimal('1')
+        assert wb1.get_cell_value('Sheet1', 'A1') == D1
+        assert wb1.get_cell_value('Sheet1_1', 'A1') == D1
+        assert wb1.get_cell_value('Sheet1_2', 'A1') == D1
+        assert wb1.get_cell_value('Sheet1_2_1', 'A1') == D1
 
         wb1.set_cell_contents('Sheet1', 'A1', '=2')
-        assert wb1.get_cell_value('Sheet1', 'A1') == Decimal('2')
-        assert wb1.get_cell_value('Sheet1_1', 'A1') == Decimal('1')
-        assert wb1.get_cell_value('Sheet1_2', 'A1') == Decimal('1')
-        assert wb1.get_cell_value('Sheet1_2_1', 'A1') == Decimal('1')
+        assert wb1.get_cell_value('Sheet1', 'A1') == D2
+        assert wb1.get_cell_value('Sheet1_1', 'A1') == D1
+        assert wb1.get_cell_value('Sheet1_2', 'A1') == D1
+        assert wb1.get_cell_value('Sheet1_2_1', 'A1') == D1
 
         wb1.set_cell_contents('Sheet1_2', 'A1', '=3')
-        assert wb1.get_cell_value('Sheet1', 'A1') == Decimal('2')
-        assert wb1.get_cell_value('Sheet1_1', 'A1') == Decimal('1')
-        assert wb1.get_cell_value('Sheet1_2', 'A1') == Decimal('3')
-        assert wb1.get_cell_value('Sheet1_2_1', 'A1') == Decimal('1')
+        assert wb1.get_cell_value('Sheet1', 'A1') == D2
+        assert wb1.get_cell_value('Sheet1_1', 'A1') == D1
+        assert wb1.get_cell_value('Sheet1_2', 'A1') == D3
+        assert wb1.get_cell_value('Sheet1_2_1', 'A1') == D1
 
         wb1.new_sheet('Sheet2')
         wb1.new_sheet('Sheet3')
@@ -559,14 +796,13 @@ class TestWorkbook:
         assert wb1.list_sheets() == ['Sheet1', 'Sheet1_1', 'Sheet1_2',
             'Sheet1_2_1', 'Sheet2', 'Sheet3', 'Sheet2_1', 'Sheet3_1',
             'Sheet2_2']
-        assert wb1.get_cell_value('Sheet2_1', 'B2') == Decimal('2')
-        assert wb1.get_cell_value('Sheet3_1', 'B2') == Decimal('4')
+        assert wb1.get_cell_value('Sheet2_1', 'B2') == D2
+        assert wb1.get_cell_value('Sheet3_1', 'B2') == D4
 
         wb1.new_sheet('Sheet4')
         wb1.set_cell_contents('Sheet4', 'D4', '=#CIRCREF!')
         wb1.copy_sheet('Sheet4')
-        contents = wb1.get_cell_contents('Sheet4_1', 'D4')
-        value = wb1.get_cell_value('Sheet4_1', 'D4')
+        contents, value = wb1.get_cell_contents_and_value('Sheet4_1', 'D4')
         assert contents == '=#CIRCREF!'
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.CIRCULAR_REFERENCE
@@ -576,10 +812,13 @@ class TestWorkbook:
         (_, name) = wb1.copy_sheet('Sheet4')
         assert name == 'Sheet4_3'
 
-    def test_rename_sheet_update(self) -> None:
+    def test_rename_sheet_update(self, setup_block: SetupBlock) -> None:
         '''
         Test updating simple references on sheet rename
 
+        Arguments:
+        - setup_block: SetupBlock - gives the block the cells are set in
+
         '''
 
         wb1 = Workbook()
@@ -588,51 +827,45 @@ class TestWorkbook:
         wb1.set_cell_contents('Sheet1', 'A1', '=2')
         wb1.set_cell_contents('Sheet2', 'A1', '=Sheet1!A1')
         wb1.rename_sheet('Sheet1', 'Sheet3')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents == '=Sheet3!A1'
-        assert value == Decimal(2)
+        assert value == D2
 
-        wb1.set_cell_contents('Sheet3', 'A2', '=3')
-        wb1.set_cell_contents('Sheet3', 'A3', '=4')
-        wb1.set_cell_contents('Sheet2', 'A2', '=Sheet3!A2')
-        wb1.set_cell_contents('Sheet2', 'A3', '=Sheet3!A3')
+        with setup_block(wb1):
+            wb1.set_cell_contents('Sheet3', 'A2', '=3')
+            wb1.set_cell_contents('Sheet3', 'A3', '=4')
+            wb1.set_cell_contents('Sheet2', 'A2', '=Sheet3!A2')
+            wb1.set_cell_contents('Sheet2', 'A3', '=Sheet3!A3')
         wb1.rename_sheet('Sheet3', 'Sheet4')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents == '=Sheet4!A1'
-        assert value == Decimal(2)
-        contents = wb1.get_cell_contents('Sheet2', 'A2')
-        value = wb1.get_cell_value('Sheet2', 'A2')
+        assert value == D2
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A2')
         assert contents == '=Sheet4!A2'
-        assert value == Decimal(3)
-        contents = wb1.get_cell_contents('Sheet2', 'A3')
-        value = wb1.get_cell_value('Sheet2', 'A3')
+        assert value == D3
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A3')
         assert contents == '=Sheet4!A3'
-        assert value == Decimal(4)
+        assert value == D4
 
         wb1.new_sheet('Sheet5')
         wb1.set_cell_contents('Sheet5', 'A1', '=Sheet2!A2 + Sheet2!A3')
         wb1.set_cell_contents('Sheet5', 'A2', '=Sheet2!A2 + Sheet4!A3')
         wb1.rename_sheet('Sheet2', 'Sheet6')
         wb1.rename_sheet('Sheet4', 'Sheet7')
-        contents = wb1.get_cell_contents('Sheet5', 'A1')
-        value = wb1.get_cell_value('Sheet5', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet5', 'A1')
         assert contents == '=Sheet6!A2 + Sheet6!A3'
-        assert value == Decimal(7)
-        contents = wb1.get_cell_contents('Sheet5', 'A2')
-        value = wb1.get_cell_value('Sheet5', 'A2')
+        assert value == D7
+        contents, value = wb1.get_cell_contents_and_value('Sheet5', 'A2')
         assert contents == '=Sheet6!A2 + Sheet7!A3'
-        assert value == Decimal(7)
+        assert value == D7
 
         wb1.new_sheet('A Sheet')
         wb1.set_cell_contents('A Sheet', 'A1', '=0.1')
         wb1.set_cell_contents('Sheet5', 'A1', '=\'A Sheet\'!A1')
         wb1.rename_sheet('A Sheet', 'Darth Jar Jar')
-        contents = wb1.get_cell_contents('Sheet5', 'A1')
-        value = wb1.get_cell_value('Sheet5', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet5', 'A1')
         assert contents == '=\'Darth Jar Jar\'!A1'
-        assert value == Decimal('0.1')
+        assert value == D0_1
 
     def test_indirect_with_refs(self) -> None:
         '''
@@ -646,28 +879,24 @@ class TestWorkbook:
         wb1.set_cell_contents('Sheet1', 'A1', '=1')
         wb1.set_cell_contents('Sheet1', 'A2', '=INDIRECT(Sheet1!A1)')
         wb1.move_cells('Sheet1', 'A1', 'A2', 'B1')
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '=INDIRECT(Sheet1!B1)'
-        assert value == Decimal('1')
+        assert value == D1
 
         wb1.set_cell_contents('Sheet1', 'B2', '=INDIRECT(Sheet1!$B1)')
         wb1.copy_cells('Sheet1', 'B1', 'B2', 'C1')
-        contents = wb1.get_cell_contents('Sheet1', 'C2')
-        value = wb1.get_cell_value('Sheet1', 'C2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'C2')
         assert contents == '=INDIRECT(Sheet1!$B1)'
-        assert value == Decimal('1')
+        assert value == D1
 
         wb1.copy_cells('Sheet1', 'C2', 'C2', 'D3')
-        contents = wb1.get_cell_contents('Sheet1', 'D3')
-        value = wb1.get_cell_value('Sheet1', 'D3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'D3')
         assert contents == '=INDIRECT(Sheet1!$B2)'
-        assert value == Decimal('1')
+        assert value == D1
 
         wb1.set_cell_contents('Sheet1', 'B1', '=D2')
         wb1.copy_cells('Sheet1', 'C2', 'C2', 'D2')
-        contents = wb1.get_cell_contents('Sheet1', 'D2')
-        value = wb1.get_cell_value('Sheet1', 'D2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'D2')
         assert contents == '=INDIRECT(Sheet1!$B1)'
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.CIRCULAR_REFERENCE
@@ -675,28 +904,25 @@ class TestWorkbook:
         wb1.set_cell_contents('Sheet1', 'DT1', '=1')
         wb1.set_cell_contents('Sheet1', 'BJ1', '=INDIRECT("DT1")')
         wb1.copy_cells('Sheet1', 'BJ1', 'DT1', 'KM1')
-        contents = wb1.get_cell_contents('Sheet1', 'KM1')
-        value = wb1.get_cell_value('Sheet1', 'KM1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'KM1')
         assert contents == '=INDIRECT("DT1")'
-        assert value == Decimal(1)
+        assert value == D1
 
         wb1.set_cell_contents('Sheet1', 'KT1', '=INDIRECT("Sheet1!DT1")')
         wb1.copy_cells('Sheet1', 'KT1', 'KT1', 'DL1')
-        contents = wb1.get_cell_contents('Sheet1', 'DL1')
-        value = wb1.get_cell_value('Sheet1', 'DL1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'DL1')
         assert contents == '=INDIRECT("Sheet1!DT1")'
-        assert value == Decimal(1)
+        assert value == D1
 
         wb1.set_cell_contents('Sheet1', 'F1', '=23')
         wb1.set_cell_contents('Sheet1', 'F2', '=INDIRECT(F1)')
-        contents = wb1.get_cell_contents('Sheet1', 'F2')
-        value = wb1.get_cell_value('Sheet1', 'F2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'F2')
         assert contents == '=INDIRECT(F1)'
-        assert value == Decimal('23')
+        assert value == D23
 
         wb1.set_cell_contents('Sheet1', 'F1', '=24')
         value = wb1.get_cell_value('Sheet1', 'F2')
-        assert value == Decimal('24')
+        assert value == D24
 
     def test_indirect_with_refs2(self) -> None:
         '''
@@ -710,114 +936,119 @@ class TestWorkbook:
         wb1.new_sheet('Sheet2')
         wb1.set_cell_contents('Sheet2', 'F1', '="uwu"')
         wb1.set_cell_contents('Sheet1', 'F2', '=INDIRECT(Sheet2!F1)')
-        contents = wb1.get_cell_contents('Sheet1', 'F2')
-        value = wb1.get_cell_value('Sheet1', 'F2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'F2')
         assert contents == '=INDIRECT(Sheet2!F1)'
         assert value == 'uwu'
 
         wb1.set_cell_contents('Sheet1', 'F2', '=INDIRECT("Sheet2!F1")')
-        contents = wb1.get_cell_contents('Sheet1', 'F2')
-        value = wb1.get_cell_value('Sheet1', 'F2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'F2')
         assert contents == '=INDIRECT("Sheet2!F1")'
         assert value == 'uwu'
 
         wb1.set_cell_contents('Sheet1', 'HC1', '=INDIRECT("A" & 1)')
-        contents = wb1.get_cell_contents('Sheet1', 'HC1')
-        value = wb1.get_cell_value('Sheet1', 'HC1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'HC1')
         assert contents == '=INDIRECT("A" & 1)'
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.BAD_REFERENCE
 
         wb1.set_cell_contents('Sheet1', 'JF1', '=INDIRECT("SheET2!"&"F"&1)')
-        contents = wb1.get_cell_contents('Sheet1', 'JF1')
-        value = wb1.get_cell_value('Sheet1', 'JF1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'JF1')
         assert contents == '=INDIRECT("SheET2!"&"F"&1)'
         assert value == 'uwu'
 
         wb1.set_cell_contents('Sheet1', 'a1', '=a2')
         wb1.set_cell_contents('Sheet1', 'a2', '=INDIRECT("a1")')
-        contents = wb1.get_cell_contents('Sheet1', 'a2')
-        value = wb1.get_cell_value('Sheet1', 'a2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'a2')
         assert contents == '=INDIRECT("a1")'
         assert isinstance(value, CellError)
         assert value.get_type() == CellErrorType.CIRCULAR_REFERENCE
 
-    def test_conditionals_with_refs(self) -> None:
+    def test_conditionals_with_refs(self, set_cells: SetCells) -> None:
         '''
         Test moving/copying cells or dealing with cell references with 
         conditional func calls
 
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('Sheet1')
-        wb1.set_cell_contents('Sheet1', 'A1', '=1')
-        wb1.set_cell_contents('Sheet1', 'A2', '=2')
-        wb1.set_cell_contents('Sheet1', 'A3', '=IF(TRUE, Sheet1!A1, Sheet1!A2)')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '=1',
+            'A2': '=2',
+            'A3': '=IF(TRUE, Sheet1!A1, Sheet1!A2)'
+        }.items())
         wb1.move_cells('Sheet1', 'A1', 'A3', 'B1')
-        contents = wb1.get_cell_contents('Sheet1', 'B3')
-        value = wb1.get_cell_value('Sheet1', 'B3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B3')
         assert contents == '=IF(TRUE, Sheet1!B1, Sheet1!B2)'
-        assert value == Decimal('1')
+        assert value == D1
 
         wb1.set_cell_contents('Sheet1', 'A1', '=$A2+1')
         wb1.set_cell_contents('Sheet1', 'A2', '=IFERROR(A1+1, A3+1)')
         wb1.move_cells('Sheet1', 'A1', 'A2', 'B1')
-        contents = wb1.get_cell_contents('Sheet1', 'B2')
-        value = wb1.get_cell_value('Sheet1', 'B2')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B2')
         assert contents == '=IFERROR(B1 + 1, B3 + 1)'
-        assert value == Decimal('2')
+        assert value == D2
 
-        wb1.set_cell_contents('Sheet1', 'A1', '= 1')
-        wb1.set_cell_contents('Sheet1', 'A2', '=A3  +1')
-        wb1.set_cell_contents('Sheet1', 'A3', '=CHOOSE($A1+1, $A3+1, A2)')
+        set_cells(wb1, 'Sheet1', {
+            'A1': '= 1',
+            'A2': '=A3  +1',
+            'A3': '=CHOOSE($A1+1, $A3+1, A2)'
+        }.items())
         wb1.move_cells('Sheet1', 'A1', 'A3', 'B1')
-        contents = wb1.get_cell_contents('Sheet1', 'B3')
-        value = wb1.get_cell_value('Sheet1', 'B3')
+        contents, value = wb1.get_cell_contents_and_value('Sheet1', 'B3')
         assert contents == '=CHOOSE($A1 + 1, $A3 + 1, B2)'
-        assert value == Decimal('1')
+        assert value == D1
 
         wb1.new_sheet('Sheet2')
-        wb1.set_cell_contents('Sheet2', 'A1', '=AND(NOT(B1, B2))')
-        wb1.set_cell_contents('Sheet2', 'A2', '=XOR(A1, B2)')
-        wb1.set_cell_contents('Sheet2', 'B1', '=$C1')
+        set_cells(wb1, 'Sheet2', {
+            'A1': '=AND(NOT(B1, B2))',
+            'A2': '=XOR(A1, B2)',
+            'B1': '=$C1'
+        }.items())
         wb1.set_cell_contents('Sheet2', 'A3',
             '=IF(CHOOSE(IFERROR(C1) + 1, 1, 0), 1)')
         wb1.move_cells('Sheet2', 'A1', 'B3', 'B2')
-        contents = wb1.get_cell_contents('Sheet2', 'B4')
-        value = wb1.get_cell_value('Sheet2', 'B4')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'B4')
         assert contents == '=IF(CHOOSE(IFERROR(D2) + 1, 1, 0), 1)'
-        assert value == Decimal('1')
+        assert value == D1
 
         wb1.set_cell_contents('Sheet2', 'A1', '=2 * IFERROR(D2)')
-        contents = wb1.get_cell_contents('Sheet2', 'A1')
-        value = wb1.get_cell_value('Sheet2', 'A1')
+        contents, value = wb1.get_cell_contents_and_value('Sheet2', 'A1')
         assert contents == '=2 * IFERROR(D2)'
-        assert value == Decimal('0')
+        assert value == D0
 
-    def test_sort_area(self) -> None:
+    def test_sort_area(self, set_cells: SetCells) -> None:
         '''
         One test case to account for everything - todo
+
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('S')
-        wb1.set_cell_contents('S', 'A1', 'a')
-        wb1.set_cell_contents('S', 'A2', 's')
-        wb1.set_cell_contents('S', 'A3', 's')
-        wb1.set_cell_contents('S', 'A4', 'ben')
-        wb1.set_cell_contents('S', 'B1', '=200')
-        wb1.set_cell_contents('S', 'B2', '=-40')
-        wb1.set_cell_contents('S', 'B3', '1')
-        wb1.set_cell_contents('S', 'B4', '=1')
-        wb1.set_cell_contents('S', 'C1', 'True')
-        wb1.set_cell_contents('S', 'C2', '=True')
-        wb1.set_cell_contents('S', 'C4', '=FALSe')
-        wb1.set_cell_contents('S', 'D2', '=$e$2')
-        wb1.set_cell_contents('S', 'D3', '=e$1')
-        wb1.set_cell_contents('S', 'D4', '=e1')
-        wb1.set_cell_contents('S', 'E1', '=1')
-        wb1.set_cell_contents('S', 'E2', '=2')
+        set_cells(wb1, 'S', {
+            'A1': 'a',
+            'A2': 's',
+            'A3': 's',
+            'A4': 'ben',
+            'B1': '=200',
+            'B2': '=-40',
+            'B3': '1',
+            'B4': '=1',
+            'C1': 'True',
+            'C2': '=True',
+            'C4': '=FALSe',
+            'D2': '=$e$2',
+            'D3': '=e$1',
+            'D4': '=e1',
+            'E1': '=1',
+            'E2': '=2'
+        }.items())
 
         wb1.sort_region('S', 'A1', 'D4', [3, -1, -2])
 
@@ -845,27 +1076,28 @@ class TestWorkbook:
             }]
         }
 
-        with io.StringIO('') as fp:
-            wb1.save_workbook(fp)
-            fp.seek(0)
-            act = json.load(fp)
-            exp = json.loads(json.dumps(expected))
-            assert sorted(act.items()) == sorted(exp.items())
+        assert wb1.to_dict() == expected
 
-    def test_sort_area2(self) -> None:
+    def test_sort_area2(self, set_cells: SetCells) -> None:
         '''
         One test case to account for everything - todo
+
+        Arguments:
+        - set_cells: SetCells - sets several cells of a sheet for the setup
+
         '''
 
         wb1 = Workbook()
         wb1.new_sheet('S')
-        wb1.set_cell_contents('S', 'A1', '=A1A1')
-        wb1.set_cell_contents('S', 'A2', '=VERSION(1)')
-        wb1.set_cell_contents('S', 'A4', 'dallas')
-        wb1.set_cell_contents('S', 'A5', '1')
-        wb1.set_cell_contents('S', 'A6', '=OR(A7, True)')
-        wb1.set_cell_contents('S', 'A7', 'false')
-        wb1.set_cell_contents('S', 'A8', '=A1')
+        set_cells(wb1, 'S', {
+            'A1': '=A1A1',
+            'A2': '=VERSION(1)',
+            'A4': 'dallas',
+            'A5': '1',
+            'A6': '=OR(A7, True)',
+            'A7': 'false',
+            'A8': '=A1'
+        }.items())
 
         wb1.sort_region('S', 'A1', 'A7', [1])
 
@@ -884,12 +1116,7 @@ class TestWorkbook:
             }]
         }
 
-        with io.StringIO('') as fp:
-            wb1.save_workbook(fp)
-            fp.seek(0)
-            act = json.load(fp)
-            exp = json.loads(json.dumps(expected))
-            assert sorted(act.items()) == sorted(exp.items())
+        assert wb1.to_dict() == expected
 
         result = wb1.get_cell_value('S', 'A8')
-        assert result == Decimal('0')
+        assert result == D0